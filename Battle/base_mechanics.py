@@ -1,5 +1,6 @@
 import random
 from typing import Tuple, Dict, List, Any, Optional, Union
+from Battle.battle_context import messages_enabled
 from Battle.battle_logger import battle_logger
 
 # Для аннотаций типов избегаем циклических импортов
@@ -60,17 +61,22 @@ class GameMechanics:
         return random.random() < crit_chance
 
     @staticmethod
-    def check_dodge_with_message(attacker: 'Character', target: 'Character') -> Tuple[bool, Optional[List]]:
+    def check_dodge_with_message(attacker: 'Character', target: 'Character',
+                                 build_message: Optional[bool] = None) -> Tuple[bool, Optional[List]]:
         """
         Проверяет, удалось ли персонажу уклониться и генерирует сообщение.
         :param attacker: Атакующий персонаж
         :param target: Цель, которая пытается уклониться
+        :param build_message: Формировать ли сообщение (None - по контексту боя, в тихом режиме нет)
         :return: Кортеж (успешно_уклонился: bool, сообщение: list или None)
         """
         dodge_chance = GameMechanics.calculate_dodge_chance(target)
         dodge_success = random.random() < dodge_chance
+
+        if build_message is None:
+            build_message = messages_enabled()
         
-        if dodge_success:
+        if dodge_success and build_message:
             # Генерируем сообщение об уклонении
             icon = "🏃"
 
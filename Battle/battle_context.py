@@ -0,0 +1,84 @@
+# Battle/battle_context.py
+"""Контекст боя: параметры и режимы, с которыми идет текущая симуляция"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Dict, Iterator, Optional
+
+from Config.game_config import MAX_ROUNDS
+
+
+# ==================== Контекст боя ====================
+@dataclass
+class BattleContext:
+    """
+    Параметры текущего боя.
+
+    Позволяет запускать бои с другими настройками (массовые симуляции,
+    подбор баланса), не изменяя глобальные константы модулей.
+    """
+
+    # Константы Config/game_config.py, которые можно переопределить для боя
+    CONFIG_FIELDS = {
+        'MAX_ROUNDS': 'max_rounds',
+    }
+
+    max_rounds: int = MAX_ROUNDS
+    award_rewards: bool = True       # Начислять награды за победу
+    track_statistics: bool = True    # Вести статистику боя
+    quiet: bool = False              # Тихий режим: только числовые результаты, без сообщений для лога
+
+    def with_config(self, overrides: Dict[str, object]) -> 'BattleContext':
+        """
+        Возвращает копию контекста с переопределенными константами конфигурации.
+
+        :param overrides: Словарь {имя константы game_config: значение}
+        :return: Новый контекст
+        """
+        changes = {}
+        for name, value in overrides.items():
+            field_name = self.CONFIG_FIELDS.get(name)
+            if field_name is None:
+                raise KeyError(f"Константа '{name}' не может быть переопределена для боя")
+            changes[field_name] = value
+        return replace(self, **changes)
+
+
+# ==================== Текущий контекст ====================
+_default_context = BattleContext()
+_current_context: BattleContext = _default_context
+
+
+def get_battle_context() -> BattleContext:
+    """Удобная функция для получения контекста текущего боя"""
+    return _current_context
+
+
+def messages_enabled() -> bool:
+    """
+    Нужно ли формировать сообщения для лога.
+
+    В тихом режиме способности и механики возвращают только числовые
+    результаты: форматировать строки, которые никто не прочитает, незачем.
+    """
+    return not _current_context.quiet
+
+
+@contextmanager
+def use_battle_context(context: Optional[BattleContext]) -> Iterator[BattleContext]:
+    """
+    Делает контекст текущим на время блока with.
+
+    :param context: Контекст боя (None - оставить текущий)
+    """
+    global _current_context
+    if context is None:
+        yield _current_context
+        return
+
+    previous = _current_context
+    _current_context = context
+    try:
+        yield context
+    finally:
+        _current_context = previous
@@ -1,22 +1,112 @@
 # battle_logger.py - Централизованный логгер боя с паттерном Observer
 
+import threading
 import time
-from Config.curses_config import BATTLE_DELAY
+from collections import deque
+from contextlib import contextmanager
+from itertools import islice
+from Battle.battle_metrics import LOGGER_OBSERVERS, MESSAGE_DELAY, current_timing
+from Config.curses_config import BATTLE_DELAY, BATTLE_SPEED_LEVELS, ROUND_BATCH_SPEED
+from Config.game_config import LOG_SCROLLBACK_LINES
 
 class BattleLogger:
-    def __init__(self):
-        self.log_lines = []
-        self.max_lines = 100
+    def __init__(self, max_lines=LOG_SCROLLBACK_LINES):
+        self.max_lines = max_lines
+        self.log_lines = deque(maxlen=self.max_lines)  # Старые строки вытесняются сами
+        self.total_lines = 0  # Сколько строк записано за все время (номер следующей строки)
+        self.generation = 0  # Растет при очистке лога
         self.observers = []  # Список наблюдателей
-        self.message_delay = BATTLE_DELAY  # Задержка между сообщениями
+        self.message_delay = BATTLE_DELAY  # Задержка между сообщениями на скорости 1×
+        self.speed_level = 0  # Индекс в BATTLE_SPEED_LEVELS
+        self._pending_delay = 0.0  # Накопленная пауза раунда на высоких скоростях
+        self._skip_requested = False  # Бой досчитывается без пауз
+        self._no_delay = threading.local()  # Отключение пауз действует только в своем потоке
+        self._battle_thread = threading.local()  # Паузы выдерживает только поток, ведущий бой
+        self._lock = threading.Lock()  # Лог пишется из потока боя, читается из основного
     
     def set_message_delay(self, delay=BATTLE_DELAY):
         """Устанавливает задержку между сообщениями"""
         self.message_delay = max(0, delay)
     
     def get_message_delay(self):
-        """Возвращает текущую задержку"""
-        return self.message_delay
+        """
+        Возвращает текущую задержку (с учетом скорости боя и пропуска).
+        Вне потока, ведущего бой, задержки нет: сообщения интерфейса не ждут.
+        """
+        multiplier = self.get_speed_multiplier()
+        if (multiplier is None or self._skip_requested or getattr(self._no_delay, 'depth', 0)
+                or not getattr(self._battle_thread, 'depth', 0)):
+            return 0
+        return self.message_delay / multiplier
+    
+    @contextmanager
+    def battle_pacing(self):
+        """Контекст боя: сообщения текущего потока выводятся с паузами по скорости боя"""
+        self._battle_thread.depth = getattr(self._battle_thread, 'depth', 0) + 1
+        try:
+            yield
+        finally:
+            self._battle_thread.depth -= 1
+    
+    @contextmanager
+    def no_delay(self):
+        """Контекст, в котором сообщения текущего потока выводятся без пауз"""
+        self._no_delay.depth = getattr(self._no_delay, 'depth', 0) + 1
+        try:
+            yield
+        finally:
+            self._no_delay.depth -= 1
+    
+    # ==================== Скорость боя ====================
+    def set_speed_level(self, level):
+        """Устанавливает уровень скорости (индекс в BATTLE_SPEED_LEVELS)"""
+        self.speed_level = max(0, min(level, len(BATTLE_SPEED_LEVELS) - 1))
+    
+    def change_speed(self, step=1):
+        """
+        Меняет скорость боя на step уровней.
+        :return: Название новой скорости
+        """
+        self.set_speed_level(self.speed_level + step)
+        return self.get_speed_name()
+    
+    def get_speed_name(self):
+        """Название текущей скорости"""
+        return BATTLE_SPEED_LEVELS[self.speed_level][0]
+    
+    def get_speed_multiplier(self):
+        """Множитель текущей скорости (None - мгновенно)"""
+        return BATTLE_SPEED_LEVELS[self.speed_level][1]
+    
+    def is_round_batched(self):
+        """Выводится ли раунд целиком (пауза одна на раунд, а не на сообщение)"""
+        multiplier = self.get_speed_multiplier()
+        return multiplier is None or multiplier >= ROUND_BATCH_SPEED
+    
+    def end_round(self):
+        """Конец раунда: на высоких скоростях выдерживает накопленную паузу одним ожиданием"""
+        delay, self._pending_delay = self._pending_delay, 0.0
+        if delay > 0 and not self._skip_requested:
+            self._sleep(delay, current_timing())
+    
+    @staticmethod
+    def _sleep(delay, timing=None):
+        """Пауза между сообщениями (учитывается в замере фаз боя)"""
+        if timing:
+            timing.enter(MESSAGE_DELAY)
+        time.sleep(delay)
+        if timing:
+            timing.leave()
+    
+    def skip_to_result(self):
+        """Досчитывает идущий бой без пауз"""
+        self._skip_requested = True
+        self._pending_delay = 0.0
+    
+    def reset_skip(self):
+        """Возвращает обычный темп (вызывается перед запуском боя)"""
+        self._skip_requested = False
+        self._pending_delay = 0.0
     
     def add_observer(self, observer):
         """Добавляет наблюдателя"""
@@ -28,6 +118,10 @@ class BattleLogger:
         if observer in self.observers:
             self.observers.remove(observer)
     
+    def has_observers(self):
+        """Проверяет, есть ли наблюдатели, читающие лог"""
+        return bool(self.observers)
+    
     def _notify_observers(self, message):
         """Уведомляет всех наблюдателей о новом сообщении"""
         for observer in self.observers:
@@ -38,14 +132,24 @@ class BattleLogger:
     
     def log(self, message):
         """Добавляет сообщение в лог и уведомляет наблюдателей"""
-        self.log_lines.append(message)
-        if len(self.log_lines) > self.max_lines:
-            self.log_lines = self.log_lines[-self.max_lines:]
-        self._notify_observers(message)  # Уведомляем наблюдателей
+        with self._lock:
+            self.log_lines.append(message)
+            self.total_lines += 1
+        timing = current_timing()  # Замер фаз боя (None, если выключен или это не поток боя)
+        if timing and self.observers:
+            timing.enter(LOGGER_OBSERVERS)
+            self._notify_observers(message)
+            timing.leave()
+        else:
+            self._notify_observers(message)  # Уведомляем наблюдателей
         
-        # Автоматическая задержка
-        if self.message_delay > 0:
-            time.sleep(self.message_delay)
+        # Автоматическая задержка: на высоких скоростях копится до конца раунда
+        delay = self.get_message_delay()
+        if delay > 0:
+            if self.is_round_batched():
+                self._pending_delay += delay
+            else:
+                self._sleep(delay, timing)
 
     def log_player_action(self, message):
         """Добавляет сообщение о действии игрока"""
@@ -73,11 +177,27 @@ class BattleLogger:
     
     def get_lines(self):
         """Возвращает копию списка строк лога"""
-        return self.log_lines.copy()
+        with self._lock:
+            return list(self.log_lines)
+    
+    def get_lines_since(self, line_number):
+        """
+        Возвращает строки, записанные начиная с указанного номера (без копирования всего лога).
+        
+        :param line_number: Номер первой нужной строки (номера сквозные, см. total_lines)
+        :return: (строки, номер первой возвращенной строки, поколение лога)
+        """
+        with self._lock:
+            first_number = self.total_lines - len(self.log_lines)
+            start = max(line_number, first_number)
+            lines = list(islice(self.log_lines, start - first_number, None))
+            return lines, start, self.generation
     
     def clear(self):
         """Очищает лог"""
-        self.log_lines.clear()
+        with self._lock:
+            self.log_lines.clear()
+            self.generation += 1
 
     @staticmethod
     def create_log_message(template: str, elements: list[tuple[str, int]]) -> list[tuple[str, int]]:
@@ -1,11 +1,12 @@
 import uuid
 from typing import List, Dict, Any, Optional
 
+from Battle.battle_context import BattleContext, get_battle_context, messages_enabled, use_battle_context
 from Battle.battle_logger import battle_logger
+from Battle.battle_metrics import REWARDS, STATISTICS, current_timing, get_battle_metrics
 from Battle.battle_statistics import get_battle_statistics
 from Battle.round_logic import battle_round, display_round_separator
 from Battle.rewards import BattleRewards
-from Config.game_config import MAX_ROUNDS
 from Inventory.inventory import get_inventory
 
 # Для аннотаций типов избегаем циклических импортов
@@ -19,42 +20,84 @@ class BattleSimulator:
 
     # ==================== Основная логика боя ====================
     @staticmethod
-    def simulate_battle(players: List['Character'], enemies: List['Character']) -> str:
+    def simulate_battle(players: List['Character'], enemies: List['Character'],
+                        context: Optional[BattleContext] = None) -> str:
         """
         Симулирует бой между игроками и врагами.
         
         :param players: Список игроков
         :param enemies: Список врагов
+        :param context: Параметры боя (None - текущий контекст)
         :return: Результат битвы ("win", "loss", или "draw")
         """
+        # Паузы между сообщениями выдерживает только поток боя
+        with use_battle_context(context), battle_logger.battle_pacing():
+            # Замер фаз боя (если включен): запись доступна участкам боя через current_timing()
+            metrics = get_battle_metrics()
+            timing = metrics.begin_battle()
+            try:
+                return BattleSimulator._run_battle(players, enemies, get_battle_context())
+            finally:
+                metrics.end_battle(timing)
+
+    @staticmethod
+    def _run_battle(players: List['Character'], enemies: List['Character'], context: BattleContext) -> str:
+        """
+        Проводит бой в заданном контексте.
+        
+        :param players: Список игроков
+        :param enemies: Список врагов
+        :param context: Параметры боя
+        :return: Результат битвы ("win", "loss", или "draw")
+        """
+        max_rounds = context.max_rounds
+        timing = current_timing()
+        
         # Подготовка перед боем
         BattleSimulator.pre_battle_setup(players, enemies)
         
         # Начало боя
-        battle_logger.log("")
-        battle_logger.log("🏁 БОЙ НАЧИНАЕТСЯ!")
+        quiet = not messages_enabled()  # В тихом режиме бой ничего не пишет в лог
+        if not quiet:
+            battle_logger.log("")
+            battle_logger.log("🏁 БОЙ НАЧИНАЕТСЯ!")
         battle_result = "draw"  # По умолчанию - ничья
         
         # Начало записи статистики
-        battle_id = str(uuid.uuid4())
-        stats = get_battle_statistics()
-        stats.start_battle_tracking(battle_id, players, enemies)
+        stats = get_battle_statistics() if context.track_statistics else None
+        if stats is not None:
+            battle_id = str(uuid.uuid4())
+            if timing:
+                timing.battle_id = battle_id
+                timing.enter(STATISTICS)
+            stats.start_battle_tracking(battle_id, players, enemies)
+            if timing:
+                timing.leave()
 
         # Основной цикл боя
-        for round_num in range(1, MAX_ROUNDS + 1):
-            display_round_separator(round_num)
+        for round_num in range(1, max_rounds + 1):
+            if not quiet:
+                display_round_separator(round_num)
             round_result = battle_round(players, enemies, battle_logger)
+            battle_logger.end_round()
+            if timing:
+                timing.rounds = round_num
             
             if round_result in ["win", "loss"]:
                 battle_result = round_result
                 break  # Заканчиваем бой
             
-            if round_num == MAX_ROUNDS:
+            if round_num == max_rounds and not quiet:
                 battle_logger.log(f"⏳ Время вышло! Раунд {round_num} стал последним.")
 
         # Все действия после боя
         # Статистика после боя
-        stats.end_battle(battle_id, True, 1)
+        if stats is not None:
+            if timing:
+                timing.enter(STATISTICS)
+            stats.end_battle(battle_id, True, 1)
+            if timing:
+                timing.leave()
 
         BattleSimulator.post_battle_processing(players, enemies, battle_result)
         
@@ -88,12 +131,18 @@ class BattleSimulator:
         """
         # Начисляем награды при победе
         if battle_result == "win":
-            battle_logger.set_message_delay(0)
-            battle_logger.log(f"🎖️ ПОБЕДА! Все враги повержены!")
-            BattleSimulator.award_rewards(players, enemies)
-            # Восстановление энергии всем выжившим игрокам
-            BattleSimulator.restore_energy_after_battle([p for p in players if p.is_alive()])
-            battle_logger.set_message_delay()
+            with battle_logger.no_delay():
+                if messages_enabled():
+                    battle_logger.log(f"🎖️ ПОБЕДА! Все враги повержены!")
+                if get_battle_context().award_rewards:
+                    timing = current_timing()
+                    if timing:
+                        timing.enter(REWARDS)
+                    BattleSimulator.award_rewards(players, enemies)
+                    # Восстановление энергии всем выжившим игрокам
+                    BattleSimulator.restore_energy_after_battle([p for p in players if p.is_alive()])
+                    if timing:
+                        timing.leave()
         
         # Сброс кулдаунов всех способностей и статус эффектов у всех персонажей
         BattleSimulator.reset_all_cooldowns(players + enemies)
@@ -165,9 +214,10 @@ class BattleSimulator:
 
 
 # ==================== Совместимость с предыдущим API ====================
-def simulate_battle(players: List['Character'], enemies: List['Character']) -> str:
+def simulate_battle(players: List['Character'], enemies: List['Character'],
+                    context: Optional[BattleContext] = None) -> str:
     """Совместимость с предыдущим API."""
-    return BattleSimulator.simulate_battle(players, enemies)
+    return BattleSimulator.simulate_battle(players, enemies, context)
 
 def pre_battle_setup(players: List['Character'], enemies: List['Character']) -> None:
     """Совместимость с предыдущим API."""
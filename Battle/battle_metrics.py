@@ -0,0 +1,223 @@
+# Battle/battle_metrics.py
+"""
+Замер времени по фазам боя без профайлера.
+
+Пока замер выключен, участки боя проверяют только current_timing() is None.
+Когда включен, каждый бой получает BattleTimingRecord: время фазы считается
+без вложенных фаз (время способности не входит в решение героя, время
+наблюдателей логгера - в запись результата). Запись привязана к потоку боя,
+поэтому сообщения основного потока во время боя в нее не попадают.
+
+Пример:
+    metrics = get_battle_metrics()
+    metrics.enable()
+    simulate_battle(players, enemies)
+    print(metrics.format_report())
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterator, List, Optional
+
+from Config.game_config import BATTLE_METRICS_HISTORY
+
+# ==================== Фазы ====================
+ENEMY_CREATION = 'enemy_creation'        # Создание или выдача группы врагов (до начала боя)
+PRE_ROUND = 'pre_round'                  # Срабатывание статус-эффектов в начале раунда
+PLAYER_DECISIONS = 'player_decisions'    # Выбор действия и цели героями
+ENEMY_TURNS = 'enemy_turns'              # Выбор действия и цели врагами
+ABILITY_EXECUTION = 'ability_execution'  # Применение способностей
+POST_ROUND = 'post_round'                # Обновление кулдаунов в конце раунда
+LOG_RESULT = 'log_result'                # Разбор результата действия и запись в лог
+STATISTICS = 'statistics'                # Статистика боя
+LOGGER_OBSERVERS = 'logger_observers'    # Наблюдатели логгера (экран, трансляция)
+MESSAGE_DELAY = 'message_delay'          # Паузы между сообщениями
+REWARDS = 'rewards'                      # Награды после победы
+OTHER = 'other'                          # Остаток времени боя вне перечисленных фаз
+
+PHASES = (ENEMY_CREATION, PRE_ROUND, PLAYER_DECISIONS, ENEMY_TURNS, ABILITY_EXECUTION, POST_ROUND,
+          LOG_RESULT, STATISTICS, LOGGER_OBSERVERS, MESSAGE_DELAY, REWARDS)
+
+
+# ==================== Запись боя ====================
+@dataclass
+class BattleTimingRecord:
+    """Время фаз одного боя (секунды) и число входов в каждую фазу"""
+    battle_id: Optional[str] = None
+    rounds: int = 0
+    total: float = 0.0  # Время simulate_battle целиком
+    phases: Dict[str, float] = field(default_factory=dict)
+    calls: Dict[str, int] = field(default_factory=dict)
+    _stack: List[str] = field(default_factory=list, repr=False)
+    _since: float = field(default=0.0, repr=False)
+    _started: float = field(default=0.0, repr=False)
+
+    def enter(self, phase: str) -> None:
+        """Входит в фазу; время внешней фазы до этого момента засчитывается ей"""
+        now = time.perf_counter()
+        if self._stack:
+            outer = self._stack[-1]
+            self.phases[outer] = self.phases.get(outer, 0.0) + now - self._since
+        self._stack.append(phase)
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+        self._since = now
+
+    def leave(self) -> None:
+        """Выходит из текущей фазы"""
+        now = time.perf_counter()
+        phase = self._stack.pop()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self._since
+        self._since = now
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Добавляет время фазы, замеренное отдельно"""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+
+    def get_other_time(self) -> float:
+        """Время боя вне замеряемых фаз (создание врагов идет до боя и не вычитается)"""
+        inside = sum(seconds for phase, seconds in self.phases.items() if phase != ENEMY_CREATION)
+        return max(0.0, self.total - inside)
+
+
+class _ThreadState(threading.local):
+    record: Optional[BattleTimingRecord] = None
+
+
+_thread_state = _ThreadState()
+
+
+def current_timing() -> Optional[BattleTimingRecord]:
+    """Запись боя, идущего в этом потоке (None - замер выключен или боя нет)"""
+    return _thread_state.record
+
+
+# ==================== Замер ====================
+class BattleMetrics:
+    """Singleton: включение замера и история записей последних боев"""
+    _instance: Optional['BattleMetrics'] = None
+
+    def __init__(self, history_size: int = BATTLE_METRICS_HISTORY) -> None:
+        """
+        :param history_size: Сколько последних боев хранить
+        """
+        self.enabled = False
+        self._history: Deque[BattleTimingRecord] = deque(maxlen=history_size)
+        self._pending: Dict[str, float] = {}  # Фазы до начала боя (создание врагов)
+        self._lock = threading.Lock()  # История пишется потоком боя, читается основным
+
+    # ==================== Включение ====================
+    def enable(self) -> None:
+        """Включает замер для следующих боев"""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Выключает замер (идущий бой досчитывается)"""
+        self.enabled = False
+
+    # ==================== Бой ====================
+    def begin_battle(self, battle_id: Optional[str] = None) -> Optional[BattleTimingRecord]:
+        """
+        Начинает запись боя в текущем потоке.
+
+        :return: Запись или None, если замер выключен
+        """
+        if not self.enabled:
+            return None
+        record = BattleTimingRecord(battle_id=battle_id)
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for phase, seconds in pending.items():
+            record.add(phase, seconds)
+        record._started = record._since = time.perf_counter()
+        _thread_state.record = record
+        return record
+
+    def end_battle(self, record: Optional[BattleTimingRecord]) -> None:
+        """Завершает запись боя и добавляет ее в историю"""
+        if record is None:
+            return
+        while record._stack:  # Бой прерван исключением посреди фазы
+            record.leave()
+        record.total = time.perf_counter() - record._started
+        _thread_state.record = None
+        with self._lock:
+            self._history.append(record)
+
+    @contextmanager
+    def measure_pending(self, phase: str) -> Iterator[None]:
+        """
+        Замеряет подготовку к бою (создание врагов): время попадет в запись следующего боя.
+
+        :param phase: Фаза
+        """
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            with self._lock:
+                self._pending[phase] = self._pending.get(phase, 0.0) + seconds
+
+    # ==================== Результаты ====================
+    def get_history(self) -> List[BattleTimingRecord]:
+        """Записи последних боев (старые первыми)"""
+        with self._lock:
+            return list(self._history)
+
+    def get_last_record(self) -> Optional[BattleTimingRecord]:
+        """Запись последнего завершенного боя"""
+        with self._lock:
+            return self._history[-1] if self._history else None
+
+    def get_totals(self) -> Dict[str, float]:
+        """Время фаз, сложенное по всем боям истории (секунды), включая OTHER"""
+        totals = {phase: 0.0 for phase in PHASES + (OTHER,)}
+        for record in self.get_history():
+            for phase, seconds in record.phases.items():
+                totals[phase] = totals.get(phase, 0.0) + seconds
+            totals[OTHER] += record.get_other_time()
+        return totals
+
+    def format_report(self) -> str:
+        """Текстовый отчет по истории боев"""
+        history = self.get_history()
+        if not history:
+            return "Замер фаз боя: нет завершенных боев"
+        battle_time = sum(record.total for record in history)
+        rounds = sum(record.rounds for record in history)
+        lines = [f"Замер фаз боя: боев {len(history)}, раундов {rounds}, время боев {battle_time * 1000:.1f} мс"]
+        for phase, seconds in sorted(self.get_totals().items(), key=lambda entry: entry[1], reverse=True):
+            share = seconds / battle_time * 100 if battle_time else 0.0
+            lines.append(f"  {phase:<20}{seconds * 1000:>10.1f} мс{share:>7.1f}%")
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        """Очищает историю"""
+        with self._lock:
+            self._history.clear()
+            self._pending.clear()
+
+    # ==================== Singleton management ====================
+    @classmethod
+    def get_instance(cls) -> 'BattleMetrics':
+        """Получить экземпляр singleton"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Сбрасывает экземпляр (для тестов)"""
+        cls._instance = None
+
+
+def get_battle_metrics() -> BattleMetrics:
+    """Удобная функция для получения BattleMetrics"""
+    return BattleMetrics.get_instance()
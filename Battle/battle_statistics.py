@@ -1,6 +1,6 @@
 # battle/battle_statistics.py
 
-from typing import Any, List, Dict, Optional, DefaultDict
+from typing import Any, Callable, List, Dict, Optional, DefaultDict, Tuple
 from dataclasses import dataclass, field
 from collections import defaultdict
 
@@ -75,7 +75,8 @@ class CombatActionRecord:
             
             # Эффекты из details
             if 'effects' in ability_result.details:
-                additional_effects = ability_result.details['effects']
+                # Копия: результат способности после обработки возвращается в пул
+                additional_effects = list(ability_result.details['effects'])
         
         return cls(
             round_number=kwargs.get('round_number', 0),
@@ -149,6 +150,10 @@ class GameTotalsRecord:
     achievements_unlocked: List[str] = field(default_factory=list)
     battles_by_difficulty: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
 
+# Загрузчик истории: возвращает (итоги битв, детальные записи) в хронологическом порядке
+HistoryLoader = Callable[[], Tuple[List[BattleSummaryRecord], List[CombatActionRecord]]]
+
+
 class BattleStatistics:
     """Синглтон класс для хранения боевой статистики"""
     _instance: Optional['BattleStatistics'] = None
@@ -161,12 +166,87 @@ class BattleStatistics:
     def __init__(self) -> None:
         # Инициализируем только один раз
         if not hasattr(self, '_initialized'):
-            self.detailed_records: List[CombatActionRecord] = []
-            self.battle_summaries: List[BattleSummaryRecord] = []
+            self._detailed_records: List[CombatActionRecord] = []
+            self._battle_summaries: List[BattleSummaryRecord] = []
             self.game_totals: GameTotalsRecord = GameTotalsRecord()
             self.current_battles: Dict[str, BattleInProgress] = {}  # Активные битвы
+            # Сохраненная история, которая еще не загружена (ленивая загрузка)
+            self._history_loader: Optional[HistoryLoader] = None
+            self._unloaded_battles: int = 0
             self._initialized = True
     
+    # ==================== История ====================
+    @property
+    def detailed_records(self) -> List[CombatActionRecord]:
+        """Детальные записи всех битв (загружает сохраненную историю при первом обращении)"""
+        self._ensure_history_loaded()
+        return self._detailed_records
+    
+    @property
+    def battle_summaries(self) -> List[BattleSummaryRecord]:
+        """Итоги всех битв (загружает сохраненную историю при первом обращении)"""
+        self._ensure_history_loaded()
+        return self._battle_summaries
+    
+    def _ensure_history_loaded(self) -> None:
+        """Загружает отложенную историю и ставит ее перед записями текущей сессии"""
+        loader = self._history_loader
+        if loader is None:
+            return
+        self._history_loader = None
+        self._unloaded_battles = 0
+        summaries, records = loader()
+        self._battle_summaries[:0] = summaries
+        self._detailed_records[:0] = records
+    
+    def restore(self, game_totals: GameTotalsRecord, history_loader: Optional[HistoryLoader] = None,
+                history_battles: int = 0) -> None:
+        """
+        Восстанавливает статистику из сохранения.
+        
+        Итоги игры восстанавливаются сразу, история битв - при первом обращении.
+        
+        :param game_totals: Итоговая статистика игры
+        :param history_loader: Загрузчик сохраненной истории
+        :param history_battles: Количество битв в сохраненной истории
+        """
+        self._detailed_records = []
+        self._battle_summaries = []
+        self.current_battles = {}
+        self.game_totals = game_totals
+        self._history_loader = history_loader
+        self._unloaded_battles = history_battles if history_loader is not None else 0
+    
+    def get_history_count(self) -> int:
+        """Количество завершенных битв, включая еще не загруженные"""
+        return self._unloaded_battles + len(self._battle_summaries)
+    
+    def get_history_since(self, start: int) -> List[Tuple[BattleSummaryRecord, List[CombatActionRecord]]]:
+        """
+        Возвращает битвы с порядковым номером >= start вместе с их детальными записями.
+        
+        Если все запрошенные битвы уже в памяти, отложенная история не загружается.
+        
+        :param start: Порядковый номер первой битвы (с начала игры)
+        :return: Список пар (итог битвы, детальные записи)
+        """
+        if start < self._unloaded_battles:
+            self._ensure_history_loaded()
+        summaries = self._battle_summaries[start - self._unloaded_battles:]
+        if not summaries:
+            return []
+        
+        # Записи битв идут подряд в конце списка - собираем их с конца
+        wanted = {summary.battle_id: [] for summary in summaries}
+        oldest_id = summaries[0].battle_id
+        for record in reversed(self._detailed_records):
+            records = wanted.get(record.battle_id)
+            if records is not None:
+                records.append(record)
+            elif wanted[oldest_id]:
+                break
+        return [(summary, wanted[summary.battle_id][::-1]) for summary in summaries]
+    
     def start_battle_tracking(self, battle_id: str, players: List[Any], 
                             enemies: List[Any]) -> None:
         """Начинает отслеживание новой битвы"""
@@ -190,7 +270,7 @@ class BattleStatistics:
     def add_combat_action(self, record: CombatActionRecord) -> None:
         """Добавляет детальную запись о боевом действии и обновляет статистику"""
         # Добавляем детальную запись
-        self.detailed_records.append(record)
+        self._detailed_records.append(record)
         
         # Обновляем статистику текущей битвы
         self._update_battle_statistics(record)
@@ -303,7 +383,7 @@ class BattleStatistics:
         )
         
         # Добавляем итог битвы
-        self.battle_summaries.append(battle_summary)
+        self._battle_summaries.append(battle_summary)
         
         # Обновляем итоговую статистику игры
         self._update_game_totals_from_battle(battle_summary)
@@ -346,6 +426,16 @@ class BattleStatistics:
             return [record for record in self.battle_summaries if record.player_victory == player_victory]
         return self.battle_summaries.copy()
     
+    def get_battle_summary_slice(self, start: int, count: int) -> List[BattleSummaryRecord]:
+        """
+        Возвращает итоги битв [start, start + count) в хронологическом порядке без копирования всей истории.
+        
+        :param start: Порядковый номер первой битвы (с начала игры)
+        :param count: Количество битв
+        :return: Список итогов битв
+        """
+        return self.battle_summaries[max(0, start):max(0, start + count)]
+    
     def get_current_game_totals(self) -> GameTotalsRecord:
         """Возвращает копию итоговой статистики"""
         return GameTotalsRecord(**self.game_totals.__dict__)
@@ -4,8 +4,9 @@ from typing import List, Dict, Any
 import random
 from Config.game_config import EXP_BASE, GOLD_BASE, EXP_VARIANCE, GOLD_VARIANCE
 from Inventory.inventory import get_inventory
+from Battle.battle_context import messages_enabled
 from Battle.battle_logger import battle_logger
-from Items.item_generator import ItemGenerator
+from Items.loot_tables import get_loot_table
 
 
 class Reward:
@@ -64,58 +65,42 @@ class ExperienceReward(Reward):
             return {}
         
         num_characters = len(characters)
-        base_exp = total_exp // num_characters
-        remaining_exp = total_exp % num_characters
+        base_exp, remaining_exp = divmod(total_exp, num_characters)
         
-        distribution = {}
-        
-        # Распределяем базовый опыт
-        for character in characters:
-            distribution[character.name] = base_exp
-        
-        # Распределяем остаток случайным образом
-        characters_list = list(characters)
-        for i in range(remaining_exp):
-            # Добавляем 1 очко опыта случайному персонажу
-            random_character = random.choice(characters_list)
-            distribution[random_character.name] += 1
-        
-        # Добавляем небольшие вариации (±5-10%)
-        for character in characters:
-            current_exp = distribution[character.name]
-            # Вариация от -10% до +10%
-            variation = int(current_exp * random.uniform(-0.1, 0.1))
-            # Убеждаемся, что опыт не станет отрицательным
-            variation = max(variation, -current_exp + 1) if current_exp > 1 else 0
-            distribution[character.name] += variation
-        
-        # Корректируем общую сумму, если она изменилась из-за вариаций
-        actual_total = sum(distribution.values())
-        diff = total_exp - actual_total
+        # Остаток достается случайным персонажам (по 1 очку)
+        bonus_indexes = set(random.sample(range(num_characters), remaining_exp))
         
+        # Базовый опыт с небольшими вариациями (±10%) - за один проход
+        distribution = {}
+        for index, character in enumerate(characters):
+            current_exp = base_exp + (1 if index in bonus_indexes else 0)
+            if current_exp > 1:
+                # Убеждаемся, что опыт не станет меньше 1
+                variation = int(current_exp * random.uniform(-0.1, 0.1))
+                current_exp += max(variation, -current_exp + 1)
+            distribution[character.name] = current_exp
+        
+        # Корректируем общую сумму, если она изменилась из-за вариаций:
+        # разница делится поровну между персонажами в случайном порядке
+        diff = total_exp - sum(distribution.values())
         if diff != 0:
-            # Распределяем разницу случайным образом
-            adjustment_characters = list(characters)
-            random.shuffle(adjustment_characters)
-            
-            for i in range(abs(diff)):
-                if i < len(adjustment_characters):
-                    char_name = adjustment_characters[i].name
-                    if diff > 0:
-                        distribution[char_name] += 1
-                    else:
-                        # Убеждаемся, что опыт не станет <= 0
-                        if distribution[char_name] > 1:
-                            distribution[char_name] -= 1
+            step = 1 if diff > 0 else -1
+            share, extra = divmod(abs(diff), num_characters)
+            for i, character in enumerate(random.sample(characters, num_characters)):
+                adjustment = step * (share + (1 if i < extra else 0))
+                distribution[character.name] = max(1, distribution[character.name] + adjustment)
         
         return distribution
     
-    def apply_reward(self, characters: List = []):
+    def apply_reward(self, characters: List = [], build_messages: bool = True):
         """
         Применяет опыт ко всем персонажам и формирует общее сообщение.
         
         :param characters: Список персонажей для получения опыта
+        :param build_messages: Формировать ли сообщения (без подключенного интерфейса
+                               сообщения не нужны, message остается None)
         """
+        self.message = None
         if not characters:
             # Создаем сообщение об отсутствии персонажей
             template = "%1 Нет персонажей для получения опыта!"
@@ -134,9 +119,12 @@ class ExperienceReward(Reward):
             if character.name in self.exp_distribution:
                 actual_exp = self.exp_distribution[character.name]
                 if actual_exp > 0 and hasattr(character, 'add_exp'):
-                    level_up_msgs = character.add_exp(actual_exp)
+                    level_up_msgs = character.add_exp(actual_exp, build_messages)
                     self.level_up_messages.extend(level_up_msgs)
         
+        if not build_messages:
+            return self
+        
         # Формируем общее сообщение
         if self.exp_distribution:
             # Создаем цветные элементы для каждого персонажа
@@ -214,6 +202,9 @@ class LootReward(Reward):
 class BattleRewards:
     """Награды за победу в битве."""
     
+    # Веса редкости лута: больше шанс на обычные предметы
+    LOOT_RARITY_WEIGHTS = (0.6, 0.25, 0.1, 0.04, 0.01)
+    
     @classmethod
     def calculate_for_enemy(cls, enemy) -> Dict[str, int]:
         """Рассчитывает награды за одного врага."""
@@ -274,27 +265,13 @@ class BattleRewards:
         
         # Определяем максимальный уровень среди врагов
         max_level = max(getattr(enemy, 'level', 1) for enemy in defeated_enemies)
-        min_level = max(1, max_level - 2)  # Минимальный уровень на 2 ниже максимального
         
         # Определяем количество предметов
         num_items = cls.calculate_loot_chance(defeated_enemies)
         
-        # Генерируем лут
-        items = []
-        for _ in range(num_items):
-            # Генерируем предмет с уровнем от min_level до max_level+1
-            item_level = random.randint(min_level, max_level + 1)
-            
-            # Генерируем предмет (с небольшим шансом получить редкий)
-            rarity_weights = [0.6, 0.25, 0.1, 0.04, 0.01]  # Больше шанс на обычные предметы
-            item = ItemGenerator.generate_random_item(
-                min_level=item_level,
-                max_level=item_level + 1,
-                rarity_weights=rarity_weights
-            )
-            items.append(item)
-        
-        return items
+        # Генерируем лут по скомпилированной таблице уровня
+        # (уровни от max_level-2 до max_level+2, с небольшим шансом получить редкий)
+        return get_loot_table(max_level, cls.LOOT_RARITY_WEIGHTS).generate_items(num_items)
     
     @classmethod
     def generate_rewards(cls, defeated_enemies: List) -> List[Reward]:
@@ -354,10 +331,12 @@ class BattleRewards:
         # Применяем награды
         for reward in rewards:
             if isinstance(reward, ExperienceReward):
-                # Применяем опыт ко всем персонажам
-                result = reward.apply_reward(player_characters)
+                # Применяем опыт ко всем персонажам (сообщения - только для интерфейса)
+                result = reward.apply_reward(player_characters,
+                                             messages_enabled() and battle_logger.has_observers())
                 results['exp_reward'] = result
-                results['messages'].append(result.message)
+                if result.message is not None:
+                    results['messages'].append(result.message)
                 results['level_up_messages'].extend(result.level_up_messages)
                 
             elif isinstance(reward, GoldReward):
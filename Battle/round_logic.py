@@ -1,14 +1,21 @@
 import random
 from xxlimited import Str
+from Battle.battle_context import get_battle_context, messages_enabled
 from Battle.battle_logger import battle_logger
+from Battle.battle_metrics import (
+    ENEMY_TURNS, LOG_RESULT, PLAYER_DECISIONS, POST_ROUND, PRE_ROUND, STATISTICS, current_timing
+)
 from Battle.battle_statistics import CombatActionRecord, get_battle_statistics
 from Characters.Status_effects import status_effect
+from Characters.Status_effects.dot_ticker import tick_status_effects
 from Characters.behavior import decide_action
+from Utils.object_pool import release_object
 
 def battle_round(players, enemies, battle_logger) -> str:
     """Один раунд боя"""
     
     battle_result: str = "draw"
+    timing = current_timing()  # Замер фаз боя (None, если выключен)
     #эффекты срабатывающие в начале раунда
     pre_round_processing(players, enemies)
 
@@ -18,7 +25,11 @@ def battle_round(players, enemies, battle_logger) -> str:
             continue
 
         # Используем логику поведения для принятия решения
+        if timing:
+            timing.enter(PLAYER_DECISIONS)
         action_result = decide_action(player, players, [e for e in enemies if e.is_alive()])
+        if timing:
+            timing.leave()
         log_result(action_result)
 
         # Простая проверка победы после каждого действия игрока
@@ -31,12 +42,17 @@ def battle_round(players, enemies, battle_logger) -> str:
             continue
 
         # Используем логику поведения для принятия решения
+        if timing:
+            timing.enter(ENEMY_TURNS)
         action_result = decide_action(enemy, enemies, [p for p in players if p.is_alive()])
+        if timing:
+            timing.leave()
         log_result(action_result)
 
         # Простая проверка поражения после каждого действия врага
         if all(not p.is_alive() for p in players):
-            battle_logger.log("☠️ ПОРАЖЕНИЕ! Вся команда погибла...")
+            if messages_enabled():
+                battle_logger.log("☠️ ПОРАЖЕНИЕ! Вся команда погибла...")
             battle_result = "loss"
             return battle_result # Возвращаем результат
         
@@ -47,37 +63,61 @@ def battle_round(players, enemies, battle_logger) -> str:
     return battle_result # Возвращаем результат
 
 def pre_round_processing(players, enemies):
-    for player in players:
-        results = player.status_manager.update_effects()
-        for result in results:
-            log_result(result)
-
-    for enemy in enemies:
-        results = enemy.status_manager.update_effects()
-        for result in results:
-            log_result(result)
+    # Эффекты всех участников боя обрабатываются одним пакетом,
+    # сообщения формируются только если лог кто-то читает и бой идет не в тихом режиме
+    timing = current_timing()
+    if timing:
+        timing.enter(PRE_ROUND)
+    results = tick_status_effects(players + enemies,
+                                  build_messages=messages_enabled() and battle_logger.has_observers())
+    if timing:
+        timing.leave()
+    for result in results:
+        log_result(result)
 
 def post_round_processing(players, enemies):
 
+    timing = current_timing()
+    if timing:
+        timing.enter(POST_ROUND)
+
     for player in players:
         player.ability_manager.update_cooldowns()
     
     for enemy in enemies:
         enemy.ability_manager.update_cooldowns()
 
+    if timing:
+        timing.leave()
+
 def log_result(action_result) -> None:
 
+    timing = current_timing()
+    if timing:
+        timing.enter(LOG_RESULT)
+
     if action_result:
         #Статистика
-        stats = get_battle_statistics()
-        action_record = CombatActionRecord.from_ability_result(action_result)
-        stats.add_combat_action(action_record) 
+        if get_battle_context().track_statistics:
+            if timing:
+                timing.enter(STATISTICS)
+            stats = get_battle_statistics()
+            action_record = CombatActionRecord.from_ability_result(action_result)
+            stats.add_combat_action(action_record) 
+            if timing:
+                timing.leave()
 
         for message in action_result.messages:
             battle_logger.log(message)
-    else:
+
+        # Результат обработан - возвращаем его в пул
+        release_object(action_result)
+    elif messages_enabled():
         battle_logger.log_enemy_action("что-то не так при использовании способности")
 
+    if timing:
+        timing.leave()
+
 def display_round_separator(round_num):
     """Отображает красивый разделитель раундов"""
     battle_logger.log("") # Пустая строка перед новым раундом
@@ -0,0 +1,279 @@
+# Benchmarks/combat_benchmarks.py
+"""
+Микробенчмарки горячих путей боя.
+
+Каждый замер: прогрев (результаты отбрасываются), затем несколько повторов
+по number вызовов; для повторов считаются среднее, медиана, разброс,
+минимум и максимум времени одного вызова. Результаты пишутся в JSON,
+чтобы сравнивать их до и после оптимизаций.
+
+Пример запуска из корня проекта:
+    python -m Benchmarks.combat_benchmarks --repeats 9 --output baseline.json
+    python -m Benchmarks.combat_benchmarks --filter armor
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+if __name__ == '__main__':
+    # Запуск скриптом: корень проекта нужен в путях импорта и как рабочий каталог
+    _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, _PROJECT_ROOT)
+    os.chdir(_PROJECT_ROOT)
+
+from Battle.base_mechanics import GameMechanics
+from Battle.battle_logger import battle_logger
+from Battle.battle_statistics import CombatActionRecord, get_battle_statistics
+from Characters.behavior import decide_action
+from Characters.char_utils import create_enemies, create_player_team
+from Characters.Status_effects.burn_effect import BurnEffect
+from Characters.Status_effects.poison_effect import PoisonEffect
+from Items.item_generator import ItemGenerator
+from Simulation.headless import suppress_output
+from Utils.object_pool import release_object
+
+DEFAULT_REPEATS = 7
+DEFAULT_WARMUP = 1
+DEFAULT_MIN_TIME = 0.05  # Минимальная длительность одного повтора при подборе number (сек)
+SCHEMA_VERSION = 1
+
+Operation = Callable[[], Any]
+
+
+@dataclass
+class Benchmark:
+    """Замер: имя и функция подготовки, возвращающая замеряемую операцию"""
+    name: str
+    setup: Callable[[], Operation]
+
+
+# ==================== Операции ====================
+def _setup_apply_all_mechanics() -> Operation:
+    players = create_player_team()
+    attacker, target = players[0], create_enemies(players)[0]
+    attack = attacker.ability_manager.get_active_ability('attack')
+    return lambda: GameMechanics.apply_all_mechanics(attack, attacker, target, 25.0)
+
+
+def _setup_calculate_armor_reduction() -> Operation:
+    return lambda: GameMechanics.calculate_armor_reduction(37.5, 40)
+
+
+def _setup_create_log_message() -> Operation:
+    elements = [("Роланд", 2), ("Гоблин", 4), ("12", 1)]
+    return lambda: battle_logger.create_log_message("⚔️  %1 атакует %2 и наносит %3 урона", elements)
+
+
+def _setup_decide_action() -> Operation:
+    # decide_action сразу применяет выбранную способность: герои ходят по очереди,
+    # после круга обновляются кулдауны, а после победы бой начинается заново
+    players = create_player_team()
+    enemies = create_enemies(players)
+    turn = [0]
+
+    def operation() -> Any:
+        actor = players[turn[0]]
+        release_object(decide_action(actor, players, enemies))
+        turn[0] = (turn[0] + 1) % len(players)
+        if turn[0] == 0:
+            for player in players:
+                player.ability_manager.update_cooldowns()
+        if not any(enemy.is_alive() for enemy in enemies):
+            for character in players + enemies:
+                character.reset_battle_state()
+    return operation
+
+
+def _setup_update_effects() -> Operation:
+    players = create_player_team()
+    target = create_enemies(players)[0]
+    manager = target.status_manager
+    manager.add_effect(PoisonEffect(duration=10 ** 9, base_damage=1), target)
+    manager.add_effect(BurnEffect(duration=10 ** 9, base_damage=1), target)
+    max_hp = target.derived_stats.max_hp
+
+    def operation() -> Any:
+        result = manager.update_effects()
+        if target.hp < max_hp // 2:
+            target.hp = max_hp  # Эффекты не должны убить цель посреди замера
+        return result
+    return operation
+
+
+def _setup_create_enemies() -> Operation:
+    players = create_player_team()
+    return lambda: create_enemies(players)
+
+
+def _setup_generate_random_item() -> Operation:
+    return ItemGenerator.generate_random_item
+
+
+def _setup_add_exp() -> Operation:
+    player = create_player_team()[0]
+    level, exp_to_next_level = player.level, player.exp_to_next_level
+
+    def operation() -> Any:
+        # Каждый вызов - одно повышение уровня с одного и того же уровня
+        player.level, player.exp, player.exp_to_next_level = level, 0, exp_to_next_level
+        return player.add_exp(exp_to_next_level)
+    return operation
+
+
+def _setup_add_combat_action() -> Operation:
+    players = create_player_team()
+    enemies = create_enemies(players)
+    stats = get_battle_statistics()
+    battle_id = str(uuid.uuid4())
+    stats.start_battle_tracking(battle_id, players, enemies)
+    record = CombatActionRecord(
+        round_number=1, attacker_name=players[0].name, target_name=enemies[0].name,
+        ability_name="Атака", damage_dealt=12, damage_blocked=3, is_critical=False, is_dodge=False,
+        heal_amount=0, attacker_hp_before=100, attacker_hp_after=100, target_hp_before=50,
+        target_hp_after=38, energy_cost=10, additional_effects=[], battle_id=battle_id)
+    return lambda: stats.add_combat_action(record)
+
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark("GameMechanics.apply_all_mechanics", _setup_apply_all_mechanics),
+    Benchmark("GameMechanics.calculate_armor_reduction", _setup_calculate_armor_reduction),
+    Benchmark("BattleLogger.create_log_message", _setup_create_log_message),
+    Benchmark("behavior.decide_action", _setup_decide_action),
+    Benchmark("StatusEffectManager.update_effects", _setup_update_effects),
+    Benchmark("char_utils.create_enemies", _setup_create_enemies),
+    Benchmark("ItemGenerator.generate_random_item", _setup_generate_random_item),
+    Benchmark("Player.add_exp", _setup_add_exp),
+    Benchmark("BattleStatistics.add_combat_action", _setup_add_combat_action),
+]
+
+
+# ==================== Замер ====================
+def _time_calls(operation: Operation, number: int) -> float:
+    """Время number вызовов (сек)"""
+    started = time.perf_counter()
+    for _ in range(number):
+        operation()
+    return time.perf_counter() - started
+
+
+def calibrate(operation: Operation, min_time: float = DEFAULT_MIN_TIME) -> int:
+    """
+    Подбирает число вызовов на повтор (как timeit.autorange).
+
+    :return: Наименьшее number из 1, 2, 5, 10, 20, 50..., при котором повтор длится не меньше min_time
+    """
+    scale = 1
+    while True:
+        for multiplier in (1, 2, 5):
+            number = scale * multiplier
+            if _time_calls(operation, number) >= min_time:
+                return number
+        scale *= 10
+
+
+def measure(operation: Operation, number: int, repeats: int = DEFAULT_REPEATS,
+            warmup: int = DEFAULT_WARMUP) -> Dict[str, Any]:
+    """
+    Замеряет операцию.
+
+    :param operation: Функция без аргументов
+    :param number: Вызовов в одном повторе
+    :param repeats: Повторов, попадающих в статистику
+    :param warmup: Повторов прогрева (не учитываются)
+    :return: Статистика времени одного вызова в микросекундах
+    """
+    for _ in range(warmup):
+        _time_calls(operation, number)
+    samples = [_time_calls(operation, number) / number * 1e6 for _ in range(repeats)]
+    return {
+        'number': number,
+        'repeats': repeats,
+        'warmup': warmup,
+        'unit': 'us',
+        'mean': statistics.fmean(samples),
+        'median': statistics.median(samples),
+        'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'min': min(samples),
+        'max': max(samples),
+        'samples': samples,
+    }
+
+
+def run_benchmarks(benchmarks: List[Benchmark], repeats: int = DEFAULT_REPEATS, warmup: int = DEFAULT_WARMUP,
+                   number: Optional[int] = None, min_time: float = DEFAULT_MIN_TIME,
+                   seed: int = 0) -> Dict[str, Any]:
+    """
+    Прогоняет замеры.
+
+    :param number: Вызовов в повторе (None - подобрать для каждого замера)
+    :return: Результаты в виде словаря для JSON
+    """
+    results: Dict[str, Any] = {}
+    with battle_logger.no_delay(), suppress_output():
+        for benchmark in benchmarks:
+            random.seed(seed)  # Одинаковые команды, враги и броски для каждого запуска
+            operation = benchmark.setup()
+            calls = number or calibrate(operation, min_time)
+            results[benchmark.name] = measure(operation, calls, repeats, warmup)
+    return {
+        'schema': SCHEMA_VERSION,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'seed': seed,
+        'benchmarks': results,
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Таблица результатов (мкс на вызов)"""
+    lines = [f"{'замер':<42}{'вызовов':>9}{'медиана':>10}{'среднее':>10}{'разброс':>10}{'мин':>10}"]
+    for name, result in report['benchmarks'].items():
+        lines.append(f"{name:<42}{result['number']:>9}{result['median']:>10.2f}{result['mean']:>10.2f}"
+                     f"{result['stdev']:>10.2f}{result['min']:>10.2f}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входа командной строки"""
+    parser = argparse.ArgumentParser(description="Микробенчмарки горячих путей боя (результаты в JSON)")
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS, help="Повторов в статистике")
+    parser.add_argument('--warmup', type=int, default=DEFAULT_WARMUP, help="Повторов прогрева")
+    parser.add_argument('--number', type=int, default=None,
+                        help="Вызовов в повторе (по умолчанию подбирается для каждого замера)")
+    parser.add_argument('--min-time', type=float, default=DEFAULT_MIN_TIME,
+                        help="Минимальная длительность повтора при подборе числа вызовов (сек)")
+    parser.add_argument('--filter', default=None, help="Запускать только замеры, в имени которых есть подстрока")
+    parser.add_argument('--seed', type=int, default=0, help="Зерно генератора случайных чисел")
+    parser.add_argument('--output', default='-', help="JSON-файл с результатами ('-' - стандартный вывод)")
+    args = parser.parse_args(argv)
+
+    benchmarks = [benchmark for benchmark in BENCHMARKS
+                  if not args.filter or args.filter.lower() in benchmark.name.lower()]
+    if not benchmarks:
+        parser.error(f"Нет замеров, подходящих под фильтр: {args.filter}")
+
+    report = run_benchmarks(benchmarks, args.repeats, args.warmup, args.number, args.min_time, args.seed)
+    print(format_report(report), file=sys.stderr)
+
+    if args.output == '-':
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
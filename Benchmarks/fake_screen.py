@@ -0,0 +1,177 @@
+# Benchmarks/fake_screen.py
+"""
+Заменитель окна curses для замеров отрисовки без терминала.
+
+FakeScreen принимает те же вызовы, что и stdscr, считает addstr и кадры
+(кадр заканчивается refresh() окна или curses.doupdate()) и отдает клавиши
+из заранее заданного сценария. fake_curses() подменяет функции curses,
+которым нужен настоящий терминал (color_pair, newpad, doupdate и т.п.).
+"""
+
+import curses
+import time
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Sequence, Union
+from unittest import mock
+
+DEFAULT_HEIGHT = 40
+DEFAULT_WIDTH = 120
+EXIT_KEY = ord('q')  # Когда сценарий закончился, окна получают Q и закрываются
+
+
+# ==================== Кадры ====================
+@dataclass
+class FrameRecord:
+    """Один кадр: сколько он занял и сколько было вызовов вывода"""
+    seconds: float
+    addstr_calls: int
+    characters: int
+
+
+# ==================== Окно ====================
+class FakeScreen:
+    """Окно curses в памяти: считает вывод, клавиши берет из сценария"""
+
+    def __init__(self, height: int = DEFAULT_HEIGHT, width: int = DEFAULT_WIDTH,
+                 keys: Iterable[Union[int, str]] = (), exit_key: int = EXIT_KEY) -> None:
+        """
+        :param height: Высота экрана
+        :param width: Ширина экрана
+        :param keys: Сценарий клавиш (коды или однобуквенные строки)
+        :param exit_key: Клавиша после окончания сценария
+        """
+        self.height = height
+        self.width = width
+        self.exit_key = exit_key
+        self._keys: List[int] = []
+        self.push_keys(keys)
+        self.frames: List[FrameRecord] = []
+        self.addstr_calls = 0
+        self.characters = 0
+        self.refresh_calls = 0
+        self._frame_addstr = 0
+        self._frame_characters = 0
+        self._frame_start = time.perf_counter()
+
+    # ==================== Сценарий ====================
+    def push_keys(self, keys: Iterable[Union[int, str]]) -> None:
+        """Добавляет клавиши в конец сценария"""
+        self._keys.extend(ord(key) if isinstance(key, str) else key for key in keys)
+
+    def getch(self) -> int:
+        """Следующая клавиша сценария"""
+        return self._keys.pop(0) if self._keys else self.exit_key
+
+    def get_wch(self) -> Union[int, str]:
+        key = self.getch()
+        return chr(key) if 0 <= key < curses.KEY_MIN else key
+
+    # ==================== Кадры ====================
+    def start_frame(self) -> None:
+        """Начинает отсчет кадра заново (например, после подготовки данных)"""
+        self._frame_start = time.perf_counter()
+        self._frame_addstr = 0
+        self._frame_characters = 0
+
+    def end_frame(self) -> None:
+        """Завершает кадр и запоминает его стоимость"""
+        now = time.perf_counter()
+        self.frames.append(FrameRecord(now - self._frame_start, self._frame_addstr, self._frame_characters))
+        self._frame_start = now
+        self._frame_addstr = 0
+        self._frame_characters = 0
+
+    def refresh(self) -> None:
+        self.refresh_calls += 1
+        self.end_frame()
+
+    def noutrefresh(self) -> None:
+        self.refresh_calls += 1
+
+    # ==================== Вывод ====================
+    def addstr(self, *args) -> None:
+        # addstr(text), addstr(text, attr), addstr(y, x, text), addstr(y, x, text, attr)
+        text = args[0] if len(args) <= 2 else args[2]
+        self.addstr_calls += 1
+        self._frame_addstr += 1
+        self.characters += len(text)
+        self._frame_characters += len(text)
+
+    def addch(self, *args) -> None:
+        self.addstr(' ')  # Один символ - как addstr из одного символа
+
+    def getmaxyx(self):
+        return self.height, self.width
+
+    # Остальные вызовы не влияют на замер
+    def clear(self) -> None: pass
+    def erase(self) -> None: pass
+    def bkgd(self, *args) -> None: pass
+    def attron(self, *args) -> None: pass
+    def attroff(self, *args) -> None: pass
+    def move(self, *args) -> None: pass
+    def clrtoeol(self) -> None: pass
+    def touchwin(self) -> None: pass
+    def keypad(self, *args) -> None: pass
+    def timeout(self, *args) -> None: pass
+    def nodelay(self, *args) -> None: pass
+
+
+class FakePad(FakeScreen):
+    """Pad в памяти: вывод считается в общий экран, noutrefresh(...) принимает координаты"""
+
+    def __init__(self, screen: FakeScreen, height: int, width: int) -> None:
+        super().__init__(height, width)
+        self.screen = screen
+
+    def addstr(self, *args) -> None:
+        super().addstr(*args)
+        self.screen.addstr(*args)
+
+    def noutrefresh(self, *args) -> None:
+        self.refresh_calls += 1
+
+
+# ==================== Подмена curses ====================
+@contextmanager
+def fake_curses(screen: FakeScreen) -> Iterator[FakeScreen]:
+    """
+    Подменяет функции curses, которым нужен инициализированный терминал.
+
+    :param screen: Экран, в котором считаются кадры curses.doupdate()
+    """
+    with ExitStack() as stack:
+        patches = {
+            'color_pair': lambda color: color << 8,
+            'newpad': lambda height, width: FakePad(screen, height, width),
+            'doupdate': screen.end_frame,
+            'curs_set': lambda visibility: 0,
+            'echo': lambda: None,
+            'noecho': lambda: None,
+        }
+        for name, replacement in patches.items():
+            stack.enter_context(mock.patch.object(curses, name, replacement))
+        yield screen
+
+
+# ==================== Сводка ====================
+def summarize_frames(frames: Sequence[FrameRecord]) -> dict:
+    """
+    Сводка по кадрам.
+
+    :return: Словарь: кадров, мс на кадр (среднее/медиана/максимум), addstr на кадр
+    """
+    if not frames:
+        return {'frames': 0, 'ms_per_frame': 0.0, 'ms_median': 0.0, 'ms_max': 0.0,
+                'addstr_per_frame': 0.0, 'chars_per_frame': 0.0}
+    milliseconds = sorted(frame.seconds * 1000 for frame in frames)
+    count = len(frames)
+    return {
+        'frames': count,
+        'ms_per_frame': sum(milliseconds) / count,
+        'ms_median': milliseconds[count // 2],
+        'ms_max': milliseconds[-1],
+        'addstr_per_frame': sum(frame.addstr_calls for frame in frames) / count,
+        'chars_per_frame': sum(frame.characters for frame in frames) / count,
+    }
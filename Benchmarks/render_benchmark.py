@@ -0,0 +1,176 @@
+# Benchmarks/render_benchmark.py
+"""
+Замер стоимости отрисовки интерфейса без терминала.
+
+Основной экран, инвентарь, умения и статистика прогоняются по сценариям
+клавиш на FakeScreen; для каждого сценария выводится время кадра
+и количество вызовов addstr на кадр.
+
+Пример запуска из корня проекта:
+    python -m Benchmarks.render_benchmark --frames 300 --items 5000 --battles 100000
+"""
+
+import argparse
+import curses
+import json
+import os
+import random
+import sys
+import uuid
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional
+
+if __name__ == '__main__':
+    # Запуск скриптом: корень проекта нужен в путях импорта и как рабочий каталог
+    _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, _PROJECT_ROOT)
+    os.chdir(_PROJECT_ROOT)
+
+from Benchmarks.fake_screen import DEFAULT_HEIGHT, DEFAULT_WIDTH, FakeScreen, fake_curses, summarize_frames
+from Battle.battle_logger import battle_logger
+from Battle.battle_statistics import BattleSummaryRecord, GameTotalsRecord, get_battle_statistics
+from Characters.char_utils import create_enemies, create_player_team
+from Inventory.inventory import get_inventory
+from Items.item_generator import ItemGenerator
+
+ENTER_KEY = 10
+
+
+# ==================== Сценарии ====================
+def bench_main_display(screen: FakeScreen, frames: int, lines_per_frame: int = 3) -> None:
+    """
+    Основной экран во время боя: каждый кадр приходят новые строки лога
+    и меняется состояние одного персонажа.
+    """
+    from Utils.display import update_display
+
+    players = create_player_team()
+    enemies = create_enemies(players)
+    handler = SimpleNamespace(players=players, enemies=enemies)
+    characters = players + enemies
+    battle_logger.clear()
+
+    for frame in range(frames):
+        with battle_logger.no_delay():
+            for _ in range(lines_per_frame):
+                attacker, target = random.sample(characters, 2)
+                battle_logger.log(battle_logger.create_log_message(
+                    "⚔️  %1 атакует %2 и наносит %3 урона",
+                    [(attacker.name, 2), (target.name, 4), (random.randint(1, 20), 1)]))
+        target = characters[frame % len(characters)]
+        target.hp = max(1, target.hp - 1)
+        screen.start_frame()  # Подготовка состояния не входит в кадр
+        update_display(screen, handler)
+        curses.doupdate()
+
+
+def bench_inventory(screen: FakeScreen, frames: int, items: int) -> None:
+    """Инвентарь: прокрутка страницами, смена сортировки и фильтра"""
+    from Utils.display import display_inventory_screen
+
+    inventory = get_inventory()
+    inventory.clear()
+    for item_object in ItemGenerator.generate_items(items):
+        inventory.add_item(item_object)
+
+    cycle = [curses.KEY_NPAGE] * 5 + [curses.KEY_DOWN] * 5 + ['s', curses.KEY_END, 'f', curses.KEY_HOME]
+    screen.push_keys((cycle * (frames // len(cycle) + 1))[:frames])
+    screen.start_frame()
+    display_inventory_screen(screen, create_player_team())
+
+
+def bench_abilities(screen: FakeScreen, frames: int) -> None:
+    """Умения: перебор карточек и вкладок героев"""
+    from Utils.UI.Skills.skills_window import display_abilities_screen
+
+    cycle = [curses.KEY_DOWN] * 6 + [curses.KEY_UP] * 2 + [curses.KEY_RIGHT]
+    screen.push_keys((cycle * (frames // len(cycle) + 1))[:frames])
+    screen.start_frame()
+    display_abilities_screen(screen, create_player_team())
+
+
+def bench_statistics(screen: FakeScreen, frames: int, battles: int) -> None:
+    """Статистика: прокрутка списка битв и открытие деталей"""
+    from Utils.UI.Statistics.statistics_window import GlobalStatsWindow
+
+    summaries = [_make_summary(index) for index in range(battles)]
+    get_battle_statistics().restore(GameTotalsRecord(total_battles=battles),
+                                    history_loader=lambda: (summaries, []),
+                                    history_battles=battles)
+
+    cycle = [curses.KEY_DOWN] * 8 + [curses.KEY_NPAGE] * 4 + [ENTER_KEY, 'q', curses.KEY_END, curses.KEY_HOME]
+    screen.push_keys((cycle * (frames // len(cycle) + 1))[:frames])
+    screen.start_frame()
+    GlobalStatsWindow(screen).run()
+
+
+def _make_summary(index: int) -> BattleSummaryRecord:
+    return BattleSummaryRecord(
+        battle_id=str(uuid.UUID(int=index)), total_rounds=random.randint(1, 30),
+        player_names=["Роланд", "Стайлс", "Морган", "Дамиан"], enemy_names=["Гоблин", "Орк"],
+        player_victory=bool(index % 3), total_damage_dealt_by_players=random.randint(50, 500),
+        total_damage_dealt_to_players=random.randint(0, 300), total_healing_done=random.randint(0, 100),
+        abilities_used={}, critical_hits_count=0, dodges_count=0, player_survival_rate=1.0,
+        special_effects_triggered={}, character_stats={})
+
+
+# ==================== Запуск ====================
+def run_scenario(name: str, scenario: Callable[[FakeScreen], None],
+                 height: int = DEFAULT_HEIGHT, width: int = DEFAULT_WIDTH) -> Dict[str, float]:
+    """
+    Прогоняет сценарий на новом экране.
+
+    :return: Сводка по кадрам (см. summarize_frames) с именем сценария
+    """
+    screen = FakeScreen(height, width)
+    with fake_curses(screen):
+        scenario(screen)
+    return {'scenario': name, **summarize_frames(screen.frames)}
+
+
+def run_all(frames: int = 300, items: int = 2000, battles: int = 10000,
+            height: int = DEFAULT_HEIGHT, width: int = DEFAULT_WIDTH, seed: int = 0) -> List[Dict[str, float]]:
+    """Прогоняет все сценарии и возвращает их сводки"""
+    random.seed(seed)
+    scenarios = [
+        ("main_display", lambda screen: bench_main_display(screen, frames)),
+        ("inventory", lambda screen: bench_inventory(screen, frames, items)),
+        ("abilities", lambda screen: bench_abilities(screen, frames)),
+        ("statistics", lambda screen: bench_statistics(screen, frames, battles)),
+    ]
+    return [run_scenario(name, scenario, height, width) for name, scenario in scenarios]
+
+
+def format_report(results: List[Dict[str, float]]) -> str:
+    """Таблица результатов"""
+    lines = [f"{'сценарий':<14}{'кадров':>8}{'мс/кадр':>10}{'медиана':>10}{'макс':>10}{'addstr/кадр':>13}"]
+    for result in results:
+        lines.append(f"{result['scenario']:<14}{result['frames']:>8}{result['ms_per_frame']:>10.3f}"
+                     f"{result['ms_median']:>10.3f}{result['ms_max']:>10.3f}{result['addstr_per_frame']:>13.1f}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входа командной строки"""
+    parser = argparse.ArgumentParser(description="Замер стоимости отрисовки интерфейса на заменителе экрана")
+    parser.add_argument('--frames', type=int, default=300, help="Кадров (нажатий клавиш) на сценарий")
+    parser.add_argument('--items', type=int, default=2000, help="Предметов в инвентаре")
+    parser.add_argument('--battles', type=int, default=10000, help="Битв в статистике")
+    parser.add_argument('--height', type=int, default=DEFAULT_HEIGHT, help="Высота экрана")
+    parser.add_argument('--width', type=int, default=DEFAULT_WIDTH, help="Ширина экрана")
+    parser.add_argument('--seed', type=int, default=0, help="Зерно генератора случайных чисел")
+    parser.add_argument('--output', default=None, help="Сохранить результаты в JSON-файл")
+    args = parser.parse_args(argv)
+
+    results = run_all(args.frames, args.items, args.battles, args.height, args.width, args.seed)
+    print(format_report(results))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,5 +1,6 @@
 # Characters/Abilities/basic_attack.py
 
+from Battle.battle_context import messages_enabled
 from Battle.battle_logger import battle_logger
 from Battle.base_mechanics import GameMechanics
 from Characters.Abilities.ability import ActiveAbility, AbilityResult
@@ -20,7 +21,7 @@ class Attack(ActiveAbility):
     
     def execute(self, character, targets, **kwargs):
         """Выполняет базовую атаку по одной цели."""
-        result = AbilityResult()
+        result = AbilityResult.acquire()
         result.ability_type = "basic_attack"
         result.character = character.name
         
@@ -49,8 +50,9 @@ class Attack(ActiveAbility):
         
         # Формируем сообщение и финальные данные
         if mechanics_results['dodge_success']:
-            # Цель уклонилась - используем сообщение из механик
-            result.messages = [mechanics_results['dodge_message']]
+            # Цель уклонилась - используем сообщение из механик (в тихом режиме его нет)
+            if mechanics_results['dodge_message'] is not None:
+                result.messages.append(mechanics_results['dodge_message'])
             result.details['dodge'] = True
             result.details['target_alive'] = target.is_alive()
         else:
@@ -66,11 +68,12 @@ class Attack(ActiveAbility):
             result.details['target_alive'] = target.is_alive()
             
             # Создаем сообщение об успешной атаке
-            result.messages = [self._create_attack_message(
-                character, target, damage=actual_damage, 
-                blocked=mechanics_results['blocked_damage'], 
-                is_critical=mechanics_results['critical_hit']
-            )]
+            if messages_enabled():
+                result.messages.append(self._create_attack_message(
+                    character, target, damage=actual_damage, 
+                    blocked=mechanics_results['blocked_damage'], 
+                    is_critical=mechanics_results['critical_hit']
+                ))
         
         return result
     
@@ -1,6 +1,7 @@
 # characters/abilities/attack/backstab.py
 
 from typing import List, Dict, Any, Optional
+from Battle.battle_context import messages_enabled
 from Battle.battle_logger import battle_logger
 from Battle.base_mechanics import GameMechanics
 from Characters.Abilities.ability import ActiveAbility, AbilityResult
@@ -23,7 +24,7 @@ class Backstab(ActiveAbility):
     
     def execute(self, character: Character, targets: List[Character], **kwargs: Any) -> AbilityResult:
         """Выполняет удар в спину по одной цели."""
-        result: AbilityResult = AbilityResult()
+        result: AbilityResult = AbilityResult.acquire()
         result.ability_type = "backstab"
         result.character = character.name
         
@@ -39,10 +40,12 @@ class Backstab(ActiveAbility):
         # Рассчитываем базовый урон с бонусом
         base_damage: int = int(character.derived_stats.attack * self.damage_scale)
         
-        # Создаем начальное сообщение
-        template: str = "%1 %2 заходит за спину %3"
-        elements: List[tuple] = [(self.icon, 0), (character.name, COLOR_GREEN), (target.name, COLOR_BLUE)]
-        result.messages = [battle_logger.create_log_message(template, elements)]
+        # Создаем начальное сообщение (в тихом режиме сообщения не формируются)
+        verbose: bool = messages_enabled()
+        if verbose:
+            template: str = "%1 %2 заходит за спину %3"
+            elements: List[tuple] = [(self.icon, 0), (character.name, COLOR_GREEN), (target.name, COLOR_BLUE)]
+            result.messages.append(battle_logger.create_log_message(template, elements))
         
         # Применяем игровые механики
         mechanics_results: Dict[str, Any] = GameMechanics.apply_all_mechanics(self, character, target, base_damage)
@@ -58,9 +61,10 @@ class Backstab(ActiveAbility):
         if mechanics_results['dodge_success']:
             # Цель уклонилась
             target_info['message'] = mechanics_results['dodge_message']
-            dodge_template: str = "  🔸 %1 замечает атаку и уклоняется!"
-            dodge_elements: List[tuple] = [(target.name, 4)]
-            result.messages.append(battle_logger.create_log_message(dodge_template, dodge_elements))
+            if verbose:
+                dodge_template: str = "  🔸 %1 замечает атаку и уклоняется!"
+                dodge_elements: List[tuple] = [(target.name, 4)]
+                result.messages.append(battle_logger.create_log_message(dodge_template, dodge_elements))
             result.success = False
         else:
             # Атака прошла, наносим урон
@@ -77,17 +81,16 @@ class Backstab(ActiveAbility):
             result.success = True
             
             # Добавляем сообщение о уроне
-            if mechanics_results['critical_hit']:
-                damage_template: str = f"  {DAMAGE_LIST_ICON} %1 получает %2 КРИТИЧЕСКОГО урона в спину (%3 заблокировано) 💥"
-            else:
-                damage_template: str = f"  {DAMAGE_LIST_ICON} %1 получает %2 урона в спину (%3 заблокировано)"
-                
-            damage_elements: List[tuple] = [(target.name, COLOR_BLUE), 
-                    (str(actual_damage), COLOR_RED), (str(mechanics_results['blocked_damage']), COLOR_YELLOW)]
-            
-
+            if verbose:
+                if mechanics_results['critical_hit']:
+                    damage_template: str = f"  {DAMAGE_LIST_ICON} %1 получает %2 КРИТИЧЕСКОГО урона в спину (%3 заблокировано) 💥"
+                else:
+                    damage_template: str = f"  {DAMAGE_LIST_ICON} %1 получает %2 урона в спину (%3 заблокировано)"
+                    
+                damage_elements: List[tuple] = [(target.name, COLOR_BLUE), 
+                        (str(actual_damage), COLOR_RED), (str(mechanics_results['blocked_damage']), COLOR_YELLOW)]
 
-            result.messages.append(battle_logger.create_log_message(damage_template, damage_elements))
+                result.messages.append(battle_logger.create_log_message(damage_template, damage_elements))
         
         result.details['target_info'] = target_info
         return result
@@ -1,6 +1,7 @@
 # characters/abilities/attack/fireball.py
 
 from typing import List, Dict, Any
+from Battle.battle_context import messages_enabled
 from Battle.battle_logger import battle_logger
 from Battle.base_mechanics import GameMechanics
 from Characters.Abilities.ability import ActiveAbility, AbilityResult
@@ -34,7 +35,7 @@ class Fireball(ActiveAbility):
         :param kwargs: Дополнительные параметры
         :return: Результат выполнения способности
         """
-        result: AbilityResult = AbilityResult()
+        result: AbilityResult = AbilityResult.acquire()
         result.ability_type = "fireball"
         result.character = character
         result.targets = targets
@@ -50,10 +51,12 @@ class Fireball(ActiveAbility):
         # Рассчитываем базовый урон
         base_damage: int = int(character.stats.intelligence * self.damage_scale)
         
-        # Создаем начальное сообщение
-        template: str = "%1 %2 выпускает огненный шар в %3"
-        elements: List[tuple] = [(self.icon, 0), (character.name, COLOR_GREEN), (target.name, COLOR_BLUE)]
-        result.messages = [battle_logger.create_log_message(template, elements)]
+        # Создаем начальное сообщение (в тихом режиме сообщения не формируются)
+        verbose: bool = messages_enabled()
+        if verbose:
+            template: str = "%1 %2 выпускает огненный шар в %3"
+            elements: List[tuple] = [(self.icon, 0), (character.name, COLOR_GREEN), (target.name, COLOR_BLUE)]
+            result.messages.append(battle_logger.create_log_message(template, elements))
         
         # Применяем игровые механики
         mechanics_results: Dict[str, Any] = GameMechanics.apply_all_mechanics(self, character, target, base_damage)
@@ -69,9 +72,10 @@ class Fireball(ActiveAbility):
         if mechanics_results['dodge_success']:
             # Цель уклонилась
             target_info['message'] = mechanics_results['dodge_message']
-            dodge_template: str = "  🔸 %1 уворачивается от огненного шара!"
-            dodge_elements: List[tuple] = [(target.name, COLOR_BLUE)]
-            result.messages.append(battle_logger.create_log_message(dodge_template, dodge_elements))
+            if verbose:
+                dodge_template: str = "  🔸 %1 уворачивается от огненного шара!"
+                dodge_elements: List[tuple] = [(target.name, COLOR_BLUE)]
+                result.messages.append(battle_logger.create_log_message(dodge_template, dodge_elements))
             result.success = False
         else:
             # Атака прошла, наносим урон
@@ -93,21 +97,21 @@ class Fireball(ActiveAbility):
             result.success = True
             
             # Добавляем сообщение о уроне
-            damage_template: str = ""
-            if mechanics_results['critical_hit']:
-                damage_template = f"  {DAMAGE_LIST_ICON} %1 получает %2 КРИТИЧЕСКОГО огненного урона (%3 заблокировано) 💥"
-            else:
-                damage_template = f"  {DAMAGE_LIST_ICON} %1 получает %2 огненного урона (%3 заблокировано)"
+            if verbose:
+                damage_template: str = ""
+                if mechanics_results['critical_hit']:
+                    damage_template = f"  {DAMAGE_LIST_ICON} %1 получает %2 КРИТИЧЕСКОГО огненного урона (%3 заблокировано) 💥"
+                else:
+                    damage_template = f"  {DAMAGE_LIST_ICON} %1 получает %2 огненного урона (%3 заблокировано)"
+                    
+                damage_elements: List[tuple] = [(target.name, COLOR_BLUE), 
+                                              (str(actual_damage), COLOR_RED), 
+                                              (str(mechanics_results['blocked_damage']), COLOR_YELLOW)]
                 
-            damage_elements: List[tuple] = [(target.name, COLOR_BLUE), 
-                                          (str(actual_damage), COLOR_RED), 
-                                          (str(mechanics_results['blocked_damage']), COLOR_YELLOW)]
-            
-            message = battle_logger.create_log_message(damage_template, damage_elements)
-            result.messages.append(message)
-            
-            for apply_effect_result in apply_effect_result_list:
-                result.messages.append(apply_effect_result.message)
+                message = battle_logger.create_log_message(damage_template, damage_elements)
+                result.messages.append(message)
+
+            self.add_effect_messages(result, apply_effect_result_list, verbose)
             
         result.details['target_info'] = target_info
         return result
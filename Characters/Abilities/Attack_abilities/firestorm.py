@@ -1,6 +1,7 @@
 # characters/abilities/attack/fire_storm.py
 
 from typing import List, Dict, Any
+from Battle.battle_context import messages_enabled
 from Battle.battle_logger import battle_logger
 from Battle.base_mechanics import GameMechanics
 from Characters.Abilities.ability import ActiveAbility, AbilityResult
@@ -35,7 +36,7 @@ class FireStorm(ActiveAbility):
         :param kwargs: Дополнительные параметры
         :return: Результат выполнения способности
         """
-        result: AbilityResult = AbilityResult()
+        result: AbilityResult = AbilityResult.acquire()
         result.ability_type = "fire_storm"
         result.character = character
         result.targets = targets
@@ -50,10 +51,12 @@ class FireStorm(ActiveAbility):
         # Рассчитываем базовый урон
         base_damage: int = int(character.stats.intelligence * self.damage_scale)
         
-        # Создаем начальное сообщение
-        template: str = "%1 %2 призывает огненный шторм!"
-        elements: List[tuple] = [(self.icon, 0), (character.name, COLOR_GREEN), ("", 0)]
-        result.messages = [battle_logger.create_log_message(template, elements)]
+        # Создаем начальное сообщение (в тихом режиме сообщения не формируются)
+        verbose: bool = messages_enabled()
+        if verbose:
+            template: str = "%1 %2 призывает огненный шторм!"
+            elements: List[tuple] = [(self.icon, 0), (character.name, COLOR_GREEN), ("", 0)]
+            result.messages.append(battle_logger.create_log_message(template, elements))
         
         # Общая статистика
         result.total_damage = 0
@@ -66,9 +69,10 @@ class FireStorm(ActiveAbility):
             
             if mechanics_results['dodge_success']:
                 # Цель уклонилась
-                dodge_template: str = "  🔸 %1 уворачивается от огненного шторма!"
-                dodge_elements: List[tuple] = [(target.name, COLOR_BLUE)]
-                result.messages.append(battle_logger.create_log_message(dodge_template, dodge_elements))
+                if verbose:
+                    dodge_template: str = "  🔸 %1 уворачивается от огненного шторма!"
+                    dodge_elements: List[tuple] = [(target.name, COLOR_BLUE)]
+                    result.messages.append(battle_logger.create_log_message(dodge_template, dodge_elements))
             else:
                 # Атака прошла, наносим урон
                 actual_damage: int = mechanics_results['final_damage']
@@ -83,21 +87,21 @@ class FireStorm(ActiveAbility):
                 total_effects_applied += len(apply_effect_result_list)
                 
                 # Добавляем сообщение о уроне
-                damage_template: str = ""
-                if mechanics_results['critical_hit']:
-                    damage_template = f"  {DAMAGE_LIST_ICON} %1 получает %2 КРИТИЧЕСКОГО огненного урона (%3 заблокировано) 💥"
-                else:
-                    damage_template = f"  {DAMAGE_LIST_ICON} %1 получает %2 огненного урона (%3 заблокировано)"
+                if verbose:
+                    damage_template: str = ""
+                    if mechanics_results['critical_hit']:
+                        damage_template = f"  {DAMAGE_LIST_ICON} %1 получает %2 КРИТИЧЕСКОГО огненного урона (%3 заблокировано) 💥"
+                    else:
+                        damage_template = f"  {DAMAGE_LIST_ICON} %1 получает %2 огненного урона (%3 заблокировано)"
+                        
+                    damage_elements: List[tuple] = [(target.name, COLOR_BLUE), 
+                                                  (str(actual_damage), COLOR_RED), 
+                                                  (str(mechanics_results['blocked_damage']), COLOR_YELLOW)]
                     
-                damage_elements: List[tuple] = [(target.name, COLOR_BLUE), 
-                                              (str(actual_damage), COLOR_RED), 
-                                              (str(mechanics_results['blocked_damage']), COLOR_YELLOW)]
-                
-                message = battle_logger.create_log_message(damage_template, damage_elements)
-                result.messages.append(message)
-                
-                for apply_effect_result in apply_effect_result_list:
-                    result.messages.append(apply_effect_result.message)
+                    message = battle_logger.create_log_message(damage_template, damage_elements)
+                    result.messages.append(message)
+
+                self.add_effect_messages(result, apply_effect_result_list, verbose)
         
         result.success = True
         result.details['targets_hit'] = len(alive_targets)
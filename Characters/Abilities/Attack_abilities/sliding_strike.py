@@ -1,6 +1,7 @@
 # characters/abilities/attack/sliding_strike.py
 
 from typing import List, Dict, Any
+from Battle.battle_context import messages_enabled
 from Battle.battle_logger import battle_logger
 from Battle.base_mechanics import GameMechanics
 from Characters.Abilities.ability import ActiveAbility, AbilityResult
@@ -27,7 +28,7 @@ class SlidingStrike(ActiveAbility):
     
     def execute(self, character: 'Character', targets: List[Character], **kwargs: Any) -> AbilityResult:
         """Выполняет скользящий удар по всем врагам."""
-        result: AbilityResult = AbilityResult()
+        result: AbilityResult = AbilityResult.acquire()
         result.ability_type = "sliding_strike"
         result.character = character
         
@@ -45,10 +46,12 @@ class SlidingStrike(ActiveAbility):
         # Рассчитываем базовый урон
         base_damage: int = int(character.derived_stats.attack * self.damage_scale)
         
-        # Создаем начальное сообщение
-        template: str = "%1 %2 совершает скользящий удар по врагам!"
-        elements: List[tuple] = [(self.icon, 0), (character.name, COLOR_GREEN)]
-        result.messages = [battle_logger.create_log_message(template, elements)]
+        # Создаем начальное сообщение (в тихом режиме сообщения не формируются)
+        verbose: bool = messages_enabled()
+        if verbose:
+            template: str = "%1 %2 совершает скользящий удар по врагам!"
+            elements: List[tuple] = [(self.icon, 0), (character.name, COLOR_GREEN)]
+            result.messages.append(battle_logger.create_log_message(template, elements))
         
         # Атакуем каждую цель
         total_damage = 0
@@ -69,9 +72,10 @@ class SlidingStrike(ActiveAbility):
             if mechanics_results['dodge_success']:
                 # Цель уклонилась
                 target_info['message'] = mechanics_results['dodge_message']
-                dodge_template: str = "  🔸 %1 уклоняется от скользящего удара!"
-                dodge_elements: List[tuple] = [(target.name, COLOR_BLUE)]
-                result.messages.append(battle_logger.create_log_message(dodge_template, dodge_elements))
+                if verbose:
+                    dodge_template: str = "  🔸 %1 уклоняется от скользящего удара!"
+                    dodge_elements: List[tuple] = [(target.name, COLOR_BLUE)]
+                    result.messages.append(battle_logger.create_log_message(dodge_template, dodge_elements))
             else:
                 # Атака прошла, наносим урон
                 actual_damage: int = mechanics_results['final_damage']
@@ -92,20 +96,20 @@ class SlidingStrike(ActiveAbility):
                 total_damage += actual_damage
                 
                 # Добавляем сообщение о уроне
-                damage_template: str = ""
-                if mechanics_results['critical_hit']:
-                    damage_template = f"  {DAMAGE_LIST_ICON} %1 получает %2 КРИТИЧЕСКОГО урона от скользящего удара! (%3 заблокировано) 💥"
-                else:
-                    damage_template = f"  {DAMAGE_LIST_ICON} %1 получает %2 урона от скользящего удара. (%3 заблокировано)"
-                
-                damage_elements: List[tuple] = [(target.name, COLOR_BLUE), 
-                                              (str(actual_damage), COLOR_RED), 
-                                              (str(mechanics_results['blocked_damage']), COLOR_YELLOW)]
-                
-                result.messages.append(battle_logger.create_log_message(damage_template, damage_elements))
+                if verbose:
+                    damage_template: str = ""
+                    if mechanics_results['critical_hit']:
+                        damage_template = f"  {DAMAGE_LIST_ICON} %1 получает %2 КРИТИЧЕСКОГО урона от скользящего удара! (%3 заблокировано) 💥"
+                    else:
+                        damage_template = f"  {DAMAGE_LIST_ICON} %1 получает %2 урона от скользящего удара. (%3 заблокировано)"
+                    
+                    damage_elements: List[tuple] = [(target.name, COLOR_BLUE), 
+                                                  (str(actual_damage), COLOR_RED), 
+                                                  (str(mechanics_results['blocked_damage']), COLOR_YELLOW)]
+                    
+                    result.messages.append(battle_logger.create_log_message(damage_template, damage_elements))
 
-                for apply_effect_result in apply_effect_result_list:
-                    result.messages.append(apply_effect_result.message)
+                self.add_effect_messages(result, apply_effect_result_list, verbose)
             
             target_details[target.name] = target_info
         
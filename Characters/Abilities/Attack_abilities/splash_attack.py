@@ -1,5 +1,6 @@
 # Characters/Abilities/splash_attack.py
 
+from Battle.battle_context import messages_enabled
 from Battle.battle_logger import battle_logger
 from Battle.base_mechanics import GameMechanics
 from Characters.Abilities.ability import ActiveAbility, AbilityResult
@@ -20,7 +21,7 @@ class SplashAttack(ActiveAbility):
     
     def execute(self, character, targets, **kwargs):
         """Выполняет сплэш атаку по всем целям."""
-        result = AbilityResult()
+        result = AbilityResult.acquire()
         result.ability_type = "splash_attack"
         result.character = character.name
         
@@ -75,11 +76,12 @@ class SplashAttack(ActiveAbility):
         result.total_damage = total_damage
         result.details['targets_info'] = target_details
         
-        # Создаем общее сообщение
-        template = "%1 %2 использует Сплэш Атаку по %3 целям!"
-        elements = [(self.icon, 0), (character.name, 2), (str(len(alive_targets)), 1)]
-        
-        result.messages = [battle_logger.create_log_message(template, elements)]
+        # Создаем общее сообщение (в тихом режиме сообщения не формируются)
+        if messages_enabled():
+            template = "%1 %2 использует Сплэш Атаку по %3 целям!"
+            elements = [(self.icon, 0), (character.name, 2), (str(len(alive_targets)), 1)]
+            
+            result.messages.append(battle_logger.create_log_message(template, elements))
         
         return result
     
@@ -1,10 +1,11 @@
 # Characters/Abilities/volley_ability.py
 
+from Battle.battle_context import messages_enabled
 from Battle.battle_logger import battle_logger
 from Battle.base_mechanics import GameMechanics
-from Characters.Abilities.ability import Ability, AbilityResult
+from Characters.Abilities.ability import ActiveAbility, AbilityResult
 
-class Volley(Ability):
+class Volley(ActiveAbility):
     """Способность: Град стрел - массовая атака по всем врагам"""
     
     def __init__(self):
@@ -21,9 +22,9 @@ class Volley(Ability):
     
     def execute(self, character, targets, **kwargs):
         """Выполняет массовую атаку по всем врагам."""
-        result = AbilityResult()
+        result = AbilityResult.acquire()
         result.ability_type = "volley"
-        result.character = character.name
+        result.character = character
         
         # Фильтруем живые цели
         alive_targets = [target for target in targets if target.is_alive()]
@@ -33,7 +34,7 @@ class Volley(Ability):
             result.reason = 'Нет целей для атаки'
             return result
         
-        result.targets = [target.name for target in alive_targets]
+        result.targets = alive_targets
         
         # Рассчитываем базовый урон
         base_damage = int(character.derived_stats.attack * self.damage_scale)
@@ -42,10 +43,12 @@ class Volley(Ability):
         total_damage = 0
         target_details = {}
         
-        # Создаем начальное сообщение
-        template = "%1 %2 запускает способность Град стрел!"
-        elements = [(self.icon, 0), (character.name, 2)]
-        result.messages = [battle_logger.create_log_message(template, elements)]
+        # Создаем начальное сообщение (в тихом режиме сообщения не формируются)
+        verbose = messages_enabled()
+        if verbose:
+            template = "%1 %2 запускает способность Град стрел!"
+            elements = [(self.icon, 0), (character.name, 2)]
+            result.messages.append(battle_logger.create_log_message(template, elements))
         
         for target in alive_targets:
             mechanics_results = GameMechanics.apply_all_mechanics(self, character, target, base_damage)
@@ -62,9 +65,10 @@ class Volley(Ability):
                 # Цель уклонилась
                 target_info['message'] = mechanics_results['dodge_message']
                 # Добавляем сообщение об уклонении
-                dodge_template = "  🔸 %1 уклоняется от стрел!"
-                dodge_elements = [(target.name, 4)]
-                result.messages.append(battle_logger.create_log_message(dodge_template, dodge_elements))
+                if verbose:
+                    dodge_template = "  🔸 %1 уклоняется от стрел!"
+                    dodge_elements = [(target.name, 4)]
+                    result.messages.append(battle_logger.create_log_message(dodge_template, dodge_elements))
             else:
                 # Атака прошла, наносим урон
                 actual_damage = mechanics_results['final_damage']
@@ -79,15 +83,16 @@ class Volley(Ability):
                 total_damage += actual_damage
                 
                 # Добавляем детальное сообщение о уроне по цели
-                if mechanics_results['critical_hit']:
-                    damage_template = "  🔸 %1 получает %2 КРИТИЧЕСКОГО урона (%3 заблокировано) %4"
-                    crit_text = "💥" if actual_damage > 0 else ""
-                    damage_elements = [(target.name, 4), (str(actual_damage), 1), (str(mechanics_results['blocked_damage']), 3), (crit_text, 0)]
-                else:
-                    damage_template = "  🔸 %1 получает %2 урона (%3 заблокировано)"
-                    damage_elements = [(target.name, 4), (str(actual_damage), 1), (str(mechanics_results['blocked_damage']), 3)]
-                
-                result.messages.append(battle_logger.create_log_message(damage_template, damage_elements))
+                if verbose:
+                    if mechanics_results['critical_hit']:
+                        damage_template = "  🔸 %1 получает %2 КРИТИЧЕСКОГО урона (%3 заблокировано) %4"
+                        crit_text = "💥" if actual_damage > 0 else ""
+                        damage_elements = [(target.name, 4), (str(actual_damage), 1), (str(mechanics_results['blocked_damage']), 3), (crit_text, 0)]
+                    else:
+                        damage_template = "  🔸 %1 получает %2 урона (%3 заблокировано)"
+                        damage_elements = [(target.name, 4), (str(actual_damage), 1), (str(mechanics_results['blocked_damage']), 3)]
+                    
+                    result.messages.append(battle_logger.create_log_message(damage_template, damage_elements))
             
             target_details[target.name] = target_info
         
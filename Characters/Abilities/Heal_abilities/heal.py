@@ -1,6 +1,7 @@
 # Characters/Abilities/heal_ability.py
 
 import random
+from Battle.battle_context import messages_enabled
 from Battle.battle_logger import battle_logger
 from Battle.base_mechanics import GameMechanics
 from Characters.Abilities.ability import ActiveAbility, AbilityResult
@@ -22,7 +23,7 @@ class Heal(ActiveAbility):
     
     def execute(self, character, targets, **kwargs):
         """Выполняет лечение одного союзника."""
-        result = AbilityResult()
+        result = AbilityResult.acquire()
         result.ability_type = "heal"
         result.character = character.name
         
@@ -59,7 +60,9 @@ class Heal(ActiveAbility):
         result.total_heal = actual_heal
         result.is_critical = mechanics_results['critical_hit']
         
-        # Создаем сообщение
+        # Создаем сообщение (в тихом режиме достаточно числовых результатов)
+        if not messages_enabled():
+            return result
         if mechanics_results['critical_hit']:
             template = "%1 %2 лечит %3 на %4 КРИТИЧЕСКОГО здоровья! %5"
             crit_text = "✨" if actual_heal > 0 else ""
@@ -68,7 +71,7 @@ class Heal(ActiveAbility):
             template = "%1 %2 лечит %3 на %4 здоровья."
             elements = [(self.icon, 0), (character.name, 2), (target.name, 2), (str(actual_heal), 3)]
         
-        result.messages = [battle_logger.create_log_message(template, elements)]
+        result.messages.append(battle_logger.create_log_message(template, elements))
         
         return result
     
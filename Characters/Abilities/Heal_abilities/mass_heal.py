@@ -1,6 +1,7 @@
 # Characters/Abilities/mass_heal_ability.py
 
 import random
+from Battle.battle_context import messages_enabled
 from Battle.battle_logger import battle_logger
 from Battle.base_mechanics import GameMechanics
 from Characters.Abilities.ability import ActiveAbility, AbilityResult
@@ -23,7 +24,7 @@ class MassHeal(ActiveAbility):
     
     def execute(self, character, targets, **kwargs):
         """Выполняет массовое лечение всех союзников."""
-        result = AbilityResult()
+        result = AbilityResult.acquire()
         result.ability_type = "mass_heal"
         result.character = character.name
         
@@ -66,7 +67,9 @@ class MassHeal(ActiveAbility):
         result.is_critical = is_critical
         result.details['healed_targets'] = healed_targets
         
-        # Создаем детализированное сообщение
+        # Создаем детализированное сообщение (в тихом режиме достаточно числовых результатов)
+        if not messages_enabled():
+            return result
         if is_critical:
             message_template = "%1 %2 использует массовое лечение и восстанавливает %3 здоровья! %4"
             crit_text = "🌟" if total_healed > 0 else ""
@@ -75,7 +78,6 @@ class MassHeal(ActiveAbility):
             message_template = "%1 %2 использует массовое лечение и восстанавливает %3 здоровья."
             message_elements = [(self.icon, 0), (character.name, 2), (str(total_healed), 3)]
         
-        result.messages = []
         result.messages.append(battle_logger.create_log_message(message_template, message_elements))
 
         # Добавляем детали по каждому союзнику (упрощенный формат)
@@ -1,5 +1,6 @@
 # Characters/Abilities/rest_ability.py
 
+from Battle.battle_context import messages_enabled
 from Battle.battle_logger import battle_logger
 from Characters.Abilities.ability import ActiveAbility, AbilityResult
 
@@ -21,7 +22,7 @@ class Rest(ActiveAbility):
     
     def execute(self, character, targets, **kwargs):
         """Выполняет отдых и восстанавливает энергию."""
-        result = AbilityResult()
+        result = AbilityResult.acquire()
         result.ability_type = "rest"
         result.character = character.name
         
@@ -39,11 +40,13 @@ class Rest(ActiveAbility):
         result.details['old_energy'] = old_energy
         result.details['new_energy'] = character.energy if hasattr(character, 'energy') else 0
             
-        # Создаем сообщение
+        # Создаем сообщение (в тихом режиме достаточно числовых результатов)
+        if not messages_enabled():
+            return result
         template = "%1 %2 отдыхает и восстанавливает %3 энергии!"
         elements = [(self.icon, 0), (character.name, 2), (str(actual_restore), 6)]
         
-        result.messages = [battle_logger.create_log_message(template, elements)]
+        result.messages.append(battle_logger.create_log_message(template, elements))
             
         return result
     
@@ -4,10 +4,12 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, TYPE_CHECKING, Type
 
+from Utils.object_pool import PooledObject, release_object
 from Utils.types import IApplyEffectResult
 
 if TYPE_CHECKING:
     from Characters.character import Character
+    from Characters.Abilities.cooldown_scheduler import CooldownScheduler
     from Characters.Status_effects.status_effect import Status_effect  # Предполагаемый импорт для типизации
 
 # ==================== Результат информации о способности ====================
@@ -28,8 +30,13 @@ class AbilityInfo:
 
 # ==================== Результат способности ====================
 @dataclass
-class AbilityResult:
-    """Класс для возврата результатов из способностей."""
+class AbilityResult(PooledObject):
+    """
+    Класс для возврата результатов из способностей.
+
+    Результаты берутся из пула (AbilityResult.acquire()) и возвращаются
+    в него после обработки в log_result.
+    """
     
     # Универсальные свойства для всех способностей
     success: bool = True
@@ -46,6 +53,23 @@ class AbilityResult:
     reason: str = ""  # Причина неудачи
     details: Dict[str, Any] = field(default_factory=dict)  # Для дополнительной информации
 
+    def reset(self) -> None:
+        """Сбрасывает результат для повторного использования."""
+        self.success = True
+        self.ability_type = ""
+        self.character = None
+        # Список целей обычно принадлежит вызывающему коду - не очищаем его
+        self.targets = []
+        self.messages.clear()
+        self.damage_dealt = 0
+        self.heal_amount = 0
+        self.energy_restored = 0
+        self.is_critical = False
+        self.total_damage = 0
+        self.total_heal = 0
+        self.reason = ""
+        self.details.clear()
+
 
 # ==================== Базовый класс способности ====================
 class Ability(ABC):
@@ -126,9 +150,38 @@ class ActiveAbility(Ability):
         self.energy_cost: int = energy_cost
         self.is_mass: bool = is_mass
         self.cooldown: int = cooldown
-        self.current_cooldown: int = 0
+        self._cooldown_scheduler: Optional['CooldownScheduler'] = None  # Назначается менеджером способностей
+        self._current_cooldown: int = 0
         self._applied_effects: Optional[List[Type['Status_effect']]] = None  # Ленивая инициализация
     
+    # ==================== Кулдаун ====================
+    @property
+    def current_cooldown(self) -> int:
+        """Оставшийся кулдаун способности в раундах"""
+        if self._cooldown_scheduler is not None:
+            return self._cooldown_scheduler.get_remaining(self)
+        return self._current_cooldown
+
+    @current_cooldown.setter
+    def current_cooldown(self, value: int) -> None:
+        if self._cooldown_scheduler is not None:
+            self._cooldown_scheduler.schedule(self, value)
+        else:
+            self._current_cooldown = max(0, value)
+
+    def attach_cooldown_scheduler(self, scheduler: Optional['CooldownScheduler']) -> None:
+        """
+        Привязывает способность к планировщику кулдаунов персонажа.
+
+        :param scheduler: Планировщик кулдаунов (None - отвязать)
+        """
+        remaining = self.current_cooldown
+        if self._cooldown_scheduler is not None:
+            self._cooldown_scheduler.cancel(self)
+        self._cooldown_scheduler = scheduler
+        self._current_cooldown = 0
+        self.current_cooldown = remaining
+
     # ==================== Управление эффектами ====================
     @property
     def applied_effects(self) -> List[Type['Status_effect']]:
@@ -220,6 +273,22 @@ class ActiveAbility(Ability):
             apply_effect_results_list.append(apply_effect_result)
 
         return apply_effect_results_list
+
+    @staticmethod
+    def add_effect_messages(result: AbilityResult, apply_effect_results: List[IApplyEffectResult],
+                            build_messages: bool = True) -> None:
+        """
+        Переносит сообщения о наложенных эффектах в результат способности
+        и возвращает результаты наложения в пул.
+        
+        :param result: Результат способности
+        :param apply_effect_results: Результаты apply_effects_with_chance
+        :param build_messages: Добавлять ли сообщения (в тихом режиме их нет)
+        """
+        for apply_effect_result in apply_effect_results:
+            if build_messages:
+                result.messages.append(apply_effect_result.message)
+            release_object(apply_effect_result)
     
     # ==================== Проверка возможности использования ====================
     def can_use(self, character: 'Character', targets: Optional[List['Character']] = None) -> bool:
@@ -263,7 +332,7 @@ class ActiveAbility(Ability):
         :return: Результат использования способности
         """
         if not self.can_use(character, targets):
-            result = AbilityResult()
+            result = AbilityResult.acquire()
             result.success = False
             result.reason = "Невозможно использовать способность"
             result.ability_type = self.__class__.__name__.lower()
@@ -294,9 +363,12 @@ class ActiveAbility(Ability):
     
     # ==================== Управление кулдауном ====================
     def update_cooldown(self) -> None:
-        """Обновляет кулдаун способности в конце раунда."""
-        if self.current_cooldown > 0:
-            self.current_cooldown -= 1
+        """
+        Обновляет кулдаун способности в конце раунда.
+        Если способность привязана к планировщику, кулдаун продвигает он.
+        """
+        if self._cooldown_scheduler is None and self._current_cooldown > 0:
+            self._current_cooldown -= 1
     
     def on_use(self, character: 'Character', targets: List['Character'], result: AbilityResult) -> None:
         """
@@ -345,7 +417,7 @@ class PassiveAbility(Ability):
         """
         Пассивные способности не могут быть использованы напрямую.
         """
-        result = AbilityResult()
+        result = AbilityResult.acquire()
         result.success = False
         result.reason = "Пассивные способности нельзя использовать напрямую"
         result.ability_type = self.__class__.__name__.lower()
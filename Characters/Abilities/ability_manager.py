@@ -6,10 +6,13 @@ import os
 import random
 import re
 import importlib.util
+import threading
 from typing import Dict, Iterable, List, Any, Optional, TypeVar, Union
 
+from Battle.battle_metrics import ABILITY_EXECUTION, current_timing
 from Config.game_config import ABILITIES_PATH
 from Characters.Abilities.ability import ActiveAbility, PassiveAbility, AbilityResult
+from Characters.Abilities.cooldown_scheduler import CooldownScheduler
 
 
 T = TypeVar('T')
@@ -30,13 +33,18 @@ class AbilityLoader:
         """Инициализация загрузчика способностей"""
         if not self._initialized:
             self.root_folder: str = root_folder or 'Characters/Abilities'
-            self._class_map: Dict[str, type] = {}
+            self._class_paths: Dict[str, str] = {}  # Имя класса -> файл способности
+            self._class_map: Dict[str, type] = {}  # Уже загруженные классы
+            self._load_lock = threading.Lock()  # Способности могут понадобиться потоку боя
             self._scan_abilities()
             self.__class__._initialized = True
     
     # ==================== Загрузка способностей ====================
     def _scan_abilities(self) -> None:
-        """Сканирует все файлы способностей и сохраняет классы этих способностей"""
+        """
+        Сканирует файлы способностей и запоминает, в каком файле какой класс.
+        Сами модули выполняются при первом запросе класса (см. get_class).
+        """
         base_path = os.path.normpath(ABILITIES_PATH)
         
         if not os.path.exists(base_path):
@@ -52,15 +60,9 @@ class AbilityLoader:
                 if (filename.endswith('.py') and 
                     filename not in ['__init__.py', 'ability_base.py', 'abilities.py']):
                     full_path = os.path.join(dirpath, filename)
-                    
-                    # Загружаем класс сразу при сканировании
-                    try:
-                        class_name = self._get_class_name_from_file(full_path)
-                        if class_name:
-                            ability_class = self._load_class_from_file(full_path, class_name)
-                            self._class_map[class_name] = ability_class
-                    except Exception as e:
-                        print(f"Warning: Failed to load ability class from '{full_path}': {str(e)}")
+                    class_name = self._get_class_name_from_file(full_path)
+                    if class_name:
+                        self._class_paths[class_name] = full_path
     
     def _get_class_name_from_file(self, file_path: str) -> Optional[str]:
         """Получает имя первого класса из файла Python"""
@@ -89,16 +91,29 @@ class AbilityLoader:
     
     # ==================== Публичный API ====================
     def get_class(self, class_name: str) -> type:
-        """Получает класс способности по имени"""
+        """Получает класс способности по имени (файл загружается при первом запросе)"""
+        ability_class = self._class_map.get(class_name)
+        if ability_class is not None:
+            return ability_class
+        
+        with self._load_lock:
+            if class_name not in self._class_map and class_name in self._class_paths:
+                full_path = self._class_paths[class_name]
+                try:
+                    self._class_map[class_name] = self._load_class_from_file(full_path, class_name)
+                except Exception as e:
+                    del self._class_paths[class_name]
+                    print(f"Warning: Failed to load ability class from '{full_path}': {str(e)}")
+        
         if class_name not in self._class_map:
-            available_abilities = list(self._class_map.keys())
+            available_abilities = list(self._class_paths.keys())
             raise FileNotFoundError(f"Ability class '{class_name}' not found. Available abilities: {available_abilities}")
         
         return self._class_map[class_name]
     
     def get_available_abilities(self) -> List[str]:
-        """Возвращает список доступных имен способностей"""
-        return list(self._class_map.keys())
+        """Возвращает список доступных имен способностей (без загрузки их файлов)"""
+        return list(self._class_paths.keys())
     
     # ==================== Singleton management ====================
     @classmethod
@@ -124,6 +139,9 @@ class AbilityManager:
         self.active_abilities: Dict[str, ActiveAbility] = {}
         self.passive_abilities: Dict[str, PassiveAbility] = {}
         
+        # Кулдауны активных способностей по номеру раунда
+        self.cooldown_scheduler: CooldownScheduler = CooldownScheduler()
+        
         # Получаем singleton instance AbilityLoader
         self.ability_loader: AbilityLoader = AbilityLoader.get_instance()
         
@@ -148,6 +166,7 @@ class AbilityManager:
             if isinstance(new_ability, PassiveAbility):
                 self.passive_abilities[name] = new_ability
             elif isinstance(new_ability, ActiveAbility):
+                new_ability.attach_cooldown_scheduler(self.cooldown_scheduler)
                 self.active_abilities[name] = new_ability
             return True
         except Exception as e:
@@ -165,7 +184,7 @@ class AbilityManager:
     def remove_ability(self, name: str) -> bool:
         """Удаляет способность по имени."""
         if name in self.active_abilities:
-            del self.active_abilities[name]
+            self.active_abilities.pop(name).attach_cooldown_scheduler(None)
             return True
         elif name in self.passive_abilities:
             del self.passive_abilities[name]
@@ -174,6 +193,7 @@ class AbilityManager:
     
     def clear_abilities(self) -> None:
         """Удаляет все способности."""
+        self.cooldown_scheduler.clear()
         self.active_abilities.clear()
         self.passive_abilities.clear()
     
@@ -236,24 +256,32 @@ class AbilityManager:
                    targets: List[Any], **kwargs: Any) -> AbilityResult:
         """Использует активную способность напрямую."""
         if ability and isinstance(ability, ActiveAbility) and ability.can_use(character, targets):
-            return ability.use(character, targets, **kwargs)
-        result = AbilityResult()
+            timing = current_timing()  # Замер фаз боя (None, если выключен)
+            if timing:
+                timing.enter(ABILITY_EXECUTION)
+            try:
+                return ability.use(character, targets, **kwargs)
+            finally:
+                if timing:
+                    timing.leave()
+        result = AbilityResult.acquire()
         result.success = False
         result.reason = "Способность недоступна или не является активной"
         return result
     
     # ==================== Управление кулдаунами ====================
-    def update_cooldowns(self) -> None:
-        """Обновляет кулдауны всех активных способностей в конце раунда."""
-        for ability in self.active_abilities.values():
-            if hasattr(ability, 'update_cooldown'):
-                ability.update_cooldown()
+    def update_cooldowns(self) -> List[ActiveAbility]:
+        """
+        Обновляет кулдауны активных способностей в конце раунда.
+        Обходятся только способности, чей кулдаун истекает в этом раунде.
+
+        :return: Список способностей, которые стали доступны
+        """
+        return self.cooldown_scheduler.advance()
 
     def reset_all_cooldowns(self) -> None:
         """Сбрасывает все кулдауны активных способностей до 0."""
-        for ability in self.active_abilities.values():
-            if hasattr(ability, 'current_cooldown'):
-                ability.current_cooldown = 0
+        self.cooldown_scheduler.clear()
     
     # ==================== Создание способностей ====================
     def create_ability_by_name(self, ability_name: str) -> Optional[Union[ActiveAbility, PassiveAbility]]:
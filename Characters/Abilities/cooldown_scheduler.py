@@ -0,0 +1,102 @@
+# Characters/Abilities/cooldown_scheduler.py
+"""Планировщик кулдаунов способностей (колесо таймеров по номеру раунда)"""
+
+from typing import Dict, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from Characters.Abilities.ability import ActiveAbility
+
+
+# ==================== Планировщик кулдаунов ====================
+class CooldownScheduler:
+    """
+    Колесо таймеров для кулдаунов способностей одного персонажа.
+
+    Вместо того чтобы каждый раунд уменьшать счетчик у каждой способности,
+    планировщик хранит номер текущего раунда и корзины способностей,
+    сгруппированные по раунду готовности. Использование способности кладет ее
+    в корзину ``round + cooldown``, а конец раунда - это увеличение счетчика
+    и извлечение одной корзины.
+    """
+
+    def __init__(self) -> None:
+        """Инициализация планировщика"""
+        self.current_round: int = 0
+        self._wheel: Dict[int, List['ActiveAbility']] = {}
+        self._ready_rounds: Dict['ActiveAbility', int] = {}
+
+    # ==================== Планирование ====================
+    def schedule(self, ability: 'ActiveAbility', cooldown: int) -> None:
+        """
+        Ставит способность на кулдаун.
+
+        :param ability: Способность
+        :param cooldown: Количество раундов до готовности (0 - снять кулдаун)
+        """
+        if cooldown <= 0:
+            self._ready_rounds.pop(ability, None)
+            return
+
+        ready_round = self.current_round + cooldown
+        self._ready_rounds[ability] = ready_round
+
+        bucket = self._wheel.get(ready_round)
+        if bucket is None:
+            self._wheel[ready_round] = [ability]
+        else:
+            bucket.append(ability)
+
+    def cancel(self, ability: 'ActiveAbility') -> None:
+        """
+        Снимает способность с кулдауна.
+
+        :param ability: Способность
+        """
+        # Запись в корзине остается и будет отброшена при извлечении
+        self._ready_rounds.pop(ability, None)
+
+    def get_remaining(self, ability: 'ActiveAbility') -> int:
+        """
+        Возвращает количество раундов до готовности способности.
+
+        :param ability: Способность
+        :return: Оставшийся кулдаун (0 - способность готова)
+        """
+        ready_round = self._ready_rounds.get(ability)
+        if ready_round is None:
+            return 0
+        return ready_round - self.current_round
+
+    # ==================== Смена раундов ====================
+    def advance(self) -> List['ActiveAbility']:
+        """
+        Завершает раунд: сдвигает счетчик и извлекает корзину готовых способностей.
+
+        :return: Список способностей, которые стали доступны в этом раунде
+        """
+        self.current_round += 1
+        bucket = self._wheel.pop(self.current_round, None)
+        if not bucket:
+            return []
+
+        ready: List['ActiveAbility'] = []
+        for ability in bucket:
+            # Пропускаем устаревшие записи (способность перепланирована или сброшена)
+            if self._ready_rounds.get(ability) == self.current_round:
+                del self._ready_rounds[ability]
+                ready.append(ability)
+        return ready
+
+    def clear(self) -> None:
+        """Сбрасывает все кулдауны."""
+        self._wheel.clear()
+        self._ready_rounds.clear()
+
+    # ==================== Информация ====================
+    def get_cooling_abilities(self) -> List['ActiveAbility']:
+        """Возвращает способности, находящиеся на кулдауне."""
+        return list(self._ready_rounds.keys())
+
+    def has_pending(self) -> bool:
+        """Проверяет, есть ли способности на кулдауне."""
+        return bool(self._ready_rounds)
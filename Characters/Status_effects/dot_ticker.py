@@ -0,0 +1,104 @@
+# Characters/Status_effects/dot_ticker.py
+"""Пакетная обработка эффектов периодического урона за раунд"""
+
+from typing import Iterable, List, TYPE_CHECKING
+
+from Characters.Status_effects.effect_result import EffectResult
+from Characters.Status_effects.status_effect import DamageOverTimeEffect, DotSpec
+
+if TYPE_CHECKING:
+    from Characters.character import Character
+    from Characters.Status_effects.status_manager import StatusEffectManager
+
+
+# ==================== Пакет эффектов периодического урона ====================
+class DotBatch:
+    """
+    Колоночное хранилище эффектов периодического урона.
+
+    Эффекты всех персонажей (одного боя или серии боев) собираются в общие
+    списки, урон считается одним проходом по данным, после чего применяется
+    к целям в исходном порядке.
+    """
+
+    def __init__(self) -> None:
+        """Инициализация пустого пакета"""
+        self.targets: List['Character'] = []
+        self.effects: List[DamageOverTimeEffect] = []
+        self.specs: List[DotSpec] = []
+
+    def add(self, target: 'Character', effect: DamageOverTimeEffect) -> None:
+        """
+        Добавляет эффект в пакет.
+        
+        :param target: Персонаж, на котором висит эффект
+        :param effect: Эффект периодического урона
+        """
+        self.targets.append(target)
+        self.effects.append(effect)
+        self.specs.append(effect.get_dot_spec())
+
+    def compute_damage(self) -> List[int]:
+        """Рассчитывает урон всех эффектов пакета за один проход."""
+        return [int(base_damage * (1.0 + (stacks - 1) * stack_bonus))
+                for base_damage, stacks, stack_bonus, _ in self.specs]
+
+    def apply(self, build_messages: bool = True) -> List[EffectResult]:
+        """
+        Наносит рассчитанный урон целям.
+        
+        :param build_messages: Формировать ли сообщения для лога
+        :return: Список результатов по каждому сработавшему эффекту
+        """
+        results: List[EffectResult] = []
+        for target, effect, damage in zip(self.targets, self.effects, self.compute_damage()):
+            # Цель могла погибнуть от предыдущего эффекта в этом же проходе
+            if not target.is_alive():
+                continue
+
+            target.take_damage(damage)
+
+            result = EffectResult.acquire()
+            result.effect = f"{effect.effect_key}_tick"
+            result.total_damage = damage
+            if build_messages:
+                result.messages.append(effect.build_tick_message(target, damage))
+            results.append(result)
+        return results
+
+
+# ==================== Обработка раунда ====================
+def tick_status_effects(characters: Iterable['Character'], build_messages: bool = True) -> List[EffectResult]:
+    """
+    Обрабатывает статус-эффекты группы персонажей за один раунд.
+    
+    :param characters: Персонажи (можно передавать участников нескольких боев)
+    :param build_messages: Формировать ли сообщения (False, если лог никто не читает)
+    :return: Список результатов обработки эффектов
+    """
+    return tick_managers([character.status_manager for character in characters], build_messages)
+
+
+def tick_managers(managers: List['StatusEffectManager'], build_messages: bool = True) -> List[EffectResult]:
+    """
+    Обрабатывает эффекты набора менеджеров за один раунд.
+    
+    Эффекты периодического урона применяются одним пакетом,
+    остальные эффекты обрабатываются своим методом tick.
+    
+    :param managers: Менеджеры статус-эффектов
+    :param build_messages: Формировать ли сообщения для лога
+    :return: Список результатов обработки эффектов
+    """
+    batch = DotBatch()
+    results: List = []
+
+    for manager in managers:
+        results.extend(manager.begin_tick(batch))
+
+    results.extend(batch.apply(build_messages))
+
+    for manager in managers:
+        manager.finish_tick()
+
+    return results
@@ -1,9 +1,10 @@
 # Characters/Status_effects/effect_result.py
 from typing import List, Any, Dict
+from Utils.object_pool import PooledObject
 from Utils.types import LoggerMessageType
 
-class EffectResult:
-    """Результат применения эффекта статуса."""
+class EffectResult(PooledObject):
+    """Результат применения эффекта статуса (берется из пула через EffectResult.acquire())."""
     def __init__(self) -> None:
         self.success: bool = True
         self.messages: List[LoggerMessageType] = []
@@ -21,11 +22,27 @@ class EffectResult:
         """Добавляет деталь в результат."""
         self.details[key] = value
 
-class ApplyEffectResult:
-    def __init__(self, effect: str) -> None:
+    def reset(self) -> None:
+        """Сбрасывает результат, сохраняя контейнеры (дополнительные атрибуты удаляются)."""
+        messages, details = self.messages, self.details
+        self.__dict__.clear()
+        messages.clear()
+        details.clear()
+        self.success = True
+        self.messages = messages
+        self.details = details
+
+class ApplyEffectResult(PooledObject):
+    """Результат наложения эффекта (берется из пула через ApplyEffectResult.acquire())."""
+    def __init__(self, effect: str = "") -> None:
         self.effect: str = effect
         self.message: LoggerMessageType = None
 
     def add_message(self, message: LoggerMessageType) -> None:
         """Добавляет сообщение в результат."""
-        self.message = message
\ No newline at end of file
+        self.message = message
+
+    def reset(self) -> None:
+        """Сбрасывает результат для повторного использования."""
+        self.effect = ""
+        self.message = None
@@ -1,7 +1,14 @@
 # Characters/Status_effects/status_effect.py
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, NamedTuple, Optional
+
+from Battle.battle_context import messages_enabled
+from Battle.battle_logger import battle_logger
 from Characters.character import Character
+from Characters.Status_effects.effect_result import ApplyEffectResult, EffectResult
+from Config.curses_config import COLOR_BLUE, COLOR_GREEN, COLOR_RED, COLOR_WHITE, COLOR_YELLOW
+from Config.game_config import EFFECT_LIST_ICON, SPACES_SECOND_LEVEL
+from Utils.types import IEffectResult, LoggerMessageType
 
 class StatusEffect(ABC):
     """Абстрактный базовый класс для статус-эффектов."""
@@ -62,16 +69,19 @@ class StatusEffect(ABC):
         :param target: Цель эффекта (персонаж)
         :return: Словарь с результатами обработки эффекта
         """
+        self.advance_duration()
+            
+        result = self.update_effect(target)
+            
+        return result
+
+    def advance_duration(self) -> None:
+        """Отмечает эффект примененным и уменьшает оставшуюся длительность на раунд."""
         if not self.applied:
             self.applied = True
 
-        
         if self.duration > 0:
             self.duration -= 1
-            
-        result = self.update_effect(target)
-            
-        return result
     
     def is_expired(self) -> bool:
         """
@@ -116,6 +126,8 @@ class StatusEffect(ABC):
 class StackableStatusEffect(StatusEffect):
     """Базовый класс для стакающихся статус-эффектов."""
     
+    stack_bonus: float = 0.5  # Прибавка к множителю за каждый дополнительный стак
+    
     def __init__(self, name: str, duration: int, description: str = "", icon: str = ""):
         """
         Инициализация стакающегося эффекта.
@@ -160,7 +172,7 @@ class StackableStatusEffect(StatusEffect):
         
         :return: Множитель (1.0 для 1 стака, 1.5 для 2 стаков и т.д.)
         """
-        return 1.0 + (self.stacks - 1) * 0.5  # Каждый дополнительный стак дает +50%
+        return 1.0 + (self.stacks - 1) * self.stack_bonus  # Каждый дополнительный стак дает +50%
     
     def get_total_effect_value(self, base_value: int) -> int:
         """
@@ -190,3 +202,102 @@ class StackableStatusEffect(StatusEffect):
     def is_max_stacks(self) -> bool:
         """Проверяет, достигнуто ли максимальное количество стаков."""
         return self.stacks >= self.max_stacks
+
+
+# ==================== Периодический урон ====================
+class DotSpec(NamedTuple):
+    """Описание эффекта периодического урона в виде данных."""
+    base_damage: int
+    stacks: int
+    stack_bonus: float
+    remaining_duration: int
+
+
+class DamageOverTimeEffect(StackableStatusEffect):
+    """
+    Базовый класс простых эффектов периодического урона (ожог, отравление).
+
+    Эффект полностью описывается данными (базовый урон, стаки, прибавка за стак,
+    оставшаяся длительность), поэтому все такие эффекты в бою обрабатываются
+    одним проходом в Characters.Status_effects.dot_ticker.
+    """
+
+    effect_key: str = "dot"           # Идентификатор эффекта в результатах ('burn', 'poison')
+    apply_text: str = ""              # Текст при наложении ("ожог")
+    apply_color: int = COLOR_RED      # Цвет текста при наложении
+    damage_text: str = ""             # Источник урона в родительном падеже ("ожога")
+
+    def __init__(self, name: str, duration: int, base_damage: int, description: str = "", icon: str = ""):
+        """
+        Инициализация эффекта периодического урона.
+        
+        :param name: Название эффекта
+        :param duration: Базовая длительность эффекта в раундах
+        :param base_damage: Базовый урон за ход (умножается на множитель стаков)
+        :param description: Описание эффекта
+        :param icon: Иконка эффекта
+        """
+        super().__init__(name=name, duration=duration, description=description, icon=icon)
+        self.base_damage = base_damage
+        self.base_duration = duration  # Сохраняем базовую длительность
+        self.stacks = 0  # Количество стаков эффекта
+
+    def get_dot_spec(self) -> DotSpec:
+        """Возвращает описание эффекта в виде данных."""
+        return DotSpec(self.base_damage, self.stacks, self.stack_bonus, self.duration)
+
+    # ==================== Сообщения ====================
+    def build_tick_message(self, target: Character, damage: int) -> LoggerMessageType:
+        """
+        Формирует сообщение об уроне от эффекта за ход.
+        
+        :param target: Цель эффекта
+        :param damage: Нанесенный урон
+        :return: Сообщение для лога
+        """
+        damage_template = f"%1 %2 получает %3 урона от {self.damage_text}"
+        if self.stacks > 1:
+            damage_template += f" ({self.stacks} стаков)"
+            
+        damage_elements: List[tuple] = [(self.icon, COLOR_WHITE), (target.name, COLOR_YELLOW), 
+                                      (str(damage), COLOR_RED)]
+        
+        return battle_logger.create_log_message(damage_template, damage_elements)
+
+    # ==================== Жизненный цикл ====================
+    def apply_effect(self, target: Character) -> IEffectResult:
+        """Применяется при первом наложении эффекта или добавлении стака"""
+        apply_effect_result = ApplyEffectResult.acquire()
+        apply_effect_result.effect = self.effect_key
+        if not messages_enabled():
+            return apply_effect_result
+        
+        target_color = COLOR_GREEN if target.is_player else COLOR_BLUE
+
+        template: str = f"{SPACES_SECOND_LEVEL}%1 %2 получает %3"        
+        elements: List[tuple] = [(EFFECT_LIST_ICON, COLOR_RED), 
+            (target.name, target_color), (self.apply_text, self.apply_color)]
+        message = battle_logger.create_log_message(template, elements)
+
+        apply_effect_result.add_message(message)
+        return apply_effect_result
+
+    def update_effect(self, target: Character) -> EffectResult:
+        """Вызывается каждый ход - наносит урон с учетом стаков"""
+        result: EffectResult = EffectResult.acquire()
+        result.effect = f"{self.effect_key}_tick"
+        
+        current_damage = self.get_total_effect_value(self.base_damage)
+        target.take_damage(current_damage)
+        result.total_damage = current_damage
+        if messages_enabled():
+            result.messages.append(self.build_tick_message(target, current_damage))
+        
+        return result
+
+    def remove_effect(self, target: Character) -> Dict[str, Any]:
+        """Вызывается при окончании действия эффекта"""
+        return {
+            'message': f"Эффект {self.damage_text} на {target.name} исчез",
+            'effect': f"{self.effect_key}_removed"
+        }
@@ -1,12 +1,14 @@
 # Characters/Status_effects/status_manager.py
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+import heapq
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 
-from Characters.Status_effects.status_effect import StackableStatusEffect
+from Characters.Status_effects.status_effect import DamageOverTimeEffect, StackableStatusEffect
 from Utils.types import IApplyEffectResult
 
 if TYPE_CHECKING:
     from Characters.character import Character
     from Characters.Status_effects.status_effect import StatusEffect
+    from Characters.Status_effects.dot_ticker import DotBatch
 
 # Глобальный реестр эффектов
 _EFFECT_REGISTRY = {}
@@ -25,7 +27,20 @@ class StatusEffectManager:
     
     def __init__(self, character: 'Character'):
         self.character = character
-        self.active_effects: List = []  # List[StatusEffect] - тип будет проверен позже
+        # Эффекты по классу: стакание и поиск за O(1)
+        self._effects: Dict[type, Any] = {}  # Dict[type, StatusEffect]
+        # Индекс имя эффекта -> класс для has_effect/remove_effect
+        self._effect_names: Dict[str, type] = {}
+        # Куча истечения: (тик истечения, порядковый номер, класс эффекта)
+        self._expiry_heap: List[Tuple[int, int, type]] = []
+        self._expiry_ticks: Dict[type, int] = {}
+        self._tick_count: int = 0
+        self._sequence: int = 0
+
+    @property
+    def active_effects(self) -> List:  # List[StatusEffect]
+        """Список активных эффектов в порядке наложения"""
+        return list(self._effects.values())
         
     def _get_status_effect_type(self):
         """Ленивый импорт класса StatusEffect"""
@@ -33,7 +48,47 @@ class StatusEffectManager:
             from Characters.Status_effects.status_effect import StatusEffect
             self._status_effect_class = StatusEffect
         return self._status_effect_class
+
+    # ==================== Расписание истечения ====================
+    def _schedule_expiry(self, effect) -> None:
+        """
+        Заносит эффект в кучу истечения по оставшейся длительности.
+        Постоянные эффекты (длительность < 0) в кучу не попадают.
         
+        :param effect: Экземпляр статус-эффекта
+        """
+        if effect.duration < 0:
+            self._expiry_ticks.pop(effect.__class__, None)
+            return
+        expire_tick = self._tick_count + max(effect.duration, 1)
+        self._sequence += 1
+        self._expiry_ticks[effect.__class__] = expire_tick
+        heapq.heappush(self._expiry_heap, (expire_tick, self._sequence, effect.__class__))
+
+    def _discard(self, effect_class: type) -> None:
+        """Удаляет эффект из хранилища и индексов (запись в куче становится устаревшей)."""
+        effect = self._effects.pop(effect_class, None)
+        if effect is not None:
+            self._effect_names.pop(effect.name, None)
+            self.character.bump_state_version()
+        self._expiry_ticks.pop(effect_class, None)
+
+    def _purge_expired(self) -> None:
+        """Удаляет истекшие эффекты, извлекая из кучи только записи с наступившим сроком."""
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= self._tick_count:
+            expire_tick, _, effect_class = heapq.heappop(heap)
+            if self._expiry_ticks.get(effect_class) != expire_tick:
+                continue  # Устаревшая запись
+
+            effect = self._effects[effect_class]
+            if effect.is_expired():
+                self._discard(effect_class)
+            else:
+                # Эффект был продлен - переносим срок
+                self._schedule_expiry(effect)
+
+    # ==================== Управление эффектами ====================
     def add_effect(self, effect, target) -> IApplyEffectResult:  # effect: StatusEffect
         """
         Добавляет эффект персонажу.
@@ -45,10 +100,14 @@ class StatusEffectManager:
  
         if existing_effect:
             # Если эффект уже есть, продляем его действие
+            # (новый срок будет учтен при извлечении старого из кучи)
             existing_effect.extend_duration()
         else:
             # Добавляем новый эффект
-            self.active_effects.append(effect)
+            self._effects[effect.__class__] = effect
+            self._effect_names[effect.name] = effect.__class__
+            self._schedule_expiry(effect)
+            self.character.bump_state_version()
             existing_effect = effect
 
         if isinstance(effect, StackableStatusEffect):
@@ -64,22 +123,19 @@ class StatusEffectManager:
         :param effect_name: Имя эффекта для удаления
         :return: True если эффект удален, False если не найден
         """
-        for i, effect in enumerate(self.active_effects):
-            if effect.name == effect_name:
-                effect.remove_effect(self.character)
-                del self.active_effects[i]
-                return True
-        return False
+        effect_class = self._effect_names.get(effect_name)
+        if effect_class is None:
+            return False
+        self._effects[effect_class].remove_effect(self.character)
+        self._discard(effect_class)
+        return True
     
     def get_effect(self, effect: 'StatusEffect') -> Optional['StatusEffect']:
         """
         Получает эффект.
         :return: Экземпляр эффекта или None если не найден
         """
-        for active_effect in self.active_effects:
-            if active_effect.__class__ == effect.__class__:
-                return active_effect
-        return None
+        return self._effects.get(effect.__class__)
     
     def update_effects(self) -> List[Dict[str, Any]]:
         """
@@ -87,24 +143,35 @@ class StatusEffectManager:
         
         :return: Список результатов обновления эффектов
         """
-        results = []
-        expired_effects = []
+        from Characters.Status_effects.dot_ticker import tick_managers
+        return tick_managers([self])
+
+    def begin_tick(self, dot_batch: 'DotBatch') -> List[Dict[str, Any]]:
+        """
+        Начинает обработку раунда: эффекты периодического урона передаются
+        в общий пакет, остальные эффекты обрабатываются сразу.
         
-        # Обновляем все эффекты
-        for effect in self.active_effects:
-            result = effect.tick(self.character)
-            results.append(result)
-            
-            # Проверяем, истек ли эффект
-            if effect.is_expired():
-                expired_effects.append(effect)
+        :param dot_batch: Пакет эффектов периодического урона
+        :return: Список результатов обработки эффектов, не попавших в пакет
+        """
+        results = []
+        self._tick_count += 1
         
-        # Удаляем истекшие эффекты
-        for effect in expired_effects:
-            if effect in self.active_effects:
-                self.active_effects.remove(effect)
+        # Снимок - эффекты могут быть сняты при смерти персонажа
+        for effect_class, effect in list(self._effects.items()):
+            if self._effects.get(effect_class) is not effect:
+                continue
+            if isinstance(effect, DamageOverTimeEffect):
+                effect.advance_duration()
+                dot_batch.add(self.character, effect)
+            else:
+                results.append(effect.tick(self.character))
             
         return results
+
+    def finish_tick(self) -> None:
+        """Завершает обработку раунда: удаляет истекшие эффекты."""
+        self._purge_expired()
     
     def has_effect(self, effect_name: str) -> bool:
         """
@@ -113,7 +180,7 @@ class StatusEffectManager:
         :param effect_name: Имя эффекта
         :return: True если эффект есть, False если нет
         """
-        return any(effect.name == effect_name for effect in self.active_effects)
+        return effect_name in self._effect_names
     
     def get_all_effects(self) -> List:  # List[StatusEffect]
         """
@@ -121,7 +188,7 @@ class StatusEffectManager:
         
         :return: Список активных эффектов
         """
-        return self.active_effects.copy()
+        return list(self._effects.values())
     
     def clear_all_effects(self) -> List[Dict[str, Any]]:
         """
@@ -130,10 +197,16 @@ class StatusEffectManager:
         :return: Список результатов удаления эффектов
         """
         results = []
-        for effect in self.active_effects.copy():
+        effects = list(self._effects.values())
+        if effects:
+            self.character.bump_state_version()
+        self._effects.clear()
+        self._effect_names.clear()
+        self._expiry_heap.clear()
+        self._expiry_ticks.clear()
+        for effect in effects:
             result = effect.remove_effect(self.character)
             results.append(result)
-        self.active_effects.clear()
         return results
     
     def get_effect_class_by_name(self, effect_class_name: str) -> Optional[type]:
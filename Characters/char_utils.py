@@ -49,19 +49,32 @@ def get_enemy_count_for_level_group(level_group):
         # На случай некорректных значений
         return random.randint(2, 3)
 
-def create_enemies(players):
+def get_level_group(players):
     """
-    Создает случайную группу врагов с общим уровнем, близким к target_level.
-    :param target_level: Целевой уровень группы врагов (1-5)
-    :return: Список объектов Character.
+    Определяет уровень группы врагов по среднему уровню команды.
+    :param players: Команда игрока
+    :return: Уровень группы (1-5)
     """
-
     total_player_level = sum(p.level for p in players)
     avg_level = total_player_level // len(players)
 
     # Ограничиваем target_level в пределах 1-5
-    target_level = max(1, min(5, avg_level))
-    
+    return max(1, min(5, avg_level))
+
+def create_enemies(players):
+    """
+    Создает случайную группу врагов с общим уровнем, близким к уровню команды.
+    :param players: Команда игрока
+    :return: Список объектов Character.
+    """
+    return create_enemy_group(get_level_group(players))
+
+def create_enemy_group(target_level):
+    """
+    Создает случайную группу врагов с общим уровнем, близким к target_level.
+    :param target_level: Целевой уровень группы врагов (1-5)
+    :return: Список объектов Character.
+    """
     # Список возможных типов врагов
     enemy_types = [Goblin, Orc, Skeleton, Wizard, Troll]
     
@@ -2,6 +2,7 @@
 
 from typing import TYPE_CHECKING, List, Dict, Any, Optional
 
+from Battle.battle_context import messages_enabled
 from Characters.base_stats import DerivedStats, Stats
 from Config.game_config import BASE_ENERGY_COST
 
@@ -14,6 +15,10 @@ class Character:
     """Базовый класс, представляющий персонажа в игре."""
 
     def __init__(self, name: str, role: str, level: int = 1, is_player: bool = False, can_heal: bool = False):
+        # Версия состояния: растет при изменении HP, энергии, жизни и эффектов
+        # (по ней интерфейс понимает, что строку персонажа нужно перерисовать)
+        self.state_version = 0
+        self._hp = self._energy = self._alive = None
         self.name = name
         self.role = role
         self.is_player = is_player
@@ -36,6 +41,43 @@ class Character:
         self._status_manager = None
 
     # ==================== Свойства ====================
+    @property
+    def hp(self) -> int:
+        """Текущее здоровье"""
+        return self._hp
+
+    @hp.setter
+    def hp(self, value: int) -> None:
+        if value != self._hp:
+            self._hp = value
+            self.state_version += 1
+
+    @property
+    def energy(self) -> int:
+        """Текущая энергия"""
+        return self._energy
+
+    @energy.setter
+    def energy(self, value: int) -> None:
+        if value != self._energy:
+            self._energy = value
+            self.state_version += 1
+
+    @property
+    def alive(self) -> bool:
+        """Жив ли персонаж"""
+        return self._alive
+
+    @alive.setter
+    def alive(self, value: bool) -> None:
+        if value != self._alive:
+            self._alive = value
+            self.state_version += 1
+
+    def bump_state_version(self) -> None:
+        """Отмечает изменение состояния, не связанное с HP/энергией (например, набор эффектов)."""
+        self.state_version += 1
+
     @property
     def ability_manager(self) -> 'AbilityManager':
         """Ленивое создание менеджера способностей"""
@@ -67,8 +109,9 @@ class Character:
         if self._status_manager is not None:
             self.status_manager.clear_all_effects()
         
-        # Выводим сообщение о смерти персонажа
-        print(f"{self.name} погибает!")
+        # Выводим сообщение о смерти персонажа (в тихом режиме не выводим)
+        if messages_enabled():
+            print(f"{self.name} погибает!")
 
     # ==================== Боевые методы ====================
     def take_damage(self, damage: int) -> bool:
@@ -81,6 +124,16 @@ class Character:
                 self.on_death()
         return True
 
+    def reset_battle_state(self) -> None:
+        """Возвращает персонажа в состояние перед боем: полные HP и энергия, без эффектов и кулдаунов."""
+        if self._status_manager is not None:
+            self.status_manager.clear_all_effects()
+        if self._ability_manager is not None:
+            self.ability_manager.reset_all_cooldowns()
+        self.alive = True
+        self.hp = self.derived_stats.max_hp
+        self.energy = self.derived_stats.max_energy
+
     def take_heal(self, heal_amount: int) -> int:
         """Исцеляет персонажа и возвращает количество восстановленного HP."""
         old_hp = self.hp
@@ -0,0 +1,158 @@
+# Characters/encounter_pool.py
+"""
+Пул готовых групп врагов.
+
+Создание врага - генерация имени, расчет характеристик, создание менеджера
+способностей - заметно дороже самого хода боя в массовых симуляциях.
+Пул хранит заготовленные группы для каждого уровня группы (1-5): группа
+выдается на бой, после боя возвращается и перед следующей выдачей
+приводится в исходное состояние (полные HP/энергия, без эффектов и кулдаунов).
+
+Пока для уровня собрано меньше pool_size групп, выдается новая группа.
+Каждая группа проводит не больше max_uses боев, затем выбывает из пула,
+и ее место занимает новая: враги не сводятся к одному и тому же набору
+из pool_size групп на всю игру. Заполнить пул заранее можно через prefill().
+
+Обработчик on_build вызывается для каждого врага один раз, при создании
+группы: так пул серии симуляций применяет переопределения баланса, которые
+сохраняются при сбросе группы между боями.
+"""
+
+import random
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from Characters.char_utils import create_enemy_group, get_level_group
+from Config.game_config import ENCOUNTER_GROUP_MAX_USES, ENCOUNTER_POOL_SIZE
+
+if TYPE_CHECKING:
+    from Characters.character import Character
+
+LEVEL_GROUPS = (1, 2, 3, 4, 5)
+
+
+class EncounterPool:
+    """Пул групп врагов по уровням группы."""
+
+    _instance: Optional['EncounterPool'] = None
+
+    def __init__(self, pool_size: int = ENCOUNTER_POOL_SIZE,
+                 max_uses: int = ENCOUNTER_GROUP_MAX_USES,
+                 on_build: Optional[Callable[['Character'], None]] = None) -> None:
+        """
+        :param pool_size: Максимум заготовленных групп на уровень группы
+        :param max_uses: Сколько боев проводит группа, прежде чем ее заменит новая
+        :param on_build: Вызывается для каждого врага новой группы (None - ничего не делать)
+        """
+        self.pool_size: int = max(1, pool_size)
+        self.max_uses: int = max(1, max_uses)
+        self.on_build = on_build
+        # Свободные группы по уровням
+        self._free: Dict[int, List[List['Character']]] = {level: [] for level in LEVEL_GROUPS}
+        # Сколько групп создано для каждого уровня
+        self._built: Dict[int, int] = {level: 0 for level in LEVEL_GROUPS}
+        # Выданные группы: id списка -> (уровень группы, список)
+        self._in_use: Dict[int, Tuple[int, List['Character']]] = {}
+        # Сколько раз выдана каждая группа пула: id списка -> число боев
+        self._uses: Dict[int, int] = {}
+
+    @classmethod
+    def get_instance(cls) -> 'EncounterPool':
+        """Возвращает экземпляр пула (создает, если не существует)."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Сбрасывает инстанс для тестирования."""
+        cls._instance = None
+
+    # ==================== Выдача и возврат ====================
+    def acquire(self, players: Sequence['Character']) -> List['Character']:
+        """
+        Выдает группу врагов для боя с командой.
+
+        :param players: Команда игрока
+        :return: Список врагов в исходном состоянии
+        """
+        return self.acquire_group(get_level_group(players))
+
+    def acquire_group(self, level_group: int) -> List['Character']:
+        """
+        Выдает группу врагов заданного уровня группы.
+
+        :param level_group: Уровень группы (1-5)
+        :return: Список врагов в исходном состоянии
+        """
+        level_group = max(1, min(5, level_group))
+        free = self._free[level_group]
+
+        if free and self._built[level_group] >= self.pool_size:
+            # Пул заполнен - берем случайную свободную группу
+            index = random.randrange(len(free))
+            free[index], free[-1] = free[-1], free[index]
+            enemies = free.pop()
+            for enemy in enemies:
+                enemy.reset_battle_state()
+        else:
+            enemies = self._build(level_group)
+
+        self._in_use[id(enemies)] = (level_group, enemies)
+        self._uses[id(enemies)] = self._uses.get(id(enemies), 0) + 1
+        return enemies
+
+    def release(self, enemies: List['Character']) -> None:
+        """
+        Возвращает группу в пул. Группы, выданные не пулом, игнорируются.
+
+        :param enemies: Группа врагов, полученная через acquire
+        """
+        entry = self._in_use.pop(id(enemies), None)
+        if entry is None:
+            return
+        level_group, group = entry
+        if self._uses[id(group)] >= self.max_uses:
+            # Группа отслужила свое: место в пуле освобождается для новой
+            del self._uses[id(group)]
+            self._built[level_group] -= 1
+            return
+        self._free[level_group].append(group)
+
+    # ==================== Заполнение ====================
+    def prefill(self, level_groups: Sequence[int] = LEVEL_GROUPS) -> None:
+        """
+        Заполняет пул заранее, чтобы бои не тратили время на создание врагов.
+
+        :param level_groups: Уровни групп для заполнения
+        """
+        for level_group in level_groups:
+            while self._built[level_group] < self.pool_size:
+                self._free[level_group].append(self._build(level_group))
+
+    def _build(self, level_group: int) -> List['Character']:
+        """Создает новую группу и учитывает ее в пуле"""
+        self._built[level_group] += 1
+        enemies = create_enemy_group(level_group)
+        if self.on_build is not None:
+            for enemy in enemies:
+                self.on_build(enemy)
+        return enemies
+
+    # ==================== Информация ====================
+    def get_free_count(self, level_group: int) -> int:
+        """Количество свободных групп уровня"""
+        return len(self._free.get(level_group, ()))
+
+    def clear(self) -> None:
+        """Удаляет все заготовленные группы"""
+        for level_group in LEVEL_GROUPS:
+            self._free[level_group].clear()
+            self._built[level_group] = 0
+        self._in_use.clear()
+        self._uses.clear()
+
+
+# ==================== Функции доступа ====================
+def get_encounter_pool() -> EncounterPool:
+    """Возвращает экземпляр пула групп врагов (Singleton)."""
+    return EncounterPool.get_instance()
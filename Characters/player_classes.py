@@ -1,4 +1,5 @@
 # player.py
+from bisect import bisect_right
 from typing import Dict, Any, List, Tuple, Optional, Union
 from Characters.character import Character
 from Characters.Equipment.equipment import EquipmentMixin, EquipmentSlot
@@ -33,34 +34,96 @@ class Player(Character, EquipmentMixin):
         self.exp_to_next_level: int = 0
         self.calculate_exp_for_next_level()
     
+    # Накопленный опыт, нужный для достижения уровня: _exp_table[level].
+    # Индекс 0 не используется, 1-й уровень стоит 0 опыта.
+    _exp_table: List[int] = [0, 0]
+    
+    @staticmethod
+    def exp_for_level_up(level: int) -> int:
+        """Опыт, необходимый для перехода с уровня level на следующий."""
+        return int(20 * (level ** 1.5))
+    
+    @classmethod
+    def exp_to_reach_level(cls, level: int) -> int:
+        """
+        Накопленный опыт, нужный для достижения уровня с 1-го.
+        
+        :param level: Уровень
+        :return: Суммарный опыт
+        """
+        table = Player._exp_table
+        while len(table) <= level:
+            table.append(table[-1] + cls.exp_for_level_up(len(table) - 1))
+        return table[level]
+    
+    @classmethod
+    def level_for_total_exp(cls, total_exp: int) -> int:
+        """
+        Уровень, которого достигает персонаж с накопленным опытом total_exp.
+        
+        :param total_exp: Суммарный опыт с 1-го уровня
+        :return: Уровень
+        """
+        table = Player._exp_table
+        while table[-1] <= total_exp:
+            cls.exp_to_reach_level(len(table))
+        return bisect_right(table, total_exp) - 1
+    
     def calculate_exp_for_next_level(self) -> None:
         """Рассчитывает количество опыта, необходимого для следующего уровня."""
-        self.exp_to_next_level = int(20 * (self.level ** 1.5))
+        self.exp_to_next_level = self.exp_for_level_up(self.level)
+        
+    def add_exp(self, exp_amount: int, build_messages: bool = True) -> List[list[tuple[str, int]]]:
+        """
+        Добавляет опыт персонажу и проверяет на повышение уровня.
+        
+        Итоговый уровень вычисляется сразу по таблице накопленного опыта,
+        характеристики пересчитываются один раз, даже если получено
+        несколько уровней.
         
-    def add_exp(self, exp_amount: int) -> List[str]:
-        """Добавляет опыт персонажу и проверяет на повышение уровня."""
-            
+        :param exp_amount: Количество опыта
+        :param build_messages: Формировать ли сообщение о повышении уровня
+        :return: Список сообщений о повышении уровня (не более одного)
+        """
         self.exp += exp_amount
-        level_up_messages: List = []
+        if self.exp < self.exp_to_next_level:
+            return []
+        
+        old_level: int = self.level
+        old_stats: Dict[str, int] = self._snapshot_main_stats()
         
-        # Проверяем, достаточно ли опыта для повышения уровня
-        while self.exp >= self.exp_to_next_level:
-            level_up_message: list[tuple[str, int]] = self.level_up()
-            level_up_messages.append(level_up_message)
-            
-        return level_up_messages
+        total_exp = self.exp_to_reach_level(self.level) + self.exp
+        new_level = self.level_for_total_exp(total_exp)
+        self.exp = total_exp - self.exp_to_reach_level(new_level)
+        self._apply_level(new_level)
+        
+        if not build_messages:
+            return []
+        return [self._build_level_up_message(old_level, old_stats)]
         
     def level_up(self) -> list[tuple[str, int]]:
-        """Повышает уровень персонажа и улучшает его характеристики."""
+        """Повышает уровень персонажа на 1 и улучшает его характеристики."""
         old_level: int = self.level
-        old_dexterity: int = self.stats.dexterity
-        old_constitution: int = self.stats.constitution
-        old_strength: int = self.stats.strength
-        old_intelligence: int = self.stats.intelligence
+        old_stats: Dict[str, int] = self._snapshot_main_stats()
         
-        self.level += 1
         # Отбираем опыт, который потратили на повышение уровня
         self.exp -= self.exp_to_next_level
+        self._apply_level(self.level + 1)
+        
+        return self._build_level_up_message(old_level, old_stats)
+    
+    def _snapshot_main_stats(self) -> Dict[str, int]:
+        """Текущие основные характеристики (для сообщения о повышении уровня)."""
+        return {
+            'dex': self.stats.dexterity,
+            'con': self.stats.constitution,
+            'str': self.stats.strength,
+            'int': self.stats.intelligence,
+        }
+    
+    def _apply_level(self, level: int) -> None:
+        """Устанавливает уровень и один раз пересчитывает характеристики."""
+        self.level = level
         
         if hasattr(self, 'BASE_STATS') and hasattr(self, 'GROWTH_RATES'):
             scaled_stats: Dict[str, int] = Character.scale_stats(self.BASE_STATS, self.level, self.GROWTH_RATES)
@@ -76,9 +139,9 @@ class Player(Character, EquipmentMixin):
         
         # Пересчитываем опыт для следующего уровня
         self.calculate_exp_for_next_level()
-        
-        # Создаем цветное сообщение о повышении уровня
-        # Формируем элементы сообщения
+    
+    def _build_level_up_message(self, old_level: int, old_stats: Dict[str, int]) -> list[tuple[str, int]]:
+        """Создает цветное сообщение о повышении уровня с изменившимися характеристиками."""
         elements: List[Tuple[str, int]] = [
             (self.name, 2),           # зеленый цвет для имени
             (" получает уровень ", 0),
@@ -89,46 +152,24 @@ class Player(Character, EquipmentMixin):
         ]
         
         # Добавляем ТОЛЬКО основные измененные характеристики
-        stats_changed: List[Tuple[str, int]] = []
-        if self.stats.dexterity != old_dexterity:
-            stats_changed.append((f"dex:{old_dexterity} ➤ {self.stats.dexterity}", 6))
-        if self.stats.constitution != old_constitution:
-            stats_changed.append((f"con:{old_constitution} ➤ {self.stats.constitution}", 6))
-        if self.stats.strength != old_strength:
-            stats_changed.append((f"str:{old_strength} ➤ {self.stats.strength}", 6))
-        if self.stats.intelligence != old_intelligence:
-            stats_changed.append((f"int:{old_intelligence} ➤ {self.stats.intelligence}", 6))
-        
-        # Добавляем характеристики в сообщение
-        for i, (stat_text, color) in enumerate(stats_changed):
-            # Разбиваем текст характеристики на части для цветного отображения
-            if ' ➤ ' in stat_text:
-                parts = stat_text.split(' ➤ ')
-                if ':' in parts[0]:
-                    stat_name, old_val = parts[0].split(':')
-                    new_val = parts[1]
-                    # stat_name - бирюзовый, old_val и new_val - желтые
-                    elements.extend([
-                        (stat_name + ":", 6),  # бирюзовый
-                        (old_val, 3),          # желтый
-                        (" ➤ ", 0),
-                        (new_val, 3)           # желтый
-                    ])
-                else:
-                    elements.append((stat_text, 6))  # бирюзовый
-            else:
-                elements.append((stat_text, 6))  # бирюзовый
-                
-            if i < len(stats_changed) - 1:
+        new_stats = self._snapshot_main_stats()
+        changed = [name for name in ('dex', 'con', 'str', 'int') if new_stats[name] != old_stats[name]]
+        for i, stat_name in enumerate(changed):
+            # stat_name - бирюзовый, старое и новое значения - желтые
+            elements.extend([
+                (stat_name + ":", 6),
+                (str(old_stats[stat_name]), 3),
+                (" ➤ ", 0),
+                (str(new_stats[stat_name]), 3)
+            ])
+            if i < len(changed) - 1:
                 elements.append((", ", 0))
         
         elements.append((")", 0))
         
         # Создаем шаблон для всех элементов
         template: str = "".join([f"%{i+1}" for i in range(len(elements))])
-        message: list[tuple[str, int]] = battle_logger.create_log_message(template, elements)
-        
-        return message
+        return battle_logger.create_log_message(template, elements)
         
     def get_exp_progress(self) -> int:
         """Возвращает прогресс до следующего уровня в процентах."""
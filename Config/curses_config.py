@@ -29,6 +29,11 @@ NORMAL = None
 # Настройки задержек
 BATTLE_DELAY = 0.4  # Задержка между действиями в бою (секунды)
 SCREEN_REFRESH_DELAY = 0.01  # Задержка при обновлении экрана (секунды)
+UI_FRAME_RATE = 30  # Максимум перерисовок основного экрана в секунду
+
+# Скорость боя: (название, множитель); None - мгновенно, без пауз
+BATTLE_SPEED_LEVELS = (("1×", 1), ("2×", 2), ("8×", 8), ("мгновенно", None))
+ROUND_BATCH_SPEED = 8  # С этого множителя раунд выводится целиком, пауза - одна на раунд
 
 def setup_colors():
     """Инициализация цветов для игры"""
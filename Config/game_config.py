@@ -42,6 +42,10 @@ MONSTER_NAME_COLUMN_WIDTH = 27  # Для выравнивания баров
 BASE_DELAY_MS = 400  # Задержка между действиями
 ROUND_DELAY_MS = 1200  # Пауза между раундами
 LOG_MAX_LINES = 200
+LOG_SCROLLBACK_LINES = 2000  # Сколько строк лога хранится для прокрутки
+SPECTATOR_DEFAULT_ADDRESS = "127.0.0.1:8765"  # Адрес трансляции событий боя (--spectator)
+SPECTATOR_BUFFER_LINES = 1000  # Очередь событий одного наблюдателя, старые отбрасываются
+BATTLE_METRICS_HISTORY = 200  # Сколько последних боев хранит замер фаз (--battle-metrics)
 MIN_TOP_HEIGHT = 10
 
 HP_BAR_COLORS = {2, 6, 1}
@@ -49,4 +53,9 @@ HP_BAR_WIDTH = 10
 ENERGY_BAR_WIDTH = 4
 ENERGY_BAR_COLORS = {1, 1, 1}
 
-ABILITIES_PATH = "Characters/Abilities"
\ No newline at end of file
+ABILITIES_PATH = "Characters/Abilities"
+SIMULATION_CACHE_DIR = ".sim_cache"  # Кэш результатов массовых симуляций
+SAVE_FILE_PATH = "saves/savegame.sav"  # Файл сохранения игры
+SAVE_HISTORY_CHUNK_BATTLES = 32  # Битв в одном чанке истории сохранения
+ENCOUNTER_POOL_SIZE = 8  # Заготовленных групп врагов на каждый уровень группы
+ENCOUNTER_GROUP_MAX_USES = 3  # После стольких боев группа выбывает из пула и заменяется новой
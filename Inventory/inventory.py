@@ -1,6 +1,8 @@
 # inventory.py - Система инвентаря (Singleton)
 
-from typing import Dict, Any, Optional, Protocol
+import itertools
+from bisect import bisect_left, insort
+from typing import Dict, Any, Hashable, List, Optional, Protocol, Tuple
 
 
 # Протокол для объектов предметов, чтобы указать, что у них должно быть поле name
@@ -11,6 +13,11 @@ class Item(Protocol):
 class Inventory:
     """Класс для управления инвентарем персонажа или группы (Singleton)."""
     
+    # Порядки сортировки (по убыванию: сначала лучшие предметы)
+    SORT_BY_RARITY = "rarity"
+    SORT_BY_LEVEL = "level"
+    SORT_ORDERS = (SORT_BY_RARITY, SORT_BY_LEVEL)
+    
     _instance: Optional['Inventory'] = None
     _initialized: bool = False
     
@@ -23,7 +30,11 @@ class Inventory:
         # Предотвращаем повторную инициализацию
         if not Inventory._initialized:
             self.gold: int = 0
-            self.items: Dict[Item, int] = {}  # объект предмета: количество
+            # ключ стека: [объект предмета, количество, порядковый номер стека]
+            self._stacks: Dict[Hashable, List[Any]] = {}
+            self._total_count: int = 0
+            self._sequence = itertools.count()
+            self._reset_indexes()
             Inventory._initialized = True
     
     @classmethod
@@ -39,6 +50,83 @@ class Inventory:
         cls._instance = None
         cls._initialized = False
     
+    @staticmethod
+    def _key_for(item_object: Item) -> Hashable:
+        """
+        Возвращает ключ хранения предмета.
+        
+        У предметов BaseItem это заранее вычисленный stack_key (общий объект
+        для одинаковых предметов, хэшируется по идентичности), поэтому операции не хэшируют и не сравнивают словари свойств.
+        Прочие объекты используются как ключ сами по себе.
+        """
+        return getattr(item_object, 'stack_key', item_object)
+    
+    # ==================== Индексы ====================
+    
+    def _reset_indexes(self) -> None:
+        """Создает пустые вторичные индексы и сортированные представления."""
+        # Индексы: значение атрибута -> упорядоченное множество ключей стеков
+        self._by_type: Dict[int, Dict[Hashable, None]] = {}
+        self._by_rarity: Dict[int, Dict[Hashable, None]] = {}
+        self._by_level: Dict[int, Dict[Hashable, None]] = {}
+        # Сортированные представления: (порядок, тип или None) -> список ключей сортировки
+        self._sorted_views: Dict[Tuple[str, Optional[int]], List[Tuple]] = {}
+    
+    @staticmethod
+    def _sort_key(order: str, item_object: Item, seq: int, key: Hashable) -> Tuple:
+        """
+        Ключ сортировки стека в представлении.
+        
+        Порядковый номер уникален, поэтому сравнение до ключа стека не доходит.
+        """
+        rarity = getattr(item_object, 'rarity', 0)
+        level = getattr(item_object, 'level', 0)
+        if order == Inventory.SORT_BY_LEVEL:
+            return (-level, -rarity, seq, key)
+        return (-rarity, -level, seq, key)
+    
+    def _index_stack(self, key: Hashable, item_object: Item, seq: int) -> None:
+        """Добавляет новый стек во все индексы и представления."""
+        item_type = getattr(item_object, 'item_type', None)
+        self._by_type.setdefault(item_type, {})[key] = None
+        self._by_rarity.setdefault(getattr(item_object, 'rarity', None), {})[key] = None
+        self._by_level.setdefault(getattr(item_object, 'level', None), {})[key] = None
+        for order in self.SORT_ORDERS:
+            sort_key = self._sort_key(order, item_object, seq, key)
+            insort(self._sorted_views.setdefault((order, None), []), sort_key)
+            insort(self._sorted_views.setdefault((order, item_type), []), sort_key)
+    
+    def _unindex_stack(self, key: Hashable, item_object: Item, seq: int) -> None:
+        """Удаляет стек из всех индексов и представлений."""
+        item_type = getattr(item_object, 'item_type', None)
+        for index, value in ((self._by_type, item_type),
+                             (self._by_rarity, getattr(item_object, 'rarity', None)),
+                             (self._by_level, getattr(item_object, 'level', None))):
+            bucket = index.get(value)
+            if bucket is not None:
+                bucket.pop(key, None)
+                if not bucket:
+                    del index[value]
+        for order in self.SORT_ORDERS:
+            sort_key = self._sort_key(order, item_object, seq, key)
+            for view_key in ((order, None), (order, item_type)):
+                view = self._sorted_views.get(view_key)
+                if not view:
+                    continue
+                position = bisect_left(view, sort_key)
+                if position < len(view) and view[position] == sort_key:
+                    del view[position]
+    
+    def _stacks_for(self, keys) -> List[Tuple[Item, int]]:
+        """Пары (предмет, количество) для ключей стеков."""
+        stacks = self._stacks
+        return [(stacks[key][0], stacks[key][1]) for key in keys]
+    
+    @property
+    def items(self) -> Dict[Item, int]:
+        """Словарь {объект предмета: количество} (только для чтения)."""
+        return {item: quantity for item, quantity, _ in self._stacks.values()}
+    
     def add_gold(self, amount: int) -> None:
         """
         Добавляет золото в инвентарь.
@@ -74,10 +162,15 @@ class Inventory:
         :param quantity: Количество предметов для добавления
         """
         if quantity > 0:
-            if item_object in self.items:
-                self.items[item_object] += quantity
+            key = self._key_for(item_object)
+            stack = self._stacks.get(key)
+            if stack is not None:
+                stack[1] += quantity
             else:
-                self.items[item_object] = quantity
+                seq = next(self._sequence)
+                self._stacks[key] = [item_object, quantity, seq]
+                self._index_stack(key, item_object, seq)
+            self._total_count += quantity
     
     def remove_item(self, item_object: Item, quantity: int = 1) -> bool:
         """
@@ -87,16 +180,20 @@ class Inventory:
         :param quantity: Количество предметов для удаления
         :return: True если успешно, False если недостаточно предметов
         """
-        if item_object not in self.items:
+        key = self._key_for(item_object)
+        stack = self._stacks.get(key)
+        if stack is None:
             return False
         
         if quantity <= 0:
             return True
             
-        if self.items[item_object] >= quantity:
-            self.items[item_object] -= quantity
-            if self.items[item_object] == 0:
-                del self.items[item_object]
+        if stack[1] >= quantity:
+            stack[1] -= quantity
+            self._total_count -= quantity
+            if stack[1] == 0:
+                del self._stacks[key]
+                self._unindex_stack(key, stack[0], stack[2])
             return True
         return False
     
@@ -107,7 +204,8 @@ class Inventory:
         :param item_object: Объект предмета
         :return: Количество предметов
         """
-        return self.items.get(item_object, 0)
+        stack = self._stacks.get(self._key_for(item_object))
+        return stack[1] if stack is not None else 0
     
     def has_item(self, item_object: Item, quantity: int = 1) -> bool:
         """
@@ -125,7 +223,68 @@ class Inventory:
         
         :return: Словарь предметов
         """
-        return self.items.copy()
+        return self.items
+    
+    # ==================== Выборки ====================
+    
+    def get_items_by_type(self, item_type: int) -> List[Tuple[Item, int]]:
+        """
+        Возвращает предметы указанного типа.
+        
+        :param item_type: Тип предмета
+        :return: Список пар (предмет, количество) в порядке поступления
+        """
+        return self._stacks_for(self._by_type.get(item_type, ()))
+    
+    def get_items_by_rarity(self, rarity: int) -> List[Tuple[Item, int]]:
+        """
+        Возвращает предметы указанной редкости.
+        
+        :param rarity: Редкость предмета
+        :return: Список пар (предмет, количество) в порядке поступления
+        """
+        return self._stacks_for(self._by_rarity.get(rarity, ()))
+    
+    def get_items_by_level(self, level: int) -> List[Tuple[Item, int]]:
+        """
+        Возвращает предметы указанного уровня.
+        
+        :param level: Уровень предмета
+        :return: Список пар (предмет, количество) в порядке поступления
+        """
+        return self._stacks_for(self._by_level.get(level, ()))
+    
+    def get_stack_count(self, item_type: Optional[int] = None) -> int:
+        """
+        Возвращает количество стеков (строк инвентаря).
+        
+        :param item_type: Тип предмета для фильтра (None - все)
+        :return: Количество стеков
+        """
+        if item_type is None:
+            return len(self._stacks)
+        return len(self._by_type.get(item_type, ()))
+    
+    def get_sorted_items(self, order: str = SORT_BY_RARITY, start: int = 0,
+                         count: Optional[int] = None,
+                         item_type: Optional[int] = None) -> List[Tuple[Item, int]]:
+        """
+        Возвращает срез отсортированного представления инвентаря.
+        
+        Представления поддерживаются при добавлении и удалении стеков,
+        поэтому срез не требует копирования и сортировки всего инвентаря.
+        
+        :param order: Порядок сортировки (SORT_BY_RARITY или SORT_BY_LEVEL)
+        :param start: Индекс первой строки
+        :param count: Количество строк (None - до конца)
+        :param item_type: Тип предмета для фильтра (None - все)
+        :return: Список пар (предмет, количество)
+        """
+        if order not in self.SORT_ORDERS:
+            raise ValueError(f"Неизвестный порядок сортировки: {order}")
+        view = self._sorted_views.get((order, item_type), [])
+        end = None if count is None else start + count
+        return self._stacks_for(sort_key[-1] for sort_key in view[start:end])
     
     def is_empty(self) -> bool:
         """
@@ -133,12 +292,14 @@ class Inventory:
         
         :return: True если инвентарь пуст, False если есть предметы
         """
-        return len(self.items) == 0 and self.gold == 0
+        return not self._stacks and self.gold == 0
     
     def clear(self) -> None:
         """Очищает весь инвентарь."""
         self.gold = 0
-        self.items.clear()
+        self._stacks.clear()
+        self._total_count = 0
+        self._reset_indexes()
     
     def get_total_items_count(self) -> int:
         """
@@ -146,7 +307,7 @@ class Inventory:
         
         :return: Общее количество предметов
         """
-        return sum(self.items.values())
+        return self._total_count
     
     def __str__(self) -> str:
         """Возвращает строковое представление инвентаря."""
@@ -157,9 +318,9 @@ class Inventory:
         if self.gold > 0:
             result.append(f"💰 Золото: {self.gold}")
         
-        if self.items:
+        if self._stacks:
             result.append("Предметы:")
-            for item_object, quantity in self.items.items():
+            for item_object, quantity, _ in self._stacks.values():
                 # Получаем имя предмета из объекта, если возможно
                 item_name = getattr(item_object, 'name', str(item_object))
                 result.append(f"  {item_name}: {quantity}")
@@ -168,7 +329,7 @@ class Inventory:
     
     def __repr__(self) -> str:
         """Возвращает формальное строковое представление инвентаря."""
-        return f"Inventory(gold={self.gold}, items={len(self.items)})"
+        return f"Inventory(gold={self.gold}, items={len(self._stacks)})"
 
 
 # Фабричная функция для удобного получения инвентаря
@@ -1,10 +1,41 @@
 # base_item.py - Базовый класс предмета
 
+import itertools
+import weakref
 from typing import Dict, Any, List, Never, Optional
 from abc import ABC, abstractmethod
 
+from Items.item_template import (
+    AffixRecord, ItemTemplate, find_affix_id, get_template, item_fingerprint, iter_affixes, pack_affixes
+)
+
+class _StackKey:
+    """Ключ стека: общий объект для предметов с одинаковым отпечатком (сравнивается по идентичности)"""
+    __slots__ = ('__weakref__',)
+
+
+# Реестр отпечатков: одинаковые предметы получают один и тот же ключ стека.
+# Ключ держат только предметы, а реестр - слабую ссылку на него, поэтому
+# запись удаляется вместе с последним предметом с этим отпечатком
+_stack_keys: Dict[Any, 'weakref.KeyedRef'] = {}
+
+
+def _drop_stack_key(ref: 'weakref.KeyedRef') -> None:
+    """Удаляет запись реестра, когда ключ стека больше никем не используется"""
+    if _stack_keys.get(ref.key) is ref:
+        del _stack_keys[ref.key]
+
+
 class BaseItem(ABC):
-    """Базовый класс для всех предметов в игре."""
+    """
+    Базовый класс для всех предметов в игре.
+    
+    Имя, тип, редкость и данные отображения хранятся в общем шаблоне
+    (ItemTemplate), свойства - компактной записью аффиксов. Подклассы
+    должны объявлять __slots__, чтобы экземпляры не получали __dict__.
+    """
+    
+    __slots__ = ('template', 'level', '_affixes', 'item_id', 'stack_key', '_properties_text')
     
     # Константы для типов предметов
     CONSUMABLE = 0
@@ -19,7 +50,10 @@ class BaseItem(ABC):
     EPIC = 3        # Эпический
     LEGENDARY = 4   # Легендарный
     
-    def __init__(self, name: str, item_type: int, level: int = 1, rarity: int = 0, properties: Dict[str, Any] = {}):
+    # Счетчик уникальных идентификаторов экземпляров
+    _id_counter = itertools.count(1)
+    
+    def __init__(self, name: str, item_type: int, level: int = 1, rarity: int = 0, properties: Optional[Dict[str, Any]] = None):
         """
         Инициализация базового предмета.
         
@@ -29,24 +63,73 @@ class BaseItem(ABC):
         :param rarity: Редкость предмета (0-4)
         :param properties: Словарь свойств предмета
         """
-        self.name = name
-        self.item_type = item_type  # 0-consumable, 1-оружие, 2-броня, 3-аксессуар
-        self.level = level
-        self.rarity = rarity
-        self.color = self.get_rarity_color()
-        self.properties = properties if properties is not None else {}
-        
         # Валидация типа предмета
-        if self.item_type not in [0, 1, 2, 3]:
+        if item_type not in [0, 1, 2, 3]:
             raise ValueError("Тип предмета должен быть 0, 1, 2 или 3")
         
         # Валидация редкости
-        if self.rarity not in [0, 1, 2, 3, 4]:
+        if rarity not in [0, 1, 2, 3, 4]:
             raise ValueError("Редкость предмета должна быть от 0 до 4")
         
         # Валидация уровня
-        if self.level < 1:
+        if level < 1:
             raise ValueError("Уровень предмета должен быть положительным числом")
+        
+        self.template: ItemTemplate = get_template(name, item_type, rarity)
+        self.level = level
+        self._affixes: AffixRecord = pack_affixes(properties)
+        
+        # Стабильный идентификатор экземпляра и ключ стека (считается один раз)
+        self.item_id: int = next(BaseItem._id_counter)
+        self.stack_key: Optional[_StackKey] = None
+        self._properties_text: Optional[str] = None
+        self.refresh_stack_key()
+    
+    # ==================== Поля шаблона ====================
+    
+    @property
+    def name(self) -> str:
+        """Название предмета"""
+        return self.template.name
+    
+    @name.setter
+    def name(self, value: str) -> None:
+        self.template = get_template(value, self.template.item_type, self.template.rarity)
+        self.refresh_stack_key()
+    
+    @property
+    def item_type(self) -> int:
+        """Тип предмета (0-consumable, 1-оружие, 2-броня, 3-аксессуар)"""
+        return self.template.item_type
+    
+    @property
+    def rarity(self) -> int:
+        """Редкость предмета (0-4)"""
+        return self.template.rarity
+    
+    @rarity.setter
+    def rarity(self, value: int) -> None:
+        self.template = get_template(self.template.name, self.template.item_type, value)
+        self.refresh_stack_key()
+    
+    @property
+    def color(self) -> int:
+        """Цвет редкости"""
+        return self.template.color
+    
+    @property
+    def properties(self) -> Dict[str, Any]:
+        """
+        Словарь свойств, собранный из записи аффиксов.
+        
+        Это копия: изменения нужно вносить через set_property.
+        """
+        return dict(iter_affixes(self._affixes))
+    
+    @properties.setter
+    def properties(self, value: Dict[str, Any]) -> None:
+        self._affixes = pack_affixes(value)
+        self.refresh_stack_key()
     
     def get_property(self, property_name: str, default_value: Any = None) -> Any:
         """
@@ -56,7 +139,13 @@ class BaseItem(ABC):
         :param default_value: Значение по умолчанию, если свойство не найдено
         :return: Значение свойства или значение по умолчанию
         """
-        return self.properties.get(property_name, default_value)
+        affix_id = find_affix_id(property_name)
+        if affix_id is not None:
+            affixes = self._affixes
+            for index in range(0, len(affixes), 2):
+                if affixes[index] == affix_id:
+                    return affixes[index + 1]
+        return default_value
     
     def set_property(self, property_name: str, value: Any) -> None:
         """
@@ -65,7 +154,28 @@ class BaseItem(ABC):
         :param property_name: Название свойства
         :param value: Значение свойства
         """
-        self.properties[property_name] = value
+        properties = self.properties
+        properties[property_name] = value
+        self.properties = properties
+    
+    def refresh_stack_key(self) -> _StackKey:
+        """
+        Пересчитывает ключ стека по отпечатку предмета.
+        
+        Вызывается автоматически в __init__ и set_property; при прямом изменении
+        полей предмета его нужно вызвать вручную (до помещения в инвентарь).
+        
+        :return: Ключ стека
+        """
+        fingerprint = item_fingerprint(self.template.template_id, self.level, self._affixes)
+        ref = _stack_keys.get(fingerprint)
+        stack_key = ref() if ref is not None else None
+        if stack_key is None:
+            stack_key = _StackKey()
+            _stack_keys[fingerprint] = weakref.KeyedRef(stack_key, _drop_stack_key, fingerprint)
+        self.stack_key = stack_key
+        self._properties_text = None
+        return stack_key
     
     def get_all_properties(self) -> Dict[str, Any]:
         """
@@ -73,7 +183,24 @@ class BaseItem(ABC):
         
         :return: Словарь всех свойств
         """
-        return self.properties.copy()
+        return self.properties
+    
+    def get_properties_text(self) -> str:
+        """
+        Возвращает строку свойств для экрана инвентаря, например " [Strength: 2]".
+        
+        Строка кэшируется и сбрасывается вместе с ключом стека.
+        
+        :return: Текст свойств или пустая строка
+        """
+        if self._properties_text is None:
+            prop_parts = []
+            for prop_name, prop_value in iter_affixes(self._affixes):
+                if prop_value > 0:
+                    readable_name = prop_name.replace('_bonus', '').replace('_', ' ').title()
+                    prop_parts.append(f"{readable_name}: {prop_value}")
+            self._properties_text = " [" + ", ".join(prop_parts) + "]" if prop_parts else ""
+        return self._properties_text
     
     def is_consumable(self) -> bool:
         """Проверяет, является ли предмет расходуемым."""
@@ -93,35 +220,15 @@ class BaseItem(ABC):
     
     def get_item_type_name(self) -> str:
         """Возвращает строковое представление типа предмета."""
-        type_names = {
-            0: "Расходуемый",
-            1: "Оружие",
-            2: "Броня",
-            3: "Аксессуар"
-        }
-        return type_names.get(self.item_type, "Неизвестный тип")
+        return self.template.type_name
     
     def get_rarity_name(self) -> str:
         """Возвращает строковое представление редкости предмета."""
-        rarity_names = {
-            0: "Обычный",
-            1: "Необычный",
-            2: "Редкий",
-            3: "Эпический",
-            4: "Легендарный"
-        }
-        return rarity_names.get(self.rarity, "Неизвестная редкость")
+        return self.template.rarity_name
     
     def get_rarity_color(self) -> int:
         """Возвращает цвет редкости для отображения."""
-        rarity_colors = {
-            0: 7,  # Белый
-            1: 2,  # Зеленый
-            2: 4,  # Синий
-            3: 5,  # Фиолетовый
-            4: 40  # Оранжевый
-        }
-        return rarity_colors.get(self.rarity, 7)
+        return self.template.color
     
     def get_brief_display_template(self) -> tuple:
         """
@@ -213,12 +320,9 @@ class BaseItem(ABC):
         """Проверяет равенство двух предметов."""
         if not isinstance(other, BaseItem):
             return False
-        return (self.name == other.name and 
-                self.item_type == other.item_type and 
-                self.level == other.level and
-                self.rarity == other.rarity and
-                self.properties == other.properties)
+        # Одинаковые отпечатки имеют один ключ стека
+        return self.stack_key == other.stack_key
     
     def __hash__(self) -> int:
         """Хэш для использования предмета как ключа в словаре."""
-        return hash((self.name, self.item_type, self.level, self.rarity, tuple(sorted(self.properties.items()))))
\ No newline at end of file
+        return hash(self.stack_key)
\ No newline at end of file
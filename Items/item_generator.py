@@ -1,12 +1,15 @@
 # item_generator.py - Генератор предметов
 
 import random
-from typing import List, Dict, Any, Optional
+from itertools import accumulate
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from Items.base_item import BaseItem
 
 class ConsumableItem(BaseItem):
     """Класс для расходуемых предметов (зелья, свитки и т.д.)"""
     
+    __slots__ = ()
+    
     def __init__(self, name: str, level: int = 1, rarity: int = 0, properties: Dict[str, Any] = None):
         super().__init__(name, BaseItem.CONSUMABLE, level, rarity, properties)
     
@@ -30,6 +33,8 @@ class ConsumableItem(BaseItem):
 class WeaponItem(BaseItem):
     """Класс для оружия"""
     
+    __slots__ = ()
+    
     def __init__(self, name: str, level: int = 1, rarity: int = 0, properties: Dict[str, Any] = None):
         super().__init__(name, BaseItem.WEAPON, level, rarity, properties)
     
@@ -66,6 +71,8 @@ class WeaponItem(BaseItem):
 class ArmorItem(BaseItem):
     """Класс для брони"""
     
+    __slots__ = ()
+    
     def __init__(self, name: str, level: int = 1, rarity: int = 0, properties: Dict[str, Any] = None):
         super().__init__(name, BaseItem.ARMOR, level, rarity, properties)
     
@@ -102,6 +109,8 @@ class ArmorItem(BaseItem):
 class AccessoryItem(BaseItem):
     """Класс для аксессуаров"""
     
+    __slots__ = ()
+    
     def __init__(self, name: str, level: int = 1, rarity: int = 0, properties: Dict[str, Any] = None):
         super().__init__(name, BaseItem.ACCESSORY, level, rarity, properties)
     
@@ -135,6 +144,15 @@ class AccessoryItem(BaseItem):
             return True
         return False
 
+# Класс предмета по его типу
+ITEM_CLASSES = {
+    BaseItem.CONSUMABLE: ConsumableItem,
+    BaseItem.WEAPON: WeaponItem,
+    BaseItem.ARMOR: ArmorItem,
+    BaseItem.ACCESSORY: AccessoryItem,
+}
+
+
 class ItemGenerator:
     """Генератор случайных предметов"""
     
@@ -165,6 +183,9 @@ class ItemGenerator:
         "Божественный", "Великий", "Вечный", "Священный"
     ]
     
+    # Приставки для необычных предметов
+    UNCOMMON_PREFIXES = ["Улучшенный", "Крепкий", "Прочный"]
+    
     # Базовые характеристики персонажа
     CHARACTER_STATS = [
         'strength_bonus',      # Бонус силы
@@ -203,6 +224,31 @@ class ItemGenerator:
         4: 4   # Легендарный - 4 свойства
     }
     
+    # Все типы и редкости предметов
+    ITEM_TYPES = [BaseItem.CONSUMABLE, BaseItem.WEAPON, BaseItem.ARMOR, BaseItem.ACCESSORY]
+    RARITIES = [0, 1, 2, 3, 4]
+    
+    # По умолчанию: обычные чаще, легендарные реже
+    DEFAULT_RARITY_WEIGHTS = (0.5, 0.3, 0.15, 0.04, 0.01)
+    
+    # Кэш накопленных весов редкости: веса -> накопленные веса
+    _cum_weights_cache: Dict[Tuple[float, ...], List[float]] = {}
+    
+    @staticmethod
+    def _get_cum_weights(rarity_weights: Optional[Sequence[float]]) -> List[float]:
+        """
+        Возвращает накопленные веса редкости (считаются один раз на набор весов).
+        
+        :param rarity_weights: Веса редкости или None (веса по умолчанию)
+        :return: Накопленные веса для random.choices
+        """
+        key = tuple(rarity_weights) if rarity_weights is not None else ItemGenerator.DEFAULT_RARITY_WEIGHTS
+        cum_weights = ItemGenerator._cum_weights_cache.get(key)
+        if cum_weights is None:
+            cum_weights = list(accumulate(key))
+            ItemGenerator._cum_weights_cache[key] = cum_weights
+        return cum_weights
+    
     @staticmethod
     def generate_random_item(item_type: Optional[int] = None, 
                            min_level: int = 1, 
@@ -219,63 +265,137 @@ class ItemGenerator:
         """
         # Если тип не указан, выбираем случайный
         if item_type is None:
-            item_type = random.choice([BaseItem.CONSUMABLE, BaseItem.WEAPON, BaseItem.ARMOR, BaseItem.ACCESSORY])
+            item_type = random.choice(ItemGenerator.ITEM_TYPES)
         
         # Генерируем уровень
         level = random.randint(min_level, max_level)
         
         # Генерируем редкость
-        if rarity_weights is None:
-            # По умолчанию: обычные чаще, легендарные реже
-            rarity_weights = [0.5, 0.3, 0.15, 0.04, 0.01]
+        rarity = random.choices(ItemGenerator.RARITIES,
+                                cum_weights=ItemGenerator._get_cum_weights(rarity_weights))[0]
+        
+        return ItemGenerator._build_item(item_type, level, rarity)
+    
+    @staticmethod
+    def generate_items(n: int,
+                       level_range: Tuple[int, int] = (1, 10),
+                       item_type: Optional[int] = None,
+                       rarity_weights: Optional[Sequence[float]] = None,
+                       levels: Optional[Sequence[int]] = None) -> List[BaseItem]:
+        """
+        Генерирует партию случайных предметов.
         
-        rarity = random.choices([0, 1, 2, 3, 4], weights=rarity_weights)[0]
+        Типы, редкости и уровни выбираются сразу для всей партии
+        по заранее накопленным весам, затем предметы собираются за один проход.
         
-        # Генерируем имя
-        name = ItemGenerator._generate_item_name(item_type, rarity)
+        :param n: Количество предметов
+        :param level_range: Диапазон уровней (минимальный, максимальный), включительно
+        :param item_type: Тип предметов (0-3), если None - случайный для каждого
+        :param rarity_weights: Веса редкости [обычный, необычный, редкий, эпический, легендарный]
+        :param levels: Готовые уровни предметов (длины n), заменяют level_range
+        :return: Список сгенерированных предметов
+        """
+        if n <= 0:
+            return []
+        
+        if item_type is None:
+            item_types = random.choices(ItemGenerator.ITEM_TYPES, k=n)
+        else:
+            item_types = [item_type] * n
         
-        # Генерируем свойства
+        if levels is None:
+            min_level, max_level = level_range
+            levels = random.choices(range(min_level, max_level + 1), k=n)
+        elif len(levels) != n:
+            raise ValueError("Количество уровней должно совпадать с количеством предметов")
+        
+        rarities = random.choices(ItemGenerator.RARITIES,
+                                  cum_weights=ItemGenerator._get_cum_weights(rarity_weights), k=n)
+        
+        build_item = ItemGenerator._build_item
+        return [build_item(t, level, rarity) for t, level, rarity in zip(item_types, levels, rarities)]
+    
+    @staticmethod
+    def _build_item(item_type: int, level: int, rarity: int) -> BaseItem:
+        """
+        Собирает предмет: генерирует имя и свойства.
+        
+        :param item_type: Тип предмета
+        :param level: Уровень предмета
+        :param rarity: Редкость предмета
+        :return: Предмет
+        """
+        name = ItemGenerator._generate_item_name(item_type, rarity)
         properties = ItemGenerator._generate_item_properties(item_type, rarity, level)
+        return ItemGenerator.create_item(item_type, name, level, rarity, properties)
+    
+    @staticmethod
+    def create_item(item_type: int, name: str, level: int, rarity: int,
+                    properties: Dict[str, Any]) -> BaseItem:
+        """
+        Создает объект предмета нужного класса по типу.
         
-        # Создаем предмет в зависимости от типа
-        if item_type == BaseItem.CONSUMABLE:
-            return ConsumableItem(name, level, rarity, properties)
-        elif item_type == BaseItem.WEAPON:
-            return WeaponItem(name, level, rarity, properties)
-        elif item_type == BaseItem.ARMOR:
-            return ArmorItem(name, level, rarity, properties)
-        elif item_type == BaseItem.ACCESSORY:
-            return AccessoryItem(name, level, rarity, properties)
+        :param item_type: Тип предмета
+        :param name: Название
+        :param level: Уровень
+        :param rarity: Редкость
+        :param properties: Свойства
+        :return: Предмет
+        """
+        item_class = ITEM_CLASSES.get(item_type)
+        if item_class is not None:
+            return item_class(name, level, rarity, properties)
         
         # На случай ошибки
         return BaseItem(name, item_type, level, rarity, properties)
     
     @staticmethod
-    def _generate_item_name(item_type: int, rarity: int) -> str:
-        """Генерирует имя предмета."""
-        # Выбираем базовое имя по типу
+    def _get_base_names(item_type: int) -> List[str]:
+        """Базовые имена предметов указанного типа."""
         if item_type == BaseItem.WEAPON:
-            base_name = random.choice(ItemGenerator.WEAPON_NAMES)
+            return ItemGenerator.WEAPON_NAMES
         elif item_type == BaseItem.ARMOR:
-            base_name = random.choice(ItemGenerator.ARMOR_NAMES)
+            return ItemGenerator.ARMOR_NAMES
         elif item_type == BaseItem.CONSUMABLE:
-            base_name = random.choice(ItemGenerator.CONSUMABLE_NAMES)
+            return ItemGenerator.CONSUMABLE_NAMES
         elif item_type == BaseItem.ACCESSORY:
-            base_name = random.choice(ItemGenerator.ACCESSORY_NAMES)
-        else:
-            base_name = "Предмет"
+            return ItemGenerator.ACCESSORY_NAMES
+        return ["Предмет"]
+    
+    @staticmethod
+    def _generate_item_name(item_type: int, rarity: int) -> str:
+        """Генерирует имя предмета."""
+        # Выбираем базовое имя по типу
+        base_name = random.choice(ItemGenerator._get_base_names(item_type))
         
         # Для редких предметов добавляем модификатор
         if rarity >= 2:  # Редкий и выше
             modifier = random.choice(ItemGenerator.RARE_MODIFIERS)
             return f"{modifier} {base_name}"
         elif rarity == 1:  # Необычный
-            prefixes = ["Улучшенный", "Крепкий", "Прочный"]
-            prefix = random.choice(prefixes)
+            prefix = random.choice(ItemGenerator.UNCOMMON_PREFIXES)
             return f"{prefix} {base_name}"
         
         return base_name
     
+    @staticmethod
+    def get_name_pool(item_type: int, rarity: int) -> List[str]:
+        """
+        Возвращает все возможные имена предмета (равновероятные).
+        
+        :param item_type: Тип предмета
+        :param rarity: Редкость предмета
+        :return: Список имен
+        """
+        base_names = ItemGenerator._get_base_names(item_type)
+        if rarity >= 2:
+            return [f"{modifier} {base_name}"
+                    for modifier in ItemGenerator.RARE_MODIFIERS for base_name in base_names]
+        elif rarity == 1:
+            return [f"{prefix} {base_name}"
+                    for prefix in ItemGenerator.UNCOMMON_PREFIXES for base_name in base_names]
+        return list(base_names)
+    
     @staticmethod
     def _calculate_stat_value(base_value: int, level: int, rarity: int) -> int:
         """
@@ -299,45 +419,34 @@ class ItemGenerator:
         return max(1, int(final_value))
     
     @staticmethod
-    def _generate_item_properties(item_type: int, rarity: int, level: int) -> Dict[str, Any]:
-        """Генерирует свойства предмета."""
-        properties = {}
+    def get_affix_pool(item_type: int, rarity: int, level: int) -> Tuple[int, List[Tuple[str, int]]]:
+        """
+        Возвращает пул возможных свойств предмета с уже рассчитанными значениями.
         
+        :param item_type: Тип предмета
+        :param rarity: Редкость предмета
+        :param level: Уровень предмета
+        :return: Пара (сколько свойств выбрать, список пар (свойство, значение))
+        """
         # Определяем количество свойств для данного предмета
         num_properties = ItemGenerator.PROPERTIES_COUNT_BY_RARITY.get(rarity, 1)
         
         if item_type == BaseItem.CONSUMABLE:
-            # Для расходуемых предметов все параметры влияют на эффект
-            # Выбираем свойства для расходуемого предмета
-            consumable_props = list(ItemGenerator.BASE_CONSUMABLE_VALUES.keys())
-            
-            # Выбираем нужное количество свойств
-            if len(consumable_props) >= num_properties:
-                selected_props = random.sample(consumable_props, num_properties)
-            else:
-                selected_props = consumable_props
-            
-            # Рассчитываем значения для каждого свойства
-            for prop in selected_props:
-                base_value = ItemGenerator.BASE_CONSUMABLE_VALUES[prop]
-                # Для расходуемых предметов и уровень, и редкость влияют на эффект
-                final_value = ItemGenerator._calculate_stat_value(base_value, level, rarity)
-                properties[prop] = final_value
+            # Для расходуемых предметов и уровень, и редкость влияют на эффект
+            pool = [(prop, ItemGenerator._calculate_stat_value(base_value, level, rarity))
+                    for prop, base_value in ItemGenerator.BASE_CONSUMABLE_VALUES.items()]
         else:
-            # Для экипировки выбираем характеристики
-            if len(ItemGenerator.CHARACTER_STATS) >= num_properties:
-                selected_stats = random.sample(ItemGenerator.CHARACTER_STATS, num_properties)
-            else:
-                selected_stats = ItemGenerator.CHARACTER_STATS
-            
-            # Рассчитываем значения для каждой характеристики
-            for stat in selected_stats:
-                base_value = ItemGenerator.BASE_STAT_VALUES[stat]
-                # Для экипировки уровень влияет на значение, редкость влияет на количество свойств
-                final_value = ItemGenerator._calculate_stat_value(base_value, level, 1)  # Базовая редкость для значения
-                properties[stat] = final_value
+            # Для экипировки уровень влияет на значение, редкость влияет на количество свойств
+            pool = [(stat, ItemGenerator._calculate_stat_value(ItemGenerator.BASE_STAT_VALUES[stat], level, 1))
+                    for stat in ItemGenerator.CHARACTER_STATS]
         
-        return properties
+        return min(num_properties, len(pool)), pool
+    
+    @staticmethod
+    def _generate_item_properties(item_type: int, rarity: int, level: int) -> Dict[str, Any]:
+        """Генерирует свойства предмета."""
+        count, pool = ItemGenerator.get_affix_pool(item_type, rarity, level)
+        return dict(random.sample(pool, count))
     
     @staticmethod
     def generate_loot_pack(num_items: int = 3, 
@@ -353,12 +462,5 @@ class ItemGenerator:
         :param rarity_weights: Веса редкости
         :return: Список сгенерированных предметов
         """
-        items = []
-        for _ in range(num_items):
-            item = ItemGenerator.generate_random_item(
-                min_level=min_level,
-                max_level=max_level,
-                rarity_weights=rarity_weights
-            )
-            items.append(item)
-        return items
\ No newline at end of file
+        return ItemGenerator.generate_items(num_items, (min_level, max_level),
+                                            rarity_weights=rarity_weights)
\ No newline at end of file
@@ -0,0 +1,157 @@
+# Items/item_template.py - Общие шаблоны предметов и компактные аффиксы
+"""
+Разделяемые части предметов.
+
+ItemTemplate хранит то, что одинаково у множества предметов: имя, тип,
+редкость и данные для отображения. Шаблоны интернируются, поэтому тысячи
+"Кинжалов" ссылаются на один объект. Свойства предмета хранятся отдельно
+компактной записью: массив чисел (id свойства, значение, id, значение, ...).
+"""
+
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+
+# ==================== Реестр свойств ====================
+_affix_names: List[str] = []
+_affix_ids: Dict[str, int] = {}
+
+
+def get_affix_id(property_name: str) -> int:
+    """
+    Возвращает числовой id свойства (регистрирует новое при первом обращении).
+
+    :param property_name: Название свойства, например 'strength_bonus'
+    :return: Id свойства
+    """
+    affix_id = _affix_ids.get(property_name)
+    if affix_id is None:
+        affix_id = len(_affix_names)
+        _affix_names.append(property_name)
+        _affix_ids[property_name] = affix_id
+    return affix_id
+
+
+def get_affix_name(affix_id: int) -> str:
+    """Возвращает название свойства по id."""
+    return _affix_names[affix_id]
+
+
+def find_affix_id(property_name: str) -> Optional[int]:
+    """Возвращает id свойства или None, если такое свойство не встречалось."""
+    return _affix_ids.get(property_name)
+
+
+# ==================== Запись аффиксов ====================
+# Массив int для целочисленных значений, кортеж - если встретились другие значения
+AffixRecord = Union[array, Tuple[Any, ...]]
+
+EMPTY_AFFIXES: AffixRecord = ()
+
+
+def pack_affixes(properties: Optional[Dict[str, Any]]) -> AffixRecord:
+    """
+    Упаковывает словарь свойств в компактную запись.
+
+    :param properties: Словарь свойств
+    :return: Плоская запись (id, значение, id, значение, ...)
+    """
+    if not properties:
+        return EMPTY_AFFIXES
+    flat: List[Any] = []
+    for property_name, value in properties.items():
+        flat.append(get_affix_id(property_name))
+        flat.append(value)
+    if all(type(value) is int and -2**31 <= value < 2**31 for value in flat):
+        return array('i', flat)
+    return tuple(flat)
+
+
+def iter_affixes(record: AffixRecord) -> Iterator[Tuple[str, Any]]:
+    """Перебирает пары (название свойства, значение) записи."""
+    for index in range(0, len(record), 2):
+        yield _affix_names[record[index]], record[index + 1]
+
+
+def item_fingerprint(template_id: int, level: int, record: AffixRecord) -> Union[bytes, Tuple[Any, ...]]:
+    """
+    Канонический отпечаток предмета (не зависит от порядка свойств).
+
+    Для целочисленных записей это упакованные байты - реестр ключей стеков
+    хранит по одному отпечатку на уникальный предмет, поэтому он должен быть компактным.
+
+    :param template_id: Id шаблона
+    :param level: Уровень предмета
+    :param record: Запись аффиксов
+    :return: Отпечаток
+    """
+    pairs = sorted(zip(record[0::2], record[1::2]))
+    flat = [template_id, level]
+    for affix_id, value in pairs:
+        flat.append(affix_id)
+        flat.append(value)
+    if isinstance(record, array) and -2**31 <= level < 2**31:
+        return array('i', flat).tobytes()
+    return tuple(flat)
+
+
+# ==================== Шаблоны ====================
+class ItemTemplate:
+    """Общая неизменяемая часть предмета: имя, тип, редкость и данные отображения."""
+
+    __slots__ = ('template_id', 'name', 'item_type', 'rarity', 'color',
+                 'type_name', 'rarity_name')
+
+    # Названия типов и редкостей, цвета редкостей
+    TYPE_NAMES = {
+        0: "Расходуемый",
+        1: "Оружие",
+        2: "Броня",
+        3: "Аксессуар"
+    }
+    RARITY_NAMES = {
+        0: "Обычный",
+        1: "Необычный",
+        2: "Редкий",
+        3: "Эпический",
+        4: "Легендарный"
+    }
+    RARITY_COLORS = {
+        0: 7,  # Белый
+        1: 2,  # Зеленый
+        2: 4,  # Синий
+        3: 5,  # Фиолетовый
+        4: 40  # Оранжевый
+    }
+
+    def __init__(self, template_id: int, name: str, item_type: int, rarity: int) -> None:
+        self.template_id: int = template_id
+        self.name: str = name
+        self.item_type: int = item_type
+        self.rarity: int = rarity
+        self.color: int = self.RARITY_COLORS.get(rarity, 7)
+        self.type_name: str = self.TYPE_NAMES.get(item_type, "Неизвестный тип")
+        self.rarity_name: str = self.RARITY_NAMES.get(rarity, "Неизвестная редкость")
+
+    def __repr__(self) -> str:
+        return f"ItemTemplate(name='{self.name}', type={self.item_type}, rarity={self.rarity})"
+
+
+_templates: Dict[Tuple[str, int, int], ItemTemplate] = {}
+
+
+def get_template(name: str, item_type: int, rarity: int) -> ItemTemplate:
+    """
+    Возвращает общий шаблон предмета (создает при первом обращении).
+
+    :param name: Название предмета
+    :param item_type: Тип предмета
+    :param rarity: Редкость предмета
+    :return: Шаблон
+    """
+    key = (name, item_type, rarity)
+    template = _templates.get(key)
+    if template is None:
+        template = ItemTemplate(len(_templates) + 1, name, item_type, rarity)
+        _templates[key] = template
+    return template
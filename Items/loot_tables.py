@@ -0,0 +1,185 @@
+# Items/loot_tables.py - Скомпилированные таблицы лута
+"""
+Таблицы лута, скомпилированные по уровню врага.
+
+Веса редкости, распределение уровней, количество и значения свойств
+рассчитываются один раз при сборке таблицы. Каждый дроп - несколько
+выборок из таблиц Уолкера (alias method) за O(1).
+"""
+
+import random
+from typing import Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from Items.base_item import BaseItem
+from Items.item_generator import ItemGenerator
+
+T = TypeVar('T')
+
+
+# ==================== Метод Уолкера ====================
+class AliasTable(Generic[T]):
+    """Дискретное распределение с выборкой за O(1) (метод псевдонимов Уолкера/Воуза)."""
+
+    def __init__(self, outcomes: Sequence[T], weights: Sequence[float]) -> None:
+        """
+        Строит таблицу псевдонимов.
+
+        :param outcomes: Исходы
+        :param weights: Неотрицательные веса исходов (не обязательно нормированные)
+        """
+        if not outcomes or len(outcomes) != len(weights):
+            raise ValueError("Количество исходов и весов должно совпадать и быть больше нуля")
+        total = float(sum(weights))
+        if total <= 0 or any(weight < 0 for weight in weights):
+            raise ValueError("Веса должны быть неотрицательными с положительной суммой")
+
+        size = len(outcomes)
+        self.outcomes: List[T] = list(outcomes)
+        self._probability: List[float] = [0.0] * size
+        self._alias: List[int] = [0] * size
+
+        scaled = [weight * size / total for weight in weights]
+        small = [index for index, value in enumerate(scaled) if value < 1.0]
+        large = [index for index, value in enumerate(scaled) if value >= 1.0]
+
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self._probability[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+        # Остатки из-за погрешности округления - вероятность 1
+        for index in large + small:
+            self._probability[index] = 1.0
+            self._alias[index] = index
+
+    def sample(self) -> T:
+        """Возвращает случайный исход (одно обращение к генератору)."""
+        position = random.random() * len(self.outcomes)
+        index = int(position)
+        if position - index < self._probability[index]:
+            return self.outcomes[index]
+        return self.outcomes[self._alias[index]]
+
+    def sample_many(self, count: int) -> List[T]:
+        """Возвращает count случайных исходов."""
+        sample = self.sample
+        return [sample() for _ in range(count)]
+
+
+# ==================== Таблица лута ====================
+class LootTable:
+    """Таблица лута для максимального уровня побежденных врагов."""
+
+    def __init__(self, max_enemy_level: int, rarity_weights: Sequence[float]) -> None:
+        """
+        Компилирует таблицу лута.
+
+        Уровень предмета распределен так же, как в BattleRewards.generate_loot:
+        базовый уровень от max_enemy_level-2 (не ниже 1) до max_enemy_level+1
+        и случайная прибавка 0 или 1.
+
+        :param max_enemy_level: Максимальный уровень врагов
+        :param rarity_weights: Веса редкости [обычный, необычный, редкий, эпический, легендарный]
+        """
+        self.max_enemy_level: int = max_enemy_level
+        min_level = max(1, max_enemy_level - 2)
+        base_levels = range(min_level, max_enemy_level + 2)
+
+        level_weights: Dict[int, float] = {}
+        for base_level in base_levels:
+            for level in (base_level, base_level + 1):
+                level_weights[level] = level_weights.get(level, 0.0) + 0.5
+
+        self.item_types: AliasTable[int] = AliasTable(ItemGenerator.ITEM_TYPES,
+                                                      [1.0] * len(ItemGenerator.ITEM_TYPES))
+        self.levels: AliasTable[int] = AliasTable(list(level_weights), list(level_weights.values()))
+        self.rarities: AliasTable[int] = AliasTable(ItemGenerator.RARITIES, list(rarity_weights))
+
+        # Имена и пулы свойств с готовыми значениями
+        self._names: Dict[Tuple[int, int], List[str]] = {
+            (item_type, rarity): ItemGenerator.get_name_pool(item_type, rarity)
+            for item_type in ItemGenerator.ITEM_TYPES
+            for rarity in ItemGenerator.RARITIES
+        }
+        self._affixes: Dict[Tuple[int, int, int], Tuple[int, List[Tuple[str, int]]]] = {
+            (item_type, rarity, level): ItemGenerator.get_affix_pool(item_type, rarity, level)
+            for item_type in ItemGenerator.ITEM_TYPES
+            for rarity in ItemGenerator.RARITIES
+            for level in level_weights
+        }
+
+    def generate_item(self) -> BaseItem:
+        """Создает один предмет из таблицы."""
+        item_type = self.item_types.sample()
+        level = self.levels.sample()
+        rarity = self.rarities.sample()
+
+        count, pool = self._affixes[(item_type, rarity, level)]
+        properties = dict(random.sample(pool, count))
+        name = random.choice(self._names[(item_type, rarity)])
+        return ItemGenerator.create_item(item_type, name, level, rarity, properties)
+
+    def generate_items(self, count: int) -> List[BaseItem]:
+        """
+        Создает партию предметов из таблицы.
+
+        :param count: Количество предметов
+        :return: Список предметов
+        """
+        generate_item = self.generate_item
+        return [generate_item() for _ in range(count)]
+
+
+# ==================== Кэш таблиц ====================
+_tables: Dict[Tuple[int, Tuple[float, ...]], LootTable] = {}
+_config_signature: Optional[Tuple] = None
+
+
+def _current_config_signature() -> Tuple:
+    """Снимок настроек генератора, от которых зависят таблицы."""
+    return (
+        tuple(ItemGenerator.CHARACTER_STATS),
+        tuple(sorted(ItemGenerator.BASE_STAT_VALUES.items())),
+        tuple(sorted(ItemGenerator.BASE_CONSUMABLE_VALUES.items())),
+        tuple(sorted(ItemGenerator.PROPERTIES_COUNT_BY_RARITY.items())),
+        tuple(ItemGenerator.WEAPON_NAMES), tuple(ItemGenerator.ARMOR_NAMES),
+        tuple(ItemGenerator.CONSUMABLE_NAMES), tuple(ItemGenerator.ACCESSORY_NAMES),
+        tuple(ItemGenerator.RARE_MODIFIERS), tuple(ItemGenerator.UNCOMMON_PREFIXES),
+    )
+
+
+def get_loot_table(max_enemy_level: int, rarity_weights: Sequence[float]) -> LootTable:
+    """
+    Возвращает таблицу лута для уровня врагов, компилируя ее при первом обращении.
+
+    Если настройки ItemGenerator изменились, все таблицы пересобираются.
+
+    :param max_enemy_level: Максимальный уровень побежденных врагов
+    :param rarity_weights: Веса редкости
+    :return: Таблица лута
+    """
+    global _config_signature
+    signature = _current_config_signature()
+    if signature != _config_signature:
+        _tables.clear()
+        _config_signature = signature
+
+    key = (max_enemy_level, tuple(rarity_weights))
+    table = _tables.get(key)
+    if table is None:
+        table = LootTable(max_enemy_level, rarity_weights)
+        _tables[key] = table
+    return table
+
+
+def clear_loot_tables() -> None:
+    """Сбрасывает все скомпилированные таблицы."""
+    global _config_signature
+    _tables.clear()
+    _config_signature = None
@@ -0,0 +1,123 @@
+# Persistence/save_format.py
+"""
+Бинарный формат файла сохранения.
+
+Структура файла:
+    заголовок:  MAGIC (8 байт), версия формата (uint16), число секций (uint16)
+    секции:     имя (16 байт, utf-8), число записей (uint32),
+                длина данных (uint32), CRC32 данных (uint32), данные
+
+Данные секции - JSON, сжатый zlib. Число записей хранится вне сжатых
+данных, чтобы читать структуру файла без распаковки (история боев
+разбита на секции-чанки и распаковывается только по требованию).
+"""
+
+import json
+import os
+import struct
+import zlib
+from typing import Any, List, NamedTuple
+
+MAGIC = b"BTLSAVE\x00"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sHH")
+_SECTION = struct.Struct("<16sIII")
+
+
+class SaveFormatError(ValueError):
+    """Файл сохранения поврежден или имеет неподдерживаемый формат"""
+
+
+class Section(NamedTuple):
+    """Секция файла сохранения (данные в сжатом виде)"""
+    name: str
+    count: int
+    payload: bytes
+
+
+# ==================== Кодирование данных ====================
+def encode_payload(data: Any) -> bytes:
+    """
+    Кодирует данные секции: компактный JSON, сжатый zlib.
+
+    :param data: Данные (должны сериализоваться в JSON)
+    :return: Сжатые байты
+    """
+    raw = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return zlib.compress(raw, 6)
+
+
+def decode_payload(payload: bytes) -> Any:
+    """
+    Декодирует данные секции.
+
+    :param payload: Сжатые байты
+    :return: Данные
+    """
+    try:
+        return json.loads(zlib.decompress(payload).decode('utf-8'))
+    except (zlib.error, UnicodeDecodeError, ValueError) as e:
+        raise SaveFormatError(f"Поврежденные данные секции: {e}") from e
+
+
+# ==================== Запись и чтение файла ====================
+def write_save_file(path: str, sections: List[Section]) -> int:
+    """
+    Записывает файл сохранения атомарно (через временный файл).
+
+    :param path: Путь к файлу
+    :param sections: Секции
+    :return: Размер файла в байтах
+    """
+    parts = [_HEADER.pack(MAGIC, FORMAT_VERSION, len(sections))]
+    for section in sections:
+        name = section.name.encode('utf-8')
+        if len(name) > 16:
+            raise ValueError(f"Слишком длинное имя секции: {section.name}")
+        parts.append(_SECTION.pack(name, section.count, len(section.payload),
+                                   zlib.crc32(section.payload)))
+        parts.append(section.payload)
+    data = b"".join(parts)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, path)
+    return len(data)
+
+
+def read_save_file(path: str) -> List[Section]:
+    """
+    Читает структуру файла сохранения. Данные секций не распаковываются.
+
+    :param path: Путь к файлу
+    :return: Секции в порядке записи
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if len(data) < _HEADER.size:
+        raise SaveFormatError("Файл сохранения слишком короткий")
+    magic, version, section_count = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise SaveFormatError("Файл не является сохранением игры")
+    if version > FORMAT_VERSION:
+        raise SaveFormatError(f"Неподдерживаемая версия сохранения: {version}")
+
+    sections: List[Section] = []
+    offset = _HEADER.size
+    for _ in range(section_count):
+        if offset + _SECTION.size > len(data):
+            raise SaveFormatError("Файл сохранения обрезан")
+        name, count, length, crc = _SECTION.unpack_from(data, offset)
+        offset += _SECTION.size
+        payload = data[offset:offset + length]
+        if len(payload) != length or zlib.crc32(payload) != crc:
+            raise SaveFormatError("Контрольная сумма секции не совпадает")
+        offset += length
+        sections.append(Section(name.rstrip(b"\x00").decode('utf-8'), count, payload))
+    return sections
@@ -0,0 +1,199 @@
+# Persistence/save_manager.py
+"""
+Сохранение и загрузка состояния игры.
+
+Сохраняются команда (уровни, опыт, характеристики, умения, экипировка),
+инвентарь с золотом и статистика боев. История боев хранится
+чанками и только дописывается: закрытые чанки сжимаются один раз и
+при следующих сохранениях записываются в файл как есть, поэтому
+автосохранение после боя не пересобирает всю историю. При загрузке
+история не распаковывается, пока ее не запросит окно статистики.
+"""
+
+import os
+import time
+from typing import List, Optional, Tuple
+
+from Battle.battle_statistics import BattleStatistics, BattleSummaryRecord, CombatActionRecord, get_battle_statistics
+from Characters.player_classes import Player
+from Config.game_config import SAVE_FILE_PATH, SAVE_HISTORY_CHUNK_BATTLES
+from Inventory.inventory import Inventory, get_inventory
+from Persistence.save_format import (
+    Section, SaveFormatError, decode_payload, encode_payload, read_save_file, write_save_file
+)
+from Persistence import serializers
+
+# Имена секций файла
+SECTION_PARTY = "party"
+SECTION_INVENTORY = "inventory"
+SECTION_TOTALS = "totals"
+SECTION_HISTORY = "history"
+
+
+class SaveManager:
+    """Менеджер сохранений (Singleton)."""
+
+    _instance: Optional['SaveManager'] = None
+
+    def __init__(self, path: str = SAVE_FILE_PATH,
+                 chunk_battles: int = SAVE_HISTORY_CHUNK_BATTLES) -> None:
+        """
+        :param path: Путь к файлу сохранения
+        :param chunk_battles: Количество битв в одном чанке истории
+        """
+        self.path: str = path
+        self.chunk_battles: int = max(1, chunk_battles)
+        # Закрытые чанки истории в сжатом виде: (число битв, данные)
+        self._closed_chunks: List[Tuple[int, bytes]] = []
+        self._closed_battles: int = 0
+
+    @classmethod
+    def get_instance(cls) -> 'SaveManager':
+        """Возвращает экземпляр менеджера сохранений (создает, если не существует)."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """Сбрасывает инстанс для тестирования."""
+        cls._instance = None
+
+    # ==================== Сохранение ====================
+    def save(self, players: List[Player], inventory: Optional[Inventory] = None,
+             statistics: Optional[BattleStatistics] = None) -> int:
+        """
+        Сохраняет состояние игры.
+
+        :param players: Команда игрока
+        :param inventory: Инвентарь (по умолчанию - общий)
+        :param statistics: Статистика боев (по умолчанию - общая)
+        :return: Размер файла в байтах
+        """
+        inventory = inventory or get_inventory()
+        statistics = statistics or get_battle_statistics()
+
+        sections = [
+            Section(SECTION_PARTY, len(players),
+                    encode_payload([serializers.player_to_data(player) for player in players])),
+            Section(SECTION_INVENTORY, 0, encode_payload(serializers.inventory_to_data(inventory))),
+            Section(SECTION_TOTALS, statistics.get_history_count(),
+                    encode_payload(serializers.totals_to_data(statistics.game_totals))),
+        ]
+        sections.extend(self._history_sections(statistics))
+        return write_save_file(self.path, sections)
+
+    def _history_sections(self, statistics: BattleStatistics) -> List[Section]:
+        """
+        Секции истории: закрытые чанки берутся из кэша, новые битвы
+        дописываются в чанки по chunk_battles, неполный хвост кодируется заново.
+        """
+        new_battles = statistics.get_history_since(self._closed_battles)
+
+        # Закрываем полные чанки - они больше не перекодируются
+        while len(new_battles) >= self.chunk_battles:
+            chunk, new_battles = new_battles[:self.chunk_battles], new_battles[self.chunk_battles:]
+            self._close_chunk(chunk)
+
+        sections = [Section(SECTION_HISTORY, count, payload) for count, payload in self._closed_chunks]
+        if new_battles:
+            sections.append(Section(SECTION_HISTORY, len(new_battles), self._encode_chunk(new_battles)))
+        return sections
+
+    @staticmethod
+    def _encode_chunk(battles: List[Tuple[BattleSummaryRecord, List[CombatActionRecord]]]) -> bytes:
+        """Кодирует чанк истории"""
+        return encode_payload([serializers.battle_to_data(summary, records) for summary, records in battles])
+
+    def _close_chunk(self, battles: List[Tuple[BattleSummaryRecord, List[CombatActionRecord]]]) -> None:
+        """Кодирует и запоминает закрытый чанк истории"""
+        self._closed_chunks.append((len(battles), self._encode_chunk(battles)))
+        self._closed_battles += len(battles)
+
+    # ==================== Загрузка ====================
+    def load(self, inventory: Optional[Inventory] = None,
+             statistics: Optional[BattleStatistics] = None) -> Optional[List[Player]]:
+        """
+        Загружает состояние игры.
+
+        Команда, инвентарь и итоги статистики восстанавливаются сразу,
+        история боев - лениво, при первом обращении к ней.
+
+        :param inventory: Инвентарь (по умолчанию - общий)
+        :param statistics: Статистика боев (по умолчанию - общая)
+        :return: Команда игрока или None, если сохранения нет
+        :raises SaveFormatError: Если файл поврежден
+        """
+        try:
+            sections = read_save_file(self.path)
+        except FileNotFoundError:
+            return None
+
+        inventory = inventory or get_inventory()
+        statistics = statistics or get_battle_statistics()
+
+        by_name = {section.name: section for section in sections}
+        for required in (SECTION_PARTY, SECTION_INVENTORY, SECTION_TOTALS):
+            if required not in by_name:
+                raise SaveFormatError(f"В сохранении нет секции '{required}'")
+
+        try:
+            players = [serializers.player_from_data(data)
+                       for data in decode_payload(by_name[SECTION_PARTY].payload)]
+            serializers.restore_inventory(inventory, decode_payload(by_name[SECTION_INVENTORY].payload))
+            totals = serializers.totals_from_data(decode_payload(by_name[SECTION_TOTALS].payload))
+        except (KeyError, TypeError, ValueError) as e:
+            raise SaveFormatError(f"Некорректные данные сохранения: {e}") from e
+
+        # Чанки истории остаются сжатыми: они же пойдут в следующие сохранения
+        self._closed_chunks = [(section.count, section.payload)
+                               for section in sections if section.name == SECTION_HISTORY]
+        self._closed_battles = sum(count for count, _ in self._closed_chunks)
+
+        statistics.restore(totals, self._make_history_loader(list(self._closed_chunks)),
+                           self._closed_battles)
+        return players
+
+    def quarantine(self) -> str:
+        """
+        Переименовывает непрочитанный файл сохранения, чтобы автосохранение
+        новой игры не записало поверх него.
+
+        :return: Новый путь файла
+        :raises OSError: Если переименовать не удалось
+        """
+        bad_path = f"{self.path}.bad-{time.strftime('%Y%m%d-%H%M%S')}"
+        os.replace(self.path, bad_path)
+        return bad_path
+
+    @staticmethod
+    def _make_history_loader(chunks: List[Tuple[int, bytes]]):
+        """Создает загрузчик истории для BattleStatistics"""
+        def load_history() -> Tuple[List[BattleSummaryRecord], List[CombatActionRecord]]:
+            summaries: List[BattleSummaryRecord] = []
+            records: List[CombatActionRecord] = []
+            for _, payload in chunks:
+                serializers.history_chunk_from_data(decode_payload(payload), summaries, records)
+            return summaries, records
+        return load_history
+
+
+# ==================== Функции доступа ====================
+def get_save_manager() -> SaveManager:
+    """Возвращает экземпляр менеджера сохранений (Singleton)."""
+    return SaveManager.get_instance()
+
+
+def save_game(players: List[Player]) -> int:
+    """Сохраняет игру в файл по умолчанию. Возвращает размер файла."""
+    return get_save_manager().save(players)
+
+
+def load_game() -> Optional[List[Player]]:
+    """Загружает игру из файла по умолчанию. Возвращает команду или None."""
+    return get_save_manager().load()
+
+
+def quarantine_save() -> str:
+    """Откладывает поврежденный файл сохранения по умолчанию. Возвращает его новый путь."""
+    return get_save_manager().quarantine()
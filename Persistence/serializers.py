@@ -0,0 +1,162 @@
+# Persistence/serializers.py
+"""Преобразование игровых объектов в данные сохранения и обратно"""
+
+from collections import defaultdict
+from dataclasses import fields
+from typing import Any, Dict, List, Tuple, Type
+
+from Battle.battle_statistics import (
+    BattleSummaryRecord, CharacterBattleStats, CombatActionRecord, GameTotalsRecord
+)
+from Characters.player_classes import Archer, Healer, Mage, Player, Rogue, Tank, Warrior
+from Inventory.inventory import Inventory
+from Items.base_item import BaseItem
+
+# Классы игроков по имени класса
+PLAYER_CLASSES: Dict[str, Type[Player]] = {
+    cls.__name__: cls for cls in (Tank, Warrior, Rogue, Archer, Mage, Healer)
+}
+
+# Основные характеристики, которые хранятся явно
+STAT_NAMES = ('strength', 'dexterity', 'intelligence', 'constitution')
+
+# Порядок полей записи действия (записи хранятся списками, а не словарями)
+ACTION_FIELDS = tuple(f.name for f in fields(CombatActionRecord))
+
+
+# ==================== Предметы ====================
+def item_to_data(item: BaseItem) -> List[Any]:
+    """Предмет -> [тип, имя, уровень, редкость, свойства]"""
+    return [item.item_type, item.name, item.level, item.rarity, item.get_all_properties()]
+
+
+def item_from_data(data: List[Any]) -> BaseItem:
+    """[тип, имя, уровень, редкость, свойства] -> предмет"""
+    from Items.item_generator import ItemGenerator  # Нужен только если в сохранении есть предметы
+
+    item_type, name, level, rarity, properties = data
+    return ItemGenerator.create_item(item_type, name, level, rarity, properties)
+
+
+# ==================== Инвентарь ====================
+def inventory_to_data(inventory: Inventory) -> Dict[str, Any]:
+    """Золото и стеки предметов инвентаря"""
+    return {
+        'gold': inventory.get_gold(),
+        'items': [[item_to_data(item), quantity]
+                  for item, quantity in inventory.get_all_items().items()],
+    }
+
+
+def restore_inventory(inventory: Inventory, data: Dict[str, Any]) -> None:
+    """Заменяет содержимое инвентаря сохраненным"""
+    inventory.clear()
+    inventory.add_gold(data.get('gold', 0))
+    for item_data, quantity in data.get('items', []):
+        inventory.add_item(item_from_data(item_data), quantity)
+
+
+# ==================== Персонажи ====================
+def player_to_data(player: Player) -> Dict[str, Any]:
+    """Состояние игрока: класс, уровень, опыт, характеристики, умения и экипировка"""
+    return {
+        'class': type(player).__name__,
+        'name': player.name,
+        'level': player.level,
+        'exp': player.exp,
+        'hp': player.hp,
+        'energy': player.energy,
+        'alive': player.alive,
+        'stats': {stat: getattr(player.stats, stat) for stat in STAT_NAMES},
+        'abilities': {ability.name: ability.level
+                      for ability in player.ability_manager.get_all_abilities()},
+        'equipment': {slot_type: item_to_data(slot.item)
+                      for slot_type, slot in player.equipment_slots.items() if slot.item is not None},
+    }
+
+
+def player_from_data(data: Dict[str, Any]) -> Player:
+    """Создает игрока по сохраненному состоянию"""
+    player_class = PLAYER_CLASSES.get(data['class'])
+    if player_class is None:
+        raise ValueError(f"Неизвестный класс игрока: {data['class']}")
+
+    player = player_class(data['name'], level=data['level'])
+    player.stats.update_from_scaled_stats(data.get('stats', {}))
+    player.derived_stats.update_level(player)
+    player.exp = data.get('exp', 0)
+    player.calculate_exp_for_next_level()
+    player.hp = data.get('hp', player.derived_stats.max_hp)
+    player.energy = data.get('energy', player.derived_stats.max_energy)
+    player.alive = data.get('alive', player.hp > 0)
+
+    for ability_name, level in data.get('abilities', {}).items():
+        player.ability_manager.set_ability_level(ability_name, level)
+
+    for slot_type, item_data in data.get('equipment', {}).items():
+        slot = player.equipment_slots.get(slot_type)
+        if slot is not None:
+            slot.equip(item_from_data(item_data))
+    return player
+
+
+# ==================== Статистика ====================
+def _plain(value: Any) -> Any:
+    """defaultdict -> dict (для JSON)"""
+    return dict(value) if isinstance(value, dict) else value
+
+
+def totals_to_data(totals: GameTotalsRecord) -> Dict[str, Any]:
+    """Итоговая статистика игры"""
+    return {f.name: _plain(getattr(totals, f.name)) for f in fields(GameTotalsRecord)}
+
+
+def totals_from_data(data: Dict[str, Any]) -> GameTotalsRecord:
+    """Восстанавливает итоговую статистику игры"""
+    known = {f.name for f in fields(GameTotalsRecord)}
+    totals = GameTotalsRecord(**{name: value for name, value in data.items() if name in known})
+    totals.battles_by_difficulty = defaultdict(int, totals.battles_by_difficulty)
+    return totals
+
+
+def _character_stats_to_data(stats: CharacterBattleStats) -> Dict[str, Any]:
+    return {f.name: _plain(getattr(stats, f.name)) for f in fields(CharacterBattleStats)}
+
+
+def _character_stats_from_data(data: Dict[str, Any]) -> CharacterBattleStats:
+    stats = CharacterBattleStats(**data)
+    stats.abilities_damage = defaultdict(int, stats.abilities_damage)
+    stats.abilities_healing = defaultdict(int, stats.abilities_healing)
+    stats.abilities_used = defaultdict(int, stats.abilities_used)
+    return stats
+
+
+def battle_to_data(summary: BattleSummaryRecord, records: List[CombatActionRecord]) -> Dict[str, Any]:
+    """Итог битвы и ее детальные записи"""
+    summary_data = {f.name: _plain(getattr(summary, f.name)) for f in fields(BattleSummaryRecord)}
+    summary_data['character_stats'] = {name: _character_stats_to_data(stats)
+                                       for name, stats in summary.character_stats.items()}
+    return {
+        's': summary_data,
+        'a': [[getattr(record, name) for name in ACTION_FIELDS] for record in records],
+    }
+
+
+def battle_from_data(data: Dict[str, Any]) -> Tuple[BattleSummaryRecord, List[CombatActionRecord]]:
+    """Восстанавливает итог битвы и ее детальные записи"""
+    summary_data = dict(data['s'])
+    summary_data['character_stats'] = {name: _character_stats_from_data(stats)
+                                       for name, stats in summary_data['character_stats'].items()}
+    summary = BattleSummaryRecord(**summary_data)
+    records = [CombatActionRecord(**dict(zip(ACTION_FIELDS, values))) for values in data['a']]
+    return summary, records
+
+
+def history_chunk_from_data(data: List[Dict[str, Any]],
+                            summaries: List[BattleSummaryRecord],
+                            records: List[CombatActionRecord]) -> None:
+    """Добавляет битвы чанка истории в списки итогов и записей"""
+    for battle_data in data:
+        summary, battle_records = battle_from_data(battle_data)
+        summaries.append(summary)
+        records.extend(battle_records)
@@ -0,0 +1,108 @@
+# Simulation/balance_overrides.py
+"""Переопределения констант баланса для отдельных экземпляров персонажей и боев"""
+
+from typing import Any, Dict, Mapping, TYPE_CHECKING
+
+from Battle.battle_context import BattleContext
+from Characters.base_stats import Stats
+from Characters.Abilities.ability_manager import get_ability_loader
+
+if TYPE_CHECKING:
+    from Characters.character import Character
+
+
+# Таблицы классов персонажей, доступные для переопределения
+CLASS_TABLES = ('BASE_STATS', 'GROWTH_RATES')
+# Таблицы Stats, доступные для переопределения
+STATS_TABLES = ('DEFENSE_MULTIPLIERS', 'PRIMARY_STAT_MULTIPLIERS')
+# Атрибуты активных способностей, доступные для переопределения
+ABILITY_ATTRIBUTES = ('damage_scale', 'cooldown', 'energy_cost')
+
+
+# ==================== Переопределения баланса ====================
+class BalanceOverrides:
+    """
+    Набор переопределений баланса.
+
+    Имена параметров:
+    - ``MAX_ROUNDS`` - константа Config/game_config.py (через BattleContext);
+    - ``Warrior.BASE_STATS.strength`` / ``Warrior.GROWTH_RATES.strength`` - таблицы классов;
+    - ``Stats.DEFENSE_MULTIPLIERS.tank`` - таблицы Stats;
+    - ``Fireball.damage_scale`` / ``.cooldown`` / ``.energy_cost`` - способности.
+
+    Значения применяются к экземплярам персонажей и к контексту боя,
+    глобальные константы модулей не изменяются.
+    """
+
+    def __init__(self, values: Mapping[str, Any]) -> None:
+        """
+        Инициализация и проверка переопределений.
+
+        :param values: Словарь {имя параметра: значение}
+        :raises KeyError: Если параметр неизвестен
+        """
+        from Simulation.headless import MONSTER_CLASSES, PLAYER_CLASSES
+
+        self.values: Dict[str, Any] = dict(values)
+        self.config: Dict[str, Any] = {}
+        self.class_tables: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.stats_tables: Dict[str, Dict[str, Any]] = {}
+        self.abilities: Dict[str, Dict[str, Any]] = {}
+
+        character_classes = set(PLAYER_CLASSES) | set(MONSTER_CLASSES)
+        ability_classes = set(get_ability_loader().get_available_abilities())
+
+        for name, value in self.values.items():
+            parts = name.split('.')
+            if len(parts) == 1:
+                if name not in BattleContext.CONFIG_FIELDS:
+                    raise KeyError(f"Константа '{name}' не используется в симуляции боя")
+                self.config[name] = value
+            elif len(parts) == 3 and parts[0] == 'Stats' and parts[1] in STATS_TABLES:
+                self.stats_tables.setdefault(parts[1], {})[parts[2]] = value
+            elif len(parts) == 3 and parts[0] in character_classes and parts[1] in CLASS_TABLES:
+                tables = self.class_tables.setdefault(parts[0], {})
+                tables.setdefault(parts[1], {})[parts[2]] = value
+            elif len(parts) == 2 and parts[0] in ability_classes and parts[1] in ABILITY_ATTRIBUTES:
+                self.abilities.setdefault(parts[0], {})[parts[1]] = value
+            else:
+                raise KeyError(f"Неизвестный параметр баланса '{name}'")
+
+    # ==================== Применение ====================
+    def apply_to_context(self, context: BattleContext) -> BattleContext:
+        """
+        Возвращает контекст боя с переопределенными константами.
+
+        :param context: Исходный контекст
+        :return: Новый контекст (или исходный, если переопределять нечего)
+        """
+        if not self.config:
+            return context
+        return context.with_config(self.config)
+
+    def apply_to_character(self, character: 'Character') -> None:
+        """
+        Применяет переопределения к экземпляру персонажа и его способностям.
+
+        :param character: Персонаж
+        """
+        class_tables = self.class_tables.get(type(character).__name__)
+        if class_tables or self.stats_tables:
+            if class_tables:
+                for table_name, changes in class_tables.items():
+                    setattr(character, table_name, {**getattr(character, table_name), **changes})
+
+            # Пересоздаем характеристики из (возможно переопределенных) таблиц экземпляра
+            character.stats = Stats(character)
+            for table_name, changes in self.stats_tables.items():
+                setattr(character.stats, table_name, {**getattr(Stats, table_name), **changes})
+            character.derived_stats.update_level(character)
+            character.hp = character.derived_stats.max_hp
+            character.energy = character.derived_stats.max_energy
+
+        if self.abilities:
+            for ability in character.ability_manager.get_all_abilities():
+                changes = self.abilities.get(type(ability).__name__)
+                if changes:
+                    for attribute, value in changes.items():
+                        setattr(ability, attribute, value)
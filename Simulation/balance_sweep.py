@@ -0,0 +1,264 @@
+# Simulation/balance_sweep.py
+"""
+Перебор констант баланса по сетке значений с параллельными Монте-Карло симуляциями.
+
+Пример запуска из корня проекта:
+    python -m Simulation.balance_sweep \
+        --param Warrior.BASE_STATS.strength=12:20:2 \
+        --param Fireball.damage_scale=0.6,0.8,1.0 \
+        --team Warrior:3,Rogue:3,Mage:3,Healer:3 --battles 300
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+if __name__ == '__main__':
+    # Запуск скриптом: корень проекта нужен в путях импорта и как рабочий каталог
+    _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, _PROJECT_ROOT)
+    os.chdir(_PROJECT_ROOT)
+
+from Config.game_config import SPECTATOR_DEFAULT_ADDRESS
+from Simulation.balance_overrides import BalanceOverrides
+from Simulation.headless import TeamSpec, parse_team_spec, run_battles
+from Simulation.result_cache import ResultCache
+from Utils.spectator_server import SpectatorServer
+
+
+# ==================== Сетка параметров ====================
+def _parse_number(text: str) -> Any:
+    """Преобразует строку в int или float"""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def parse_param_spec(spec: str) -> Tuple[str, List[Any]]:
+    """
+    Разбирает описание параметра сетки.
+
+    Форматы: ``NAME=1,2,3`` (список значений) или ``NAME=start:stop:step``
+    (диапазон, stop включительно).
+
+    :param spec: Строка описания
+    :return: Пара (имя параметра, список значений)
+    """
+    name, sep, values_text = spec.partition('=')
+    if not sep or not name or not values_text:
+        raise ValueError(f"Некорректное описание параметра '{spec}'")
+
+    if ':' in values_text:
+        start_text, stop_text, *step_text = values_text.split(':')
+        start, stop = _parse_number(start_text), _parse_number(stop_text)
+        step = _parse_number(step_text[0]) if step_text else 1
+        if step <= 0:
+            raise ValueError(f"Шаг диапазона должен быть положительным: '{spec}'")
+        values = []
+        index = 0
+        while True:
+            value = start + index * step
+            if value > stop + 1e-9:
+                break
+            values.append(round(value, 10) if isinstance(value, float) else value)
+            index += 1
+    else:
+        values = [_parse_number(item) for item in values_text.split(',') if item]
+
+    return name.strip(), values
+
+
+def build_grid(parameters: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """
+    Строит декартово произведение значений параметров.
+
+    :param parameters: Словарь {имя параметра: значения}
+    :return: Список точек сетки
+    """
+    names = list(parameters)
+    return [dict(zip(names, combination))
+            for combination in itertools.product(*(parameters[name] for name in names))]
+
+
+# ==================== Результат ====================
+@dataclass
+class SweepResult:
+    """Результат одной точки сетки"""
+    point: Dict[str, Any]
+    key: str
+    summary: Dict[str, float]
+    cached: bool = False
+
+
+# ==================== Выполнение в процессах ====================
+def _evaluate_point(point: Dict[str, Any], team: TeamSpec, battles: int, seed: int) -> Dict[str, float]:
+    """
+    Считает одну точку сетки (выполняется в рабочем процессе).
+
+    :param point: Значения параметров
+    :param team: Описание команды
+    :param battles: Количество боев
+    :param seed: Зерно генератора
+    :return: Сводка по боям
+    """
+    overrides = BalanceOverrides(point) if point else None
+    return run_battles(team, battles, seed=seed, overrides=overrides)
+
+
+# ==================== Перебор ====================
+class BalanceSweep:
+    """Параллельный перебор точек сетки с кэшированием результатов на диске."""
+
+    def __init__(self, team: TeamSpec, battles: int = 200, seed: int = 0,
+                 workers: Optional[int] = None, cache: Optional[ResultCache] = None) -> None:
+        """
+        :param team: Описание команды игроков
+        :param battles: Количество боев на точку
+        :param seed: Зерно генератора (общее для всех точек - точки сравниваются
+                     на одинаковых случайных последовательностях)
+        :param workers: Число процессов (None - по числу ядер)
+        :param cache: Кэш результатов (None - без кэша)
+        """
+        self.team: List[Tuple[str, int]] = [tuple(member) for member in team]
+        self.battles: int = battles
+        self.seed: int = seed
+        self.workers: int = workers or os.cpu_count() or 1
+        self.cache: Optional[ResultCache] = cache
+
+    def point_key(self, point: Dict[str, Any]) -> str:
+        """Ключ кэша для точки сетки"""
+        return ResultCache.make_key({
+            'point': point,
+            'team': self.team,
+            'battles': self.battles,
+            'seed': self.seed,
+        })
+
+    def run(self, grid: List[Dict[str, Any]],
+            on_result: Optional[Callable[[SweepResult], None]] = None) -> List[SweepResult]:
+        """
+        Считает все точки сетки. Точки, найденные в кэше, не пересчитываются.
+
+        :param grid: Точки сетки
+        :param on_result: Вызывается по мере готовности каждой точки
+        :return: Результаты в порядке точек сетки
+        """
+        # Проверяем параметры до запуска процессов
+        for point in grid:
+            BalanceOverrides(point)
+
+        results: List[Optional[SweepResult]] = [None] * len(grid)
+        pending: List[int] = []
+
+        for index, point in enumerate(grid):
+            key = self.point_key(point)
+            summary = self.cache.get(key) if self.cache else None
+            if summary is not None:
+                results[index] = SweepResult(point, key, summary, cached=True)
+                if on_result:
+                    on_result(results[index])
+            else:
+                pending.append(index)
+
+        def finish(index: int, summary: Dict[str, float]) -> None:
+            result = SweepResult(grid[index], self.point_key(grid[index]), summary)
+            if self.cache:
+                self.cache.put(result.key, summary)
+            results[index] = result
+            if on_result:
+                on_result(result)
+
+        if self.workers <= 1 or len(pending) <= 1:
+            for index in pending:
+                finish(index, _evaluate_point(grid[index], self.team, self.battles, self.seed))
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(pending))) as executor:
+                futures = {
+                    executor.submit(_evaluate_point, grid[index], self.team, self.battles, self.seed): index
+                    for index in pending
+                }
+                for future in as_completed(futures):
+                    finish(futures[future], future.result())
+
+        return [result for result in results if result is not None]
+
+
+# ==================== Командная строка ====================
+def _format_result(result: SweepResult) -> str:
+    """Строка отчета по точке"""
+    params = ", ".join(f"{name}={value}" for name, value in result.point.items()) or "(базовые значения)"
+    summary = result.summary
+    source = " [кэш]" if result.cached else ""
+    return (f"{params}: победы {summary['win_rate']:.1%} "
+            f"({summary['wins']}/{summary['battles']}), HP {summary['avg_hp_left']:.1%}{source}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входа командной строки"""
+    parser = argparse.ArgumentParser(description="Перебор констант баланса по сетке значений")
+    parser.add_argument('--param', action='append', default=[],
+                        help="Параметр сетки: NAME=1,2,3 или NAME=start:stop:step")
+    parser.add_argument('--team', default="Warrior:2,Rogue:2,Mage:2,Healer:2",
+                        help="Команда: Class:level через запятую")
+    parser.add_argument('--battles', type=int, default=200, help="Боев на точку сетки")
+    parser.add_argument('--seed', type=int, default=0, help="Зерно генератора случайных чисел")
+    parser.add_argument('--workers', type=int, default=None, help="Число процессов (по умолчанию - все ядра)")
+    parser.add_argument('--cache-dir', default=None, help="Каталог кэша результатов")
+    parser.add_argument('--no-cache', action='store_true', help="Не использовать кэш")
+    parser.add_argument('--output', default=None, help="Сохранить результаты в JSON-файл")
+    parser.add_argument('--spectator', nargs='?', const=SPECTATOR_DEFAULT_ADDRESS, default=None,
+                        metavar='ADDRESS', help="Транслировать результаты точек в JSON-строках (хост:порт или unix:/путь)")
+    args = parser.parse_args(argv)
+
+    try:
+        parameters = dict(parse_param_spec(spec) for spec in args.param)
+        grid = build_grid(parameters)
+        for point in grid:
+            BalanceOverrides(point)
+        team = parse_team_spec(args.team)
+    except (KeyError, ValueError) as e:
+        parser.error(str(e))
+
+    cache = None
+    if not args.no_cache:
+        cache = ResultCache(args.cache_dir, "balance_sweep") if args.cache_dir else ResultCache(namespace="balance_sweep")
+
+    sweep = BalanceSweep(team, battles=args.battles, seed=args.seed,
+                         workers=args.workers, cache=cache)
+    print(f"Точек сетки: {len(grid)}, боев на точку: {args.battles}, процессов: {sweep.workers}")
+
+    spectator = None
+    if args.spectator:
+        try:
+            spectator = SpectatorServer(args.spectator)
+            print(f"Трансляция результатов: {spectator.start()}")
+        except (OSError, ValueError) as e:
+            parser.error(f"Трансляция недоступна: {e}")
+
+    def on_result(result: SweepResult) -> None:
+        print(_format_result(result), flush=True)
+        if spectator is not None:
+            spectator.publish({"event": "sweep_result", "point": result.point,
+                               "summary": result.summary, "cached": result.cached})
+
+    try:
+        results = sweep.run(grid, on_result=on_result)
+    finally:
+        if spectator is not None:
+            spectator.stop()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump([asdict(result) for result in results], f, ensure_ascii=False, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
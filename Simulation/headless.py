@@ -0,0 +1,158 @@
+# Simulation/headless.py
+"""Безэкранный запуск боев для массовых симуляций (подбор баланса, оптимизация команд)"""
+
+import contextlib
+import os
+import random
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Type, TYPE_CHECKING
+
+from Battle.battle_context import BattleContext
+from Battle.battle_logger import battle_logger
+from Battle.battle_logic import simulate_battle
+from Battle.battle_metrics import ENEMY_CREATION, get_battle_metrics
+from Characters.character import Character
+from Characters.encounter_pool import EncounterPool
+from Characters.monster_classes import Goblin, Orc, Skeleton, Wizard, Troll
+from Characters.player_classes import Archer, Healer, Mage, Player, Rogue, Tank, Warrior
+
+if TYPE_CHECKING:
+    from Simulation.balance_overrides import BalanceOverrides
+
+
+# Описание участника команды: (имя класса, уровень) или (имя класса, уровень, уровень пассивок)
+TeamSpec = Sequence[Tuple]
+
+PLAYER_CLASSES: Dict[str, Type[Player]] = {
+    cls.__name__: cls for cls in (Tank, Warrior, Rogue, Archer, Mage, Healer)
+}
+
+MONSTER_CLASSES: Dict[str, Type[Character]] = {
+    cls.__name__: cls for cls in (Goblin, Orc, Skeleton, Wizard, Troll)
+}
+
+# Бои без наград, статистики и сообщений: каждый бой идет со свежей командой
+HEADLESS_CONTEXT = BattleContext(award_rewards=False, track_statistics=False, quiet=True)
+
+
+# ==================== Подготовка окружения ====================
+@contextlib.contextmanager
+def suppress_output() -> Iterator[None]:
+    """Глушит служебный вывод персонажей в stdout на время симуляции."""
+    with open(os.devnull, 'w', encoding='utf-8') as devnull:
+        with contextlib.redirect_stdout(devnull):
+            yield
+
+
+# ==================== Создание команд ====================
+def parse_team_spec(spec: str) -> List[Tuple[str, int]]:
+    """
+    Разбирает описание команды вида "Warrior:2,Rogue:2,Mage:2,Healer:2".
+
+    :param spec: Строка с описанием команды
+    :return: Список пар (имя класса, уровень)
+    """
+    team: List[Tuple[str, int]] = []
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        class_name, _, level = part.partition(':')
+        if class_name not in PLAYER_CLASSES:
+            raise ValueError(f"Неизвестный класс '{class_name}'. Доступные: {list(PLAYER_CLASSES)}")
+        team.append((class_name, int(level) if level else 1))
+    if not team:
+        raise ValueError("Команда не может быть пустой")
+    return team
+
+
+def raise_to_level(player: Player, level: int) -> None:
+    """
+    Приводит характеристики игрока к уровню так же, как цепочка level_up.
+
+    :param player: Игрок
+    :param level: Целевой уровень
+    """
+    player.level = level
+    scaled_stats = Character.scale_stats(player.BASE_STATS, level, player.GROWTH_RATES)
+    player.stats.update_from_scaled_stats(scaled_stats)
+    player.derived_stats.update_level(player)
+    player.hp = player.derived_stats.max_hp
+    player.energy = player.derived_stats.max_energy
+    player.calculate_exp_for_next_level()
+
+
+def build_team(team: TeamSpec, overrides: Optional['BalanceOverrides'] = None) -> List[Player]:
+    """
+    Создает команду игроков по описанию.
+
+    Игроки создаются на 1-м уровне и прокачиваются до нужного,
+    как если бы дошли до него в игре. Если у участника указан уровень
+    пассивных способностей, он выставляется всем его пассивкам.
+
+    :param team: Описание команды
+    :param overrides: Переопределения баланса (применяются к экземплярам)
+    :return: Список игроков
+    """
+    players: List[Player] = []
+    for index, (class_name, level, *passive_level) in enumerate(team, start=1):
+        player = PLAYER_CLASSES[class_name](f"{class_name} {index}", level=1)
+        if overrides is not None:
+            overrides.apply_to_character(player)
+        raise_to_level(player, level)
+        if passive_level:
+            for ability_name in player.ability_manager.get_passive_ability_names():
+                player.ability_manager.set_ability_level(ability_name, passive_level[0])
+        players.append(player)
+    return players
+
+
+# ==================== Монте-Карло ====================
+def run_battles(team: TeamSpec, battles: int, seed: Optional[int] = None,
+                overrides: Optional['BalanceOverrides'] = None,
+                context: BattleContext = HEADLESS_CONTEXT) -> Dict[str, float]:
+    """
+    Проводит серию боев свежей команды против врагов из пула серии.
+
+    :param team: Описание команды
+    :param battles: Количество боев
+    :param seed: Зерно генератора случайных чисел (None - не фиксировать)
+    :param overrides: Переопределения баланса
+    :param context: Контекст боя
+    :return: Сводка: число побед/поражений/ничьих, доля побед, средний остаток HP
+    """
+    if seed is not None:
+        random.seed(seed)
+    if overrides is not None:
+        context = overrides.apply_to_context(context)
+
+    outcomes = {"win": 0, "loss": 0, "draw": 0}
+    hp_left = 0.0
+
+    # Свой пул на серию: результат зависит только от seed, а серии с переопределениями
+    # и без них получают врагов одинаково. Переопределения применяются при создании группы
+    pool = EncounterPool(on_build=overrides.apply_to_character if overrides is not None else None)
+    metrics = get_battle_metrics()
+
+    # Паузы логгера отключаются только в этом потоке: общий темп игры не меняется
+    with battle_logger.no_delay(), suppress_output():
+        for _ in range(battles):
+            players = build_team(team, overrides)
+            with metrics.measure_pending(ENEMY_CREATION):
+                enemies = pool.acquire(players)
+
+            result = simulate_battle(players, enemies, context)
+            pool.release(enemies)
+            outcomes[result] = outcomes.get(result, 0) + 1
+
+            total_max_hp = sum(p.derived_stats.max_hp for p in players)
+            if total_max_hp:
+                hp_left += sum(p.hp for p in players) / total_max_hp
+
+    return {
+        'battles': battles,
+        'wins': outcomes["win"],
+        'losses': outcomes["loss"],
+        'draws': outcomes["draw"],
+        'win_rate': outcomes["win"] / battles if battles else 0.0,
+        'avg_hp_left': hp_left / battles if battles else 0.0,
+    }
@@ -0,0 +1,69 @@
+# Simulation/result_cache.py
+"""Дисковый кэш результатов симуляций, ключ - хэш параметров"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+from Config.game_config import SIMULATION_CACHE_DIR
+
+# Версия формата кэша: увеличить, если изменилась логика симуляции
+CACHE_VERSION = 1
+
+
+# ==================== Кэш результатов ====================
+class ResultCache:
+    """Кэш результатов: один JSON-файл на набор параметров."""
+
+    def __init__(self, cache_dir: str = SIMULATION_CACHE_DIR, namespace: str = "default") -> None:
+        """
+        Инициализация кэша.
+
+        :param cache_dir: Каталог кэша
+        :param namespace: Подкаталог для отдельного вида симуляций
+        """
+        self.directory: str = os.path.join(cache_dir, namespace)
+
+    @staticmethod
+    def make_key(payload: Dict[str, Any]) -> str:
+        """
+        Вычисляет ключ кэша по параметрам симуляции.
+
+        :param payload: Параметры (должны сериализоваться в JSON)
+        :return: Hex-строка SHA-256
+        """
+        canonical = json.dumps({'version': CACHE_VERSION, 'payload': payload},
+                               sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        """Путь к файлу записи"""
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Возвращает сохраненный результат.
+
+        :param key: Ключ кэша
+        :return: Результат или None, если записи нет или она повреждена
+        """
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Сохраняет результат (атомарная запись через временный файл).
+
+        :param key: Ключ кэша
+        :param value: Результат
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(value, f, ensure_ascii=False)
+        os.replace(temp_path, path)
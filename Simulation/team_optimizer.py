@@ -0,0 +1,361 @@
+# Simulation/team_optimizer.py
+"""
+Эволюционный поиск сильных составов команды игрока.
+
+Геном - состав команды: для каждого участника класс, уровень и уровень
+пассивных способностей. Приспособленность - доля побед в симуляции против
+случайных групп врагов (см. run_battles). Поколение считается параллельно, результаты
+запоминаются по геному (в памяти и в дисковом кэше).
+
+Пример запуска из корня проекта:
+    python -m Simulation.team_optimizer --team-size 4 --level-budget 12 --generations 20
+"""
+
+import argparse
+import os
+import random
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+if __name__ == '__main__':
+    # Запуск скриптом: корень проекта нужен в путях импорта и как рабочий каталог
+    _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, _PROJECT_ROOT)
+    os.chdir(_PROJECT_ROOT)
+
+from Config.game_config import SPECTATOR_DEFAULT_ADDRESS
+from Simulation.headless import PLAYER_CLASSES, build_team, run_battles
+from Simulation.result_cache import ResultCache
+from Utils.spectator_server import SpectatorServer
+
+
+# Участник команды: (имя класса, уровень, уровень пассивных способностей)
+Member = Tuple[str, int, int]
+# Геном - упорядоченный кортеж участников (порядок канонический, см. normalize)
+Genome = Tuple[Member, ...]
+
+
+# ==================== Оценка ====================
+def _evaluate_genome(genome: Genome, battles: int, seed: int) -> Dict[str, float]:
+    """
+    Считает приспособленность генома (выполняется в рабочем процессе).
+
+    :param genome: Состав команды
+    :param battles: Количество боев
+    :param seed: Зерно генератора
+    :return: Сводка по боям
+    """
+    return run_battles(genome, battles, seed=seed)
+
+
+def fitness_of(summary: Dict[str, float]) -> Tuple[float, float]:
+    """Приспособленность: доля побед, при равенстве - средний остаток HP"""
+    return summary['win_rate'], summary['avg_hp_left']
+
+
+# ==================== Результаты ====================
+@dataclass
+class GenerationReport:
+    """Итоги поколения"""
+    generation: int
+    best_genome: Genome
+    best_summary: Dict[str, float]
+    evaluated: int   # Сколько геномов пришлось симулировать в этом поколении
+
+
+@dataclass
+class OptimizationResult:
+    """Итоги поиска"""
+    ranking: List[Tuple[Genome, Dict[str, float]]]
+    history: List[GenerationReport] = field(default_factory=list)
+
+    @property
+    def best(self) -> Tuple[Genome, Dict[str, float]]:
+        """Лучший найденный состав"""
+        return self.ranking[0]
+
+
+# ==================== Генетический алгоритм ====================
+class TeamOptimizer:
+    """Генетический алгоритм подбора состава команды."""
+
+    def __init__(self, team_size: int = 4, level_budget: int = 12, min_level: int = 1,
+                 max_level: int = 10, max_passive_level: int = 5,
+                 classes: Optional[List[str]] = None, population_size: int = 24,
+                 generations: int = 15, battles: int = 100, elite: int = 2,
+                 tournament_size: int = 3, mutation_rate: float = 0.3, seed: int = 0,
+                 workers: Optional[int] = None, cache: Optional[ResultCache] = None) -> None:
+        """
+        :param team_size: Размер команды
+        :param level_budget: Сумма уровней участников (ограничение на силу команды)
+        :param min_level: Минимальный уровень участника
+        :param max_level: Максимальный уровень участника
+        :param max_passive_level: Максимальный уровень пассивных способностей
+        :param classes: Допустимые классы (None - все классы игроков)
+        :param population_size: Размер популяции
+        :param generations: Количество поколений
+        :param battles: Боев на оценку генома
+        :param elite: Сколько лучших геномов переходит в следующее поколение без изменений
+        :param tournament_size: Размер турнира при отборе родителей
+        :param mutation_rate: Вероятность мутации каждого участника
+        :param seed: Зерно генератора (и для эволюции, и для боев)
+        :param workers: Число процессов (None - по числу ядер)
+        :param cache: Дисковый кэш приспособленности (None - только в памяти)
+        """
+        if level_budget < team_size * min_level:
+            raise ValueError("Бюджет уровней меньше минимально возможного для команды")
+
+        self.team_size = team_size
+        self.level_budget = level_budget
+        self.min_level = min_level
+        self.max_level = max_level
+        self.max_passive_level = max_passive_level
+        self.classes: List[str] = classes or list(PLAYER_CLASSES)
+        self.population_size = population_size
+        self.generations = generations
+        self.battles = battles
+        self.elite = elite
+        self.tournament_size = tournament_size
+        self.mutation_rate = mutation_rate
+        self.seed = seed
+        self.workers: int = workers or os.cpu_count() or 1
+        self.cache = cache
+
+        self.rng = random.Random(seed)
+        self._fitness: Dict[Genome, Dict[str, float]] = {}
+        self._classes_with_passives = self._find_classes_with_passives()
+
+    def _find_classes_with_passives(self) -> set:
+        """Определяет классы, у которых есть пассивные способности"""
+        return {class_name for class_name in self.classes
+                if build_team([(class_name, 1)])[0].ability_manager.get_passive_ability_names()}
+
+    # ==================== Операции над геномом ====================
+    def normalize(self, members: List[Member]) -> Genome:
+        """
+        Приводит геном к допустимому каноническому виду: уровни в пределах
+        бюджета, уровень пассивок 0 у классов без пассивок, участники отсортированы.
+
+        :param members: Участники команды
+        :return: Канонический геном
+        """
+        members = [(class_name,
+                    max(self.min_level, min(self.max_level, level)),
+                    max(0, min(self.max_passive_level, passive)) if class_name in self._classes_with_passives else 0)
+                   for class_name, level, passive in members]
+
+        # Срезаем уровни случайным участникам, пока не уложимся в бюджет
+        while sum(level for _, level, _ in members) > self.level_budget:
+            candidates = [i for i, (_, level, _) in enumerate(members) if level > self.min_level]
+            index = self.rng.choice(candidates)
+            class_name, level, passive = members[index]
+            members[index] = (class_name, level - 1, passive)
+
+        return tuple(sorted(members))
+
+    def random_genome(self) -> Genome:
+        """Случайный геном, равномерно распределяющий бюджет уровней"""
+        members = []
+        remaining = self.level_budget
+        for slot in range(self.team_size):
+            slots_left = self.team_size - slot - 1
+            upper = min(self.max_level, remaining - slots_left * self.min_level)
+            level = upper if slots_left == 0 else self.rng.randint(self.min_level, max(self.min_level, upper))
+            remaining -= level
+            members.append((self.rng.choice(self.classes), level,
+                            self.rng.randint(0, self.max_passive_level)))
+        return self.normalize(members)
+
+    def crossover(self, first: Genome, second: Genome) -> Genome:
+        """Равномерное скрещивание по участникам"""
+        members = [self.rng.choice(pair) for pair in zip(first, second)]
+        return self.normalize(members)
+
+    def mutate(self, genome: Genome) -> Genome:
+        """Мутация: смена класса, перенос уровня между участниками, изменение пассивок"""
+        members = list(genome)
+        for index, (class_name, level, passive) in enumerate(members):
+            if self.rng.random() >= self.mutation_rate:
+                continue
+            mutation = self.rng.randrange(3)
+            if mutation == 0:
+                members[index] = (self.rng.choice(self.classes), level, passive)
+            elif mutation == 1:
+                other = self.rng.randrange(len(members))
+                if other != index and level > self.min_level:
+                    other_class, other_level, other_passive = members[other]
+                    members[index] = (class_name, level - 1, passive)
+                    members[other] = (other_class, other_level + 1, other_passive)
+            else:
+                members[index] = (class_name, level, passive + self.rng.choice((-1, 1)))
+        return self.normalize(members)
+
+    def _tournament(self, population: List[Genome]) -> Genome:
+        """Отбор родителя турниром"""
+        contenders = self.rng.sample(population, min(self.tournament_size, len(population)))
+        return max(contenders, key=lambda genome: fitness_of(self._fitness[genome]))
+
+    # ==================== Оценка популяции ====================
+    def _cache_key(self, genome: Genome) -> str:
+        """Ключ дискового кэша для генома"""
+        return ResultCache.make_key({'genome': genome, 'battles': self.battles, 'seed': self.seed})
+
+    def evaluate(self, population: List[Genome], executor: Optional[Executor] = None) -> int:
+        """
+        Оценивает популяцию. Уже оцененные геномы берутся из памяти или кэша.
+
+        :param population: Геномы
+        :param executor: Пул процессов (None - считать в текущем процессе)
+        :return: Количество симулированных геномов
+        """
+        missing: List[Genome] = []
+        for genome in dict.fromkeys(population):
+            if genome in self._fitness:
+                continue
+            cached = self.cache.get(self._cache_key(genome)) if self.cache else None
+            if cached is not None:
+                self._fitness[genome] = cached
+            else:
+                missing.append(genome)
+
+        if executor is None:
+            summaries = [_evaluate_genome(genome, self.battles, self.seed) for genome in missing]
+        else:
+            summaries = list(executor.map(_evaluate_genome, missing,
+                                          [self.battles] * len(missing), [self.seed] * len(missing)))
+
+        for genome, summary in zip(missing, summaries):
+            self._fitness[genome] = summary
+            if self.cache:
+                self.cache.put(self._cache_key(genome), summary)
+
+        return len(missing)
+
+    # ==================== Основной цикл ====================
+    def run(self, on_generation: Optional[Callable[[GenerationReport], None]] = None) -> OptimizationResult:
+        """
+        Запускает эволюционный поиск.
+
+        :param on_generation: Вызывается после каждого поколения
+        :return: Итоги поиска
+        """
+        history: List[GenerationReport] = []
+        population = [self.random_genome() for _ in range(self.population_size)]
+
+        executor: Optional[ProcessPoolExecutor] = None
+        if self.workers > 1:
+            executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        try:
+            for generation in range(1, self.generations + 1):
+                evaluated = self.evaluate(population, executor)
+                ranked = sorted(dict.fromkeys(population),
+                                key=lambda genome: fitness_of(self._fitness[genome]), reverse=True)
+
+                report = GenerationReport(generation, ranked[0], self._fitness[ranked[0]], evaluated)
+                history.append(report)
+                if on_generation:
+                    on_generation(report)
+
+                if generation == self.generations:
+                    break
+
+                # Элита переходит без изменений, остальные - потомки турнирного отбора
+                next_population = ranked[:self.elite]
+                while len(next_population) < self.population_size:
+                    child = self.crossover(self._tournament(population), self._tournament(population))
+                    next_population.append(self.mutate(child))
+                population = next_population
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        ranking = sorted(self._fitness.items(), key=lambda item: fitness_of(item[1]), reverse=True)
+        return OptimizationResult(ranking, history)
+
+
+# ==================== Командная строка ====================
+def format_genome(genome: Genome) -> str:
+    """Человекочитаемое описание состава"""
+    parts = []
+    for class_name, level, passive in genome:
+        suffix = f" (пассивки {passive})" if passive else ""
+        parts.append(f"{class_name}:{level}{suffix}")
+    return ", ".join(parts)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входа командной строки"""
+    parser = argparse.ArgumentParser(description="Эволюционный подбор состава команды")
+    parser.add_argument('--team-size', type=int, default=4, help="Размер команды")
+    parser.add_argument('--level-budget', type=int, default=12, help="Сумма уровней участников")
+    parser.add_argument('--max-level', type=int, default=10, help="Максимальный уровень участника")
+    parser.add_argument('--max-passive-level', type=int, default=5, help="Максимальный уровень пассивок")
+    parser.add_argument('--classes', default=None, help="Допустимые классы через запятую")
+    parser.add_argument('--population', type=int, default=24, help="Размер популяции")
+    parser.add_argument('--generations', type=int, default=15, help="Количество поколений")
+    parser.add_argument('--battles', type=int, default=100, help="Боев на оценку состава")
+    parser.add_argument('--seed', type=int, default=0, help="Зерно генератора случайных чисел")
+    parser.add_argument('--workers', type=int, default=None, help="Число процессов (по умолчанию - все ядра)")
+    parser.add_argument('--cache-dir', default=None, help="Каталог кэша результатов")
+    parser.add_argument('--no-cache', action='store_true', help="Не использовать кэш")
+    parser.add_argument('--top', type=int, default=5, help="Сколько лучших составов вывести")
+    parser.add_argument('--spectator', nargs='?', const=SPECTATOR_DEFAULT_ADDRESS, default=None,
+                        metavar='ADDRESS', help="Транслировать итоги поколений в JSON-строках (хост:порт или unix:/путь)")
+    args = parser.parse_args(argv)
+
+    classes = None
+    if args.classes:
+        classes = [name.strip() for name in args.classes.split(',') if name.strip()]
+        unknown = [name for name in classes if name not in PLAYER_CLASSES]
+        if unknown:
+            parser.error(f"Неизвестные классы: {unknown}. Доступные: {list(PLAYER_CLASSES)}")
+
+    cache = None
+    if not args.no_cache:
+        cache = ResultCache(args.cache_dir, "team_optimizer") if args.cache_dir else ResultCache(namespace="team_optimizer")
+
+    try:
+        optimizer = TeamOptimizer(team_size=args.team_size, level_budget=args.level_budget,
+                                  max_level=args.max_level, max_passive_level=args.max_passive_level,
+                                  classes=classes, population_size=args.population,
+                                  generations=args.generations, battles=args.battles, seed=args.seed,
+                                  workers=args.workers, cache=cache)
+    except ValueError as e:
+        parser.error(str(e))
+
+    spectator = None
+    if args.spectator:
+        try:
+            spectator = SpectatorServer(args.spectator)
+            print(f"Трансляция поколений: {spectator.start()}")
+        except (OSError, ValueError) as e:
+            parser.error(f"Трансляция недоступна: {e}")
+
+    def report(generation: GenerationReport) -> None:
+        print(f"Поколение {generation.generation}: {format_genome(generation.best_genome)} - "
+              f"победы {generation.best_summary['win_rate']:.1%} "
+              f"(новых оценок: {generation.evaluated})", flush=True)
+        if spectator is not None:
+            spectator.publish({"event": "generation", "generation": generation.generation,
+                               "best_genome": generation.best_genome,
+                               "best_summary": generation.best_summary,
+                               "evaluated": generation.evaluated})
+
+    try:
+        result = optimizer.run(on_generation=report)
+    finally:
+        if spectator is not None:
+            spectator.stop()
+
+    print("\nЛучшие составы:")
+    for genome, summary in result.ranking[:args.top]:
+        print(f"  {summary['win_rate']:.1%}, HP {summary['avg_hp_left']:.1%}: {format_genome(genome)}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,7 +8,7 @@ if TYPE_CHECKING:
     from Battle.battle_statistics import BattleSummaryRecord, CombatActionRecord, GameTotalsRecord
 
 from Battle.battle_statistics import get_battle_statistics
-from Utils.UI.window import AbstractWindow
+from Utils.UI.window import AbstractWindow, VirtualListView
 from Utils.UI.key_hints import STATISTICS_HINTS
 
 class GlobalStatsWindow(AbstractWindow):
@@ -17,8 +17,10 @@ class GlobalStatsWindow(AbstractWindow):
     def __init__(self, stdscr) -> None:
         super().__init__(stdscr)
         self.battle_stats = get_battle_statistics()
-        self.selected_battle_index: int = 0
-        self.battle_summaries: List['BattleSummaryRecord'] = []
+        # Список битв запрашивает у статистики только видимый срез
+        self.battle_list = VirtualListView(self.battle_stats.get_history_count,
+                                           self.battle_stats.get_battle_summary_slice,
+                                           self._format_battle)
         self.hint_class = STATISTICS_HINTS
     
     def get_header_text(self) -> str:
@@ -31,7 +33,6 @@ class GlobalStatsWindow(AbstractWindow):
             
         # Получаем данные
         game_totals = self.battle_stats.get_current_game_totals()
-        self.battle_summaries = self.battle_stats.get_battle_summaries()
         
         # Отображаем глобальную статистику (верхняя часть)
         self._display_global_stats(game_totals, 2)
@@ -83,7 +84,7 @@ class GlobalStatsWindow(AbstractWindow):
     
     def _display_battle_list(self, start_y: int) -> None:
         """Отображение списка проведённых битв"""
-        if not self.battle_summaries:
+        if self.battle_list.get_count() == 0:
             if start_y < self.height - 3:
                 try:
                     self.stdscr.addstr(start_y, 2, "Нет проведённых боёв", curses.A_DIM)
@@ -93,42 +94,25 @@ class GlobalStatsWindow(AbstractWindow):
         
         # Отображаем битвы с выделением выбранной
         max_battles_to_show = max(1, self.height - start_y - 3)
-        
-        for i, battle in enumerate(self.battle_summaries[:max_battles_to_show]):
-            if start_y + i >= self.height - 3:
-                break
-                
-            y_pos = start_y + i
-            battle_text = f"Битва {battle.battle_id[:10]} - Раундов: {battle.total_rounds} - "
-            battle_text += "Победа" if battle.player_victory else "Поражение"
-            
-            try:
-                if i == self.selected_battle_index:
-                    # Выделенная битва
-                    self.stdscr.addstr(y_pos, 2, f"> {battle_text[:self.width - 6]}", 
-                                     curses.A_BOLD | curses.A_REVERSE)
-                else:
-                    # Обычная битва
-                    self.stdscr.addstr(y_pos, 2, f"  {battle_text[:self.width - 6]}", 
-                                     curses.A_NORMAL)
-            except curses.error:
-                pass
+        self.battle_list.display(self.stdscr, start_y, 2, max_battles_to_show, self.width - 4)
+    
+    @staticmethod
+    def _format_battle(battle: 'BattleSummaryRecord') -> str:
+        """Строка списка битв"""
+        battle_text = f"Битва {battle.battle_id[:10]} - Раундов: {battle.total_rounds} - "
+        battle_text += "Победа" if battle.player_victory else "Поражение"
+        return battle_text
     
     def _handle_input(self, key: int) -> bool:
         """Обработка ввода для окна глобальной статистики"""
         if key in [ord('q'), ord('Q'), ord('e'), ord('E'), 27]:  # ESC, q, e
             return True
-        elif key == curses.KEY_UP:
-            if self.battle_summaries:
-                self.selected_battle_index = max(0, self.selected_battle_index - 1)
-        elif key == curses.KEY_DOWN:
-            if self.battle_summaries:
-                self.selected_battle_index = min(len(self.battle_summaries) - 1, 
-                                               self.selected_battle_index + 1)
+        elif self.battle_list.handle_key(key):
+            pass  # Навигация по списку битв
         elif key in [10, 13]:  # Enter
             # Открытие окна деталей выбранной битвы
-            if self.battle_summaries and 0 <= self.selected_battle_index < len(self.battle_summaries):
-                selected_battle = self.battle_summaries[self.selected_battle_index]
+            selected_battle = self.battle_list.get_selected_item()
+            if selected_battle is not None:
                 battle_detail_window = BattleDetailWindow(self.stdscr, selected_battle)
                 battle_detail_window.run()
         elif key == curses.KEY_RESIZE:
@@ -144,8 +128,11 @@ class BattleDetailWindow(AbstractWindow):
         super().__init__(stdscr)
         self.battle_record = battle_record
         self.battle_stats = get_battle_statistics()
-        self.selected_action_index: int = 0
-        self.detailed_actions: List['CombatActionRecord'] = []
+        # Записи битвы выбираются один раз при открытии окна
+        self.detailed_actions: List['CombatActionRecord'] = self.battle_stats.get_detailed_records(battle_record.battle_id)
+        self.action_list = VirtualListView(lambda: len(self.detailed_actions),
+                                           lambda start, count: self.detailed_actions[start:start + count],
+                                           self._format_action)
         self.hint_class = STATISTICS_HINTS
     
     def get_header_text(self) -> str:
@@ -156,9 +143,6 @@ class BattleDetailWindow(AbstractWindow):
         if self.height < 5:
             return
             
-        # Получаем детальные записи для этой битвы
-        self.detailed_actions = self.battle_stats.get_detailed_records(self.battle_record.battle_id)
-        
         # Отображаем общую информацию о битве (верхняя часть)
         self._display_battle_summary(2)
         
@@ -214,45 +198,28 @@ class BattleDetailWindow(AbstractWindow):
         
         # Отображаем действия с выделением выбранного
         max_actions_to_show = max(1, self.height - start_y - 3)
-        
-        for i, action in enumerate(self.detailed_actions[:max_actions_to_show]):
-            if start_y + i >= self.height - 3:
-                break
-                
-            y_pos = start_y + i
-            action_text = f"Раунд {action.round_number}: {action.attacker_name} -> {action.target_name} ({action.ability_name})"
-            if action.damage_dealt > 0:
-                action_text += f" Урон: {action.damage_dealt}"
-            if action.heal_amount > 0:
-                action_text += f" Лечение: {action.heal_amount}"
-            if action.is_critical:
-                action_text += " [КРИТ]"
-            if action.is_dodge:
-                action_text += " [УКЛОНЕНИЕ]"
-            
-            try:
-                if i == self.selected_action_index:
-                    # Выделенное действие
-                    self.stdscr.addstr(y_pos, 2, f"> {action_text[:self.width - 6]}", 
-                                     curses.A_BOLD | curses.A_REVERSE)
-                else:
-                    # Обычное действие
-                    self.stdscr.addstr(y_pos, 2, f"  {action_text[:self.width - 6]}", 
-                                     curses.A_NORMAL)
-            except curses.error:
-                pass
+        self.action_list.display(self.stdscr, start_y, 2, max_actions_to_show, self.width - 4)
+    
+    @staticmethod
+    def _format_action(action: 'CombatActionRecord') -> str:
+        """Строка списка боевых действий"""
+        action_text = f"Раунд {action.round_number}: {action.attacker_name} -> {action.target_name} ({action.ability_name})"
+        if action.damage_dealt > 0:
+            action_text += f" Урон: {action.damage_dealt}"
+        if action.heal_amount > 0:
+            action_text += f" Лечение: {action.heal_amount}"
+        if action.is_critical:
+            action_text += " [КРИТ]"
+        if action.is_dodge:
+            action_text += " [УКЛОНЕНИЕ]"
+        return action_text
     
     def _handle_input(self, key: int) -> bool:
         """Обработка ввода для окна деталей битвы"""
         if key in [ord('q'), ord('Q'), ord('e'), ord('E'), 27]:  # ESC, q, e
             return True
-        elif key == curses.KEY_UP:
-            if self.detailed_actions:
-                self.selected_action_index = max(0, self.selected_action_index - 1)
-        elif key == curses.KEY_DOWN:
-            if self.detailed_actions:
-                self.selected_action_index = min(len(self.detailed_actions) - 1, 
-                                               self.selected_action_index + 1)
+        elif self.action_list.handle_key(key):
+            pass  # Навигация по списку действий
         elif key == curses.KEY_RESIZE:
             return False  # Продолжить работу при ресайзе
         
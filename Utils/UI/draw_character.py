@@ -2,6 +2,7 @@
 
 import curses
 import random
+import weakref
 from Config.game_config import ENERGY_BAR_WIDTH, MONSTER_NAME_COLUMN_WIDTH, PLAYER_NAME_COLUMN_WIDTH, PROGRESS_BORDER_CHARS, PROGRESS_BAR_CHARS, HP_BAR_WIDTH, BASE_ENERGY_COST
 from Config.curses_config import get_color_pair, COLOR_RED, COLOR_GREEN, COLOR_YELLOW, COLOR_BLUE, COLOR_GRAY, COLOR_WHITE
 
@@ -26,6 +27,25 @@ EFFECT_DOTS_LENGTH = 2
 STATUS_EFFECTS_MAX_WIDTH = 15
 
 
+class _RowRecorder:
+    """Экран-заглушка: запоминает вызовы addstr как сегменты строки (смещение, текст, атрибуты)."""
+
+    def __init__(self) -> None:
+        self.segments: list = []
+
+    def addstr(self, position_y: int, position_x: int, text: str, attributes: int = 0) -> None:
+        self.segments.append((position_x, text, attributes))
+
+
+# Кэш отрисованных строк: персонаж -> (ключ, сегменты, ширина строки)
+_row_cache: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+
+def clear_row_cache() -> None:
+    """Сбрасывает кэш строк (например, после смены цветовой схемы)."""
+    _row_cache.clear()
+
+
 class DrawCharacter:
     """
     Класс для полной отрисовки строки персонажа: имя, HP, Energy, статусы.
@@ -427,6 +447,41 @@ class DrawCharacter:
     def draw_character_row(cls, screen, character, position_y: int, position_x: int, is_player: bool = True):
         """
         Полная отрисовка строки персонажа.
+
+        Строка собирается в сегменты один раз и берется из кэша, пока не изменится
+        версия состояния персонажа (HP, энергия, жизнь, эффекты), уровень или максимумы.
+        """
+        row_key = cls._row_key(character)
+        cached_row = _row_cache.get(character) if row_key is not None else None
+        if cached_row is None or cached_row[0] != row_key:
+            recorder = _RowRecorder()
+            row_end = cls.render_character_row(recorder, character, 0, 0)
+            cached_row = (row_key, recorder.segments, row_end)
+            if row_key is not None:
+                _row_cache[character] = cached_row
+
+        _, segments, row_end = cached_row
+        for offset_x, text, attributes in segments:
+            try:
+                screen.addstr(position_y, position_x + offset_x, text, attributes)
+            except curses.error:
+                pass
+        return position_x + row_end
+
+    @staticmethod
+    def _row_key(character):
+        """Ключ кэша строки (None - персонаж не поддерживает версию состояния, кэш не используется)"""
+        state_version = getattr(character, 'state_version', None)
+        if state_version is None:
+            return None
+        derived_stats = character.derived_stats
+        return (state_version, getattr(character, 'level', None),
+                derived_stats.max_hp, derived_stats.max_energy)
+
+    @classmethod
+    def render_character_row(cls, screen, character, position_y: int, position_x: int):
+        """
+        Отрисовка строки персонажа без кэша: имя, HP, энергия, эффекты.
         """
         current_x_position = position_x
 
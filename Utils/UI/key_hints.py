@@ -127,12 +127,16 @@ class MainWindowHints(KeyHints):
         
         hints_dict = {
             "Enter": "Начать бой",
+            "Пробел": "К итогу",
+            "+/-": "Скорость",
             "I": "Инвентарь", 
             "S": "Умения",
             "R": "Магазин",
             "F12": "Статистика",
             "H": "Помощь",
             "C": "Очистить лог",
+            "PgUp/PgDn": "Лог",
+            "/": "Поиск",
             "Q": "Выход"
         }
         
@@ -150,6 +154,12 @@ class InventoryHints(KeyHints):
         return [
             ("← →", self.hint_color),
             ("Переключение героев", self.hint_color),
+            ("↑↓ PgUp/PgDn", self.hint_color),
+            ("Прокрутка", self.hint_color),
+            ("S", self.hint_color),
+            ("Сортировка", self.hint_color),
+            ("F", self.hint_color),
+            ("Фильтр", self.hint_color),
             ("Q", self.hint_color),
             ("Назад", self.hint_color)
         ]
@@ -0,0 +1,325 @@
+# Utils/UI/log_pad.py - Лог боя в curses pad с прокруткой и поиском
+
+import curses
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from Battle.battle_logger import battle_logger
+from Config.curses_config import get_color_pair, COLOR_WHITE
+from Config.game_config import LOG_SCROLLBACK_LINES
+
+# Pad вдвое выше истории: новые строки только дописываются,
+# и лишь раз в LOG_SCROLLBACK_LINES строк pad собирается заново
+PAD_HEIGHT_FACTOR = 2
+MIN_PAD_WIDTH = 10
+MATCH_MARKER = "▶"
+
+
+# ==================== Поисковый индекс ====================
+class LogSearchIndex:
+    """
+    Инвертированный индекс лога: термин -> номера строк.
+
+    Терминами считаются цветные фрагменты сообщений - в них игра выводит
+    имена персонажей и названия умений. Числа (урон, лечение) не индексируются.
+    """
+
+    def __init__(self) -> None:
+        self._terms: Dict[str, List[int]] = {}
+
+    @staticmethod
+    def extract_terms(line: Any) -> List[str]:
+        """
+        Выделяет термины из строки лога.
+
+        :param line: Строка лога (str или список (текст, цвет))
+        :return: Термины в нижнем регистре
+        """
+        if not isinstance(line, list):
+            return []
+        terms = []
+        for text, color in line:
+            term = str(text).strip().lower()
+            if color and term and any(char.isalpha() for char in term):
+                terms.append(term)
+        return terms
+
+    def add_line(self, line_number: int, line: Any) -> None:
+        """Добавляет строку в индекс (номера строк должны расти)"""
+        for term in self.extract_terms(line):
+            numbers = self._terms.setdefault(term, [])
+            if not numbers or numbers[-1] != line_number:
+                numbers.append(line_number)
+
+    def find(self, query: str, first_line: int = 0) -> List[int]:
+        """
+        Ищет строки по термину.
+
+        Сначала точное совпадение, иначе - термины, содержащие запрос
+        (перебираются только термины, а не строки лога).
+
+        :param query: Искомое имя персонажа или умения
+        :param first_line: Строки с меньшими номерами уже вытеснены из лога
+        :return: Номера строк по возрастанию
+        """
+        query = query.strip().lower()
+        if not query:
+            return []
+        if query in self._terms:
+            numbers = self._terms[query]
+        else:
+            matched = set()
+            for term, term_numbers in self._terms.items():
+                if query in term:
+                    matched.update(term_numbers)
+            numbers = sorted(matched)
+        return numbers[bisect_left(numbers, first_line):]
+
+    def clear(self) -> None:
+        """Очищает индекс"""
+        self._terms.clear()
+
+    def get_term_count(self) -> int:
+        """Количество терминов в индексе"""
+        return len(self._terms)
+
+
+# ==================== Pad лога ====================
+class LogPad:
+    """
+    Лог боя, отрисованный в curses pad.
+
+    В pad дописываются только новые строки, на экран копируется видимое окно,
+    поэтому стоимость кадра не зависит от длины истории.
+    """
+
+    def __init__(self, capacity: int = LOG_SCROLLBACK_LINES,
+                 pad_factory: Optional[Callable[[int, int], Any]] = None) -> None:
+        """
+        :param capacity: Сколько строк истории доступно для прокрутки
+        :param pad_factory: Функция создания pad (None - curses.newpad)
+        """
+        self.capacity = capacity
+        self._pad_factory = pad_factory
+        self._pad = None
+        self._pad_width = 0
+        self._rows = 0  # Сколько строк записано в pad
+        self._first_line = 0  # Номер строки лога в первой строке pad
+        self._next_line = 0  # Номер следующей строки лога для дописывания
+        self._generation = None
+        self.index = LogSearchIndex()
+
+        self.scroll_offset = 0  # Сколько строк от конца пропущено (0 - следим за новыми)
+        self._view_height = 1
+        self._viewport: Optional[Tuple[int, int, int, int, int, int]] = None
+        self._matches: List[int] = []
+        self._match_position = -1
+        self.highlighted_line: Optional[int] = None
+
+    # ==================== Синхронизация с логгером ====================
+    def sync(self, width: int) -> int:
+        """
+        Дописывает в pad строки, появившиеся в логе с прошлого вызова.
+
+        :param width: Ширина области лога
+        :return: Количество новых строк
+        """
+        width = max(MIN_PAD_WIDTH, width)
+        lines, first_line, generation = battle_logger.get_lines_since(self._next_line)
+        # Лог очищен, сменилась ширина или строки вытеснены раньше, чем мы их прочли
+        if (self._pad is None or generation != self._generation or width != self._pad_width
+                or first_line != self._next_line):
+            return self._rebuild(width)
+        if self._rows + len(lines) > self.capacity * PAD_HEIGHT_FACTOR:
+            return self._rebuild(width)
+        self._append_lines(lines, first_line)
+        if self.scroll_offset:
+            # Прокрученный вид остается на месте, пока приходят новые строки
+            self.scroll_offset = min(self.scroll_offset + len(lines), self._max_offset())
+        return len(lines)
+
+    def _rebuild(self, width: int) -> int:
+        """Пересоздает pad из последних строк лога"""
+        lines, first_line, generation = battle_logger.get_lines_since(0)
+        if len(lines) > self.capacity:
+            first_line += len(lines) - self.capacity
+            lines = lines[-self.capacity:]
+        if self._pad is None or width != self._pad_width:
+            pad_factory = self._pad_factory or curses.newpad
+            self._pad = pad_factory(self.capacity * PAD_HEIGHT_FACTOR, width)
+            self._pad_width = width
+        else:
+            self._pad.erase()
+        if generation != self._generation:
+            self.scroll_offset = 0
+            self._matches = []
+            self._match_position = -1
+            self.highlighted_line = None
+        self._generation = generation
+        self._rows = 0
+        self._first_line = first_line
+        self.index.clear()
+        self._append_lines(lines, first_line)
+        self.scroll_offset = min(self.scroll_offset, self._max_offset())
+        return len(lines)
+
+    def _append_lines(self, lines: List[Any], first_line: int) -> None:
+        for line_number, line in enumerate(lines, first_line):
+            self._draw_line(self._rows, line)
+            self.index.add_line(line_number, line)
+            self._rows += 1
+        self._next_line = first_line + len(lines)
+
+    def _draw_line(self, row: int, line: Any) -> None:
+        """Выводит одну строку лога в pad, обрезая ее по ширине"""
+        pad = self._pad
+        max_x = self._pad_width - 1
+        try:
+            pad.move(row, 0)
+            pad.clrtoeol()
+            if isinstance(line, list):
+                current_x = 0
+                for text, color in line:
+                    if current_x >= max_x:
+                        break
+                    text = text[:max_x - current_x]
+                    if color == 0:
+                        pad.addstr(row, current_x, text)
+                    else:
+                        pad.addstr(row, current_x, text, get_color_pair(color))
+                    current_x += len(text)
+            else:
+                pad.addstr(row, 0, str(line)[:max_x], get_color_pair(COLOR_WHITE))
+        except curses.error:
+            pass  # Широкие символы могут не поместиться в строку
+
+    # ==================== Отрисовка ====================
+    def render(self, screen: Any, top: int, left: int, height: int, width: int) -> None:
+        """
+        Готовит видимое окно лога и отмечает найденную строку на экране.
+        Сам pad выводится в noutrefresh() - после stdscr.noutrefresh().
+
+        :param screen: Основное окно (для маркера найденной строки)
+        :param top: Верхняя строка области лога
+        :param left: Левая колонка области лога
+        :param height: Высота области лога
+        :param width: Ширина области лога
+        """
+        self.sync(width)
+        self._view_height = max(1, height)
+        self.scroll_offset = min(self.scroll_offset, self._max_offset())
+        if self._rows == 0 or height <= 0:
+            self._viewport = None
+            return
+        first_row = self._first_visible_row()
+        visible_rows = min(height, self._rows - first_row)
+        self._viewport = (first_row, 0, top, left, top + visible_rows - 1, left + width - 1)
+
+        if self.highlighted_line is not None and left >= 2:
+            row = self.highlighted_line - self._first_line
+            if first_row <= row < first_row + visible_rows:
+                try:
+                    screen.addstr(top + row - first_row, left - 2, MATCH_MARKER, curses.A_BOLD)
+                except curses.error:
+                    pass
+
+    def noutrefresh(self) -> None:
+        """Копирует видимую часть pad в виртуальный экран (вывод - curses.doupdate())"""
+        if self._viewport is None:
+            return
+        try:
+            # Основное окно затерло область лога - копируем окно pad целиком
+            self._pad.touchwin()
+            self._pad.noutrefresh(*self._viewport)
+        except curses.error:
+            pass
+
+    def _first_visible_row(self) -> int:
+        last_row = self._rows - 1 - self.scroll_offset
+        return max(0, last_row - self._view_height + 1)
+
+    def _max_offset(self) -> int:
+        return max(0, self._rows - self._view_height)
+
+    # ==================== Прокрутка ====================
+    def scroll(self, lines: int) -> None:
+        """
+        Прокручивает лог.
+
+        :param lines: Положительное значение - к старым строкам, отрицательное - к новым
+        """
+        self.scroll_offset = max(0, min(self.scroll_offset + lines, self._max_offset()))
+
+    def page_up(self) -> None:
+        """Страница назад"""
+        self.scroll(self._view_height)
+
+    def page_down(self) -> None:
+        """Страница вперед"""
+        self.scroll(-self._view_height)
+
+    def follow(self) -> None:
+        """Возвращается к концу лога и снимает отметку поиска"""
+        self.scroll_offset = 0
+        self.highlighted_line = None
+
+    def is_following(self) -> bool:
+        """Показывает ли лог новые строки"""
+        return self.scroll_offset == 0
+
+    # ==================== Поиск ====================
+    def search(self, query: str) -> bool:
+        """
+        Переходит к последней строке, где упоминается персонаж или умение.
+
+        :param query: Имя персонажа или название умения
+        :return: True если совпадения найдены
+        """
+        self._matches = self.index.find(query, self._first_line)
+        self._match_position = len(self._matches) - 1
+        return self._jump_to_match()
+
+    def next_match(self) -> bool:
+        """
+        Переходит к предыдущему (более раннему) совпадению, по кругу.
+
+        :return: True если есть совпадения
+        """
+        # Часть совпадений могла быть вытеснена из истории
+        first_valid = bisect_left(self._matches, self._first_line)
+        if first_valid:
+            self._matches = self._matches[first_valid:]
+            self._match_position -= first_valid
+        if not self._matches:
+            return False
+        self._match_position = (self._match_position - 1) % len(self._matches)
+        return self._jump_to_match()
+
+    def _jump_to_match(self) -> bool:
+        if not self._matches:
+            self.highlighted_line = None
+            return False
+        self.highlighted_line = self._matches[self._match_position]
+        row = self.highlighted_line - self._first_line
+        # Найденная строка - посередине видимой области
+        offset = self._rows - 1 - row - self._view_height // 2
+        self.scroll_offset = max(0, min(offset, self._max_offset()))
+        return True
+
+    def get_match_info(self) -> Tuple[int, int]:
+        """
+        :return: (номер текущего совпадения с 1, всего совпадений)
+        """
+        return self._match_position + 1, len(self._matches)
+
+
+# ==================== Глобальный экземпляр ====================
+_log_pad: Optional[LogPad] = None
+
+
+def get_log_pad() -> LogPad:
+    """Возвращает pad лога основного экрана (создается при первом обращении)"""
+    global _log_pad
+    if _log_pad is None:
+        _log_pad = LogPad()
+    return _log_pad
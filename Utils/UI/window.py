@@ -2,7 +2,15 @@
 
 import abc
 import curses
-from typing import Optional
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+# Строка списка: готовый текст или сегменты (текст, атрибуты curses)
+ListRow = Union[str, List[Tuple[str, int]]]
+
+LIST_ROW_CACHE_SIZE = 512  # Сколько отформатированных строк хранит список
+SELECTED_ROW_PREFIX = "> "
+UNSELECTED_ROW_PREFIX = "  "
 
 class AbstractWindow(abc.ABC):
     """Абстрактный класс для управления окном с базовой структурой"""
@@ -76,3 +84,158 @@ class AbstractWindow(abc.ABC):
     def get_separator_style(self):
         """Возвращает стиль разделителей"""
         return curses.A_DIM
+
+
+class VirtualListView:
+    """
+    Виртуализированный список для окон.
+
+    У источника данных запрашиваются только количество строк и видимый срез,
+    отформатированные строки кэшируются по индексу. Стоимость прокрутки
+    не зависит от длины списка.
+    """
+
+    def __init__(self, count_source: Callable[[], int],
+                 slice_source: Callable[[int, int], Sequence[Any]],
+                 formatter: Callable[[Any], ListRow],
+                 selectable: bool = True,
+                 cache_size: int = LIST_ROW_CACHE_SIZE) -> None:
+        """
+        :param count_source: Возвращает количество элементов
+        :param slice_source: Возвращает элементы [start, start + count)
+        :param formatter: Превращает элемент в строку списка
+        :param selectable: Есть ли выделенная строка (иначе список только прокручивается)
+        :param cache_size: Сколько отформатированных строк хранить
+        """
+        self._count_source = count_source
+        self._slice_source = slice_source
+        self._formatter = formatter
+        self.selectable = selectable
+        self._cache_size = cache_size
+        self._row_cache: 'OrderedDict[int, ListRow]' = OrderedDict()
+        self.selected_index = 0
+        self.scroll_offset = 0
+        self.visible_rows = 1
+
+    # ==================== Данные ====================
+    def get_count(self) -> int:
+        """Количество элементов в источнике"""
+        return self._count_source()
+
+    def get_selected_item(self) -> Optional[Any]:
+        """Возвращает выделенный элемент (запрашивается у источника)"""
+        if not self.selectable or self.selected_index >= self.get_count():
+            return None
+        items = self._slice_source(self.selected_index, 1)
+        return items[0] if items else None
+
+    def invalidate(self, reset_position: bool = False) -> None:
+        """
+        Сбрасывает кэш строк (данные или их порядок изменились).
+
+        :param reset_position: Вернуться к началу списка
+        """
+        self._row_cache.clear()
+        if reset_position:
+            self.selected_index = 0
+            self.scroll_offset = 0
+
+    def get_visible_rows(self, height: int) -> List[Tuple[int, ListRow]]:
+        """
+        Возвращает видимые строки, форматируя только отсутствующие в кэше.
+
+        :param height: Количество строк на экране
+        :return: Список пар (индекс, строка)
+        """
+        self.visible_rows = max(1, height)
+        count = self.get_count()
+        self._clamp(count)
+        end = min(count, self.scroll_offset + self.visible_rows)
+        cache = self._row_cache
+        missing = [index for index in range(self.scroll_offset, end) if index not in cache]
+        if missing:
+            # Один запрос к источнику на непрерывный диапазон недостающих строк
+            first = missing[0]
+            for index, item in enumerate(self._slice_source(first, missing[-1] - first + 1), first):
+                if index not in cache:
+                    cache[index] = self._formatter(item)
+        rows = []
+        for index in range(self.scroll_offset, end):
+            row = cache.get(index)
+            if row is None:
+                continue
+            cache.move_to_end(index)
+            rows.append((index, row))
+        while len(cache) > self._cache_size:
+            cache.popitem(last=False)
+        return rows
+
+    # ==================== Навигация ====================
+    def handle_key(self, key: int) -> bool:
+        """
+        Обрабатывает клавиши навигации (стрелки, PgUp/PgDn, Home/End).
+
+        :return: True если клавиша обработана
+        """
+        if key == curses.KEY_UP:
+            self.move(-1)
+        elif key == curses.KEY_DOWN:
+            self.move(1)
+        elif key == curses.KEY_PPAGE:
+            self.move(-self.visible_rows)
+        elif key == curses.KEY_NPAGE:
+            self.move(self.visible_rows)
+        elif key == curses.KEY_HOME:
+            self.move(-self.get_count())
+        elif key == curses.KEY_END:
+            self.move(self.get_count())
+        else:
+            return False
+        return True
+
+    def move(self, delta: int) -> None:
+        """Сдвигает выделение (или прокрутку, если список без выделения)"""
+        if self.selectable:
+            self.selected_index += delta
+        else:
+            self.scroll_offset += delta
+        self._clamp(self.get_count())
+
+    def _clamp(self, count: int) -> None:
+        max_offset = max(0, count - self.visible_rows)
+        if self.selectable:
+            self.selected_index = max(0, min(self.selected_index, count - 1))
+            # Прокрутка следует за выделенной строкой
+            if self.selected_index < self.scroll_offset:
+                self.scroll_offset = self.selected_index
+            elif self.selected_index >= self.scroll_offset + self.visible_rows:
+                self.scroll_offset = self.selected_index - self.visible_rows + 1
+        self.scroll_offset = max(0, min(self.scroll_offset, max_offset))
+
+    # ==================== Отрисовка ====================
+    def display(self, stdscr, start_y: int, start_x: int, height: int, width: int) -> int:
+        """
+        Отрисовывает видимую часть списка.
+
+        :return: Количество отрисованных строк
+        """
+        rows = self.get_visible_rows(height)
+        max_x = start_x + width
+        for line, (index, row) in enumerate(rows):
+            y = start_y + line
+            selected = self.selectable and index == self.selected_index
+            extra_attributes = curses.A_BOLD | curses.A_REVERSE if selected else 0
+            segments = [(row, curses.A_NORMAL)] if isinstance(row, str) else row
+            current_x = start_x
+            if self.selectable:
+                segments = [(SELECTED_ROW_PREFIX if selected else UNSELECTED_ROW_PREFIX, curses.A_NORMAL)] + segments
+            for text, attributes in segments:
+                if current_x >= max_x:
+                    break
+                text = text[:max_x - current_x]
+                try:
+                    stdscr.addstr(y, current_x, text, attributes | extra_attributes)
+                except curses.error:
+                    pass
+                current_x += len(text)
+        return len(rows)
@@ -0,0 +1,124 @@
+# Utils/battle_worker.py
+"""
+Бой в фоновом потоке.
+
+Бой (вместе с паузами между сообщениями) идет в отдельном потоке,
+а сообщения лога складываются в очередь. Основной поток curses
+забирает из очереди все накопившееся за кадр, перерисовывает экран
+один раз и продолжает читать клавиши.
+"""
+
+import queue
+import threading
+from typing import Any, Callable, List, Optional, TYPE_CHECKING
+
+from Battle.battle_logger import battle_logger
+
+if TYPE_CHECKING:
+    from Characters.character import Character
+
+
+# ==================== Очередь событий лога ====================
+class LogEventQueue:
+    """
+    Наблюдатель логгера, складывающий сообщения в потокобезопасную очередь.
+
+    Регистрируется через battle_logger.add_observer(event_queue).
+    """
+
+    def __init__(self) -> None:
+        self._queue: 'queue.SimpleQueue[Any]' = queue.SimpleQueue()
+
+    def __call__(self, message: Any) -> None:
+        """Вызывается логгером (из любого потока)"""
+        self._queue.put(message)
+
+    def drain(self) -> List[Any]:
+        """
+        Забирает все накопившиеся события.
+
+        :return: События в порядке поступления (пустой список, если их нет)
+        """
+        events: List[Any] = []
+        while True:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                return events
+
+
+# ==================== Фоновый бой ====================
+class BattleWorker:
+    """Запускает бой в фоновом потоке и хранит его итог."""
+
+    def __init__(self, battle_runner: Optional[Callable[[List['Character'], List['Character']], str]] = None) -> None:
+        """
+        :param battle_runner: Функция проведения боя (по умолчанию simulate_battle,
+                              загружается при первом бое)
+        """
+        self._battle_runner = battle_runner
+        self._thread: Optional[threading.Thread] = None
+        self.result: Optional[str] = None
+        self.error: Optional[BaseException] = None
+        self._finished: bool = False
+
+    def start(self, players: List['Character'], enemies: List['Character']) -> bool:
+        """
+        Запускает бой, если предыдущий уже закончился.
+
+        :param players: Команда игрока
+        :param enemies: Враги
+        :return: True если бой запущен, False если бой уже идет
+        """
+        if self.is_running():
+            return False
+        self.result = None
+        self.error = None
+        self._finished = False
+        if self._battle_runner is None:
+            from Battle.battle_logic import simulate_battle
+            self._battle_runner = simulate_battle
+        # Пропуск сбрасывается здесь, а не в потоке боя: нажатие пропуска сразу
+        # после запуска не потеряется
+        battle_logger.reset_skip()
+        self._thread = threading.Thread(target=self._run, args=(players, enemies),
+                                        name="battle-worker", daemon=True)
+        self._thread.start()
+        return True
+
+    def _run(self, players: List['Character'], enemies: List['Character']) -> None:
+        try:
+            self.result = self._battle_runner(players, enemies)
+        except Exception as e:
+            self.error = e
+        finally:
+            self._finished = True
+
+    def is_running(self) -> bool:
+        """Идет ли бой"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Ждет окончания боя.
+
+        :param timeout: Максимальное время ожидания (None - без ограничения)
+        :return: True если бой закончился
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return not self.is_running()
+
+    def collect(self) -> bool:
+        """
+        Проверяет, закончился ли бой с прошлого вызова.
+
+        Вызывается из основного потока: итог (result/error) обрабатывается
+        там же, поэтому автосохранение не пересекается с ходом боя.
+
+        :return: True один раз после окончания каждого боя
+        """
+        if self._finished and not self.is_running():
+            self._finished = False
+            return True
+        return False
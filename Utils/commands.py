@@ -1,20 +1,23 @@
 # commands.py - Система команд
 
 import curses
-from Battle.battle_logic import simulate_battle
 from Battle.battle_logger import battle_logger
-from Config.curses_config import BATTLE_DELAY
-from Characters.char_utils import create_enemies
 from Inventory.inventory import get_inventory
-from Utils.UI.Statistics.statistics_window import GlobalStatsWindow
+from Persistence.save_manager import save_game
+from Utils.battle_worker import BattleWorker
 from Utils.display import display_inventory_screen
-from Utils.UI.Skills.skills_window import display_abilities_screen
+from Utils.UI.log_pad import get_log_pad
+
+# Окна, пул врагов и боевая логика импортируются при первом использовании:
+# до первого кадра они не нужны, а их загрузка заметно удлиняет запуск
 
 class CommandHandler:
     def __init__(self, players, enemies, stdscr=None):
         self.players = players
         self.enemies = enemies
         self.stdscr = stdscr
+        self.battle_worker = BattleWorker()
+        self.autosave_enabled = True  # False - не сохранять после боя и при выходе
         self.commands = {
             'go': self.start_battle,
             'start': self.start_battle,
@@ -32,6 +35,7 @@ class CommandHandler:
             'skills': self.open_skills,
             'abilities': self.open_skills,
             'abil': self.open_skills,
+            'save': self.save_game,
             'stat': self.open_statistics  # Тестовая команда
         }
     
@@ -57,6 +61,27 @@ class CommandHandler:
             elif key == ord('c') or key == ord('C'):
                 self.clear_log()
                 return False
+            elif key in (ord('+'), ord('=')):
+                return self.change_speed(1)
+            elif key == ord('-'):
+                return self.change_speed(-1)
+            elif key == ord(' '):
+                return self.skip_battle()
+            elif key == curses.KEY_PPAGE:
+                get_log_pad().page_up()
+                return False
+            elif key == curses.KEY_NPAGE:
+                get_log_pad().page_down()
+                return False
+            elif key == curses.KEY_END:
+                get_log_pad().follow()
+                return False
+            elif key == ord('/'):
+                self.search_log()
+                return False
+            elif key == ord('n') or key == ord('N'):
+                self.next_log_match()
+                return False
             elif key == 27:  # ESC
                 return True  # Выход
             elif key == 3:   # Ctrl+C
@@ -77,28 +102,92 @@ class CommandHandler:
             return False  # Не выходить из игры
     
     def start_battle(self):
-        """Начинает бой"""
+        """Начинает бой в фоновом потоке (экран и клавиши остаются доступны)"""
+        if self.battle_worker.is_running():
+            return False  # Бой уже идет
         try:
-            self.enemies = create_enemies(self.players)
-            result = simulate_battle(self.players, self.enemies)
-            return False  # Не выходить из игры
-            
+            from Battle.battle_metrics import ENEMY_CREATION, get_battle_metrics
+            from Characters.encounter_pool import get_encounter_pool
+
+            # Группа прошлого боя возвращается в пул, новая берется из него
+            pool = get_encounter_pool()
+            pool.release(self.enemies)
+            with get_battle_metrics().measure_pending(ENEMY_CREATION):
+                self.enemies = pool.acquire(self.players)
         except Exception as e:
             battle_logger.log_system_message(f"💥 Ошибка в бою: {str(e)}")
             return False  # Не выходить из игры
+
+        self.battle_worker.start(self.players, self.enemies)
+        return False  # Не выходить из игры
+
+    def is_battle_running(self):
+        """Идет ли бой в фоновом потоке"""
+        return self.battle_worker.is_running()
+
+    def poll_battle(self):
+        """
+        Обрабатывает окончание фонового боя (вызывается из основного цикла).
+        :return: True если бой только что закончился
+        """
+        if not self.battle_worker.collect():
+            return False
+        if self.battle_worker.error is not None:
+            battle_logger.log_system_message(f"💥 Ошибка в бою: {str(self.battle_worker.error)}")
+        else:
+            # Автосохранение после каждого боя
+            self.autosave()
+        return True
+
+    def finish_battle(self):
+        """Досчитывает идущий бой без пауз и обрабатывает его итог"""
+        if self.battle_worker.is_running():
+            battle_logger.skip_to_result()
+            self.battle_worker.wait()
+        self.poll_battle()
+    
+    def autosave(self):
+        """Сохраняет игру, если автосохранение не отключено"""
+        if self.autosave_enabled:
+            self.save_game()
+
+    def save_game(self):
+        """Сохраняет игру (явное сохранение снова включает автосохранение)"""
+        self.autosave_enabled = True
+        try:
+            save_game(self.players)
+        except OSError as e:
+            battle_logger.log_system_message(f"❌ Ошибка сохранения: {str(e)}")
+        return False  # Не выходить из игры
     
     def show_help(self):
         """Показывает помощь"""
-        battle_logger.set_message_delay(0)
-        battle_logger.log_system_message("📖 Доступные команды (нажмите клавишу):")
-        battle_logger.log_system_message("  Enter - начать бой")
-        battle_logger.log_system_message("  I - открыть инвентарь")
-        battle_logger.log_system_message("  S - открыть умения")
-        battle_logger.log_system_message("  H - показать помощь")
-        battle_logger.log_system_message("  C - очистить лог")
-        battle_logger.log_system_message("  T - тестовое окно")
-        battle_logger.log_system_message("  Q - выйти из игры")
-        battle_logger.set_message_delay(BATTLE_DELAY)
+        with battle_logger.no_delay():
+            battle_logger.log_system_message("📖 Доступные команды (нажмите клавишу):")
+            battle_logger.log_system_message("  Enter - начать бой")
+            battle_logger.log_system_message("  Пробел - досчитать бой до итога")
+            battle_logger.log_system_message("  + / - - скорость боя (1×, 2×, 8×, мгновенно)")
+            battle_logger.log_system_message("  I - открыть инвентарь")
+            battle_logger.log_system_message("  S - открыть умения")
+            battle_logger.log_system_message("  H - показать помощь")
+            battle_logger.log_system_message("  C - очистить лог")
+            battle_logger.log_system_message("  PgUp/PgDn - прокрутка лога, End - к концу лога")
+            battle_logger.log_system_message("  / - поиск по имени героя или умения, N - следующее совпадение")
+            battle_logger.log_system_message("  T - тестовое окно")
+            battle_logger.log_system_message("  Q - выйти из игры")
+        return False  # Не выходить из игры
+    
+    def change_speed(self, step):
+        """Меняет скорость боя (действует и на идущий бой)"""
+        speed_name = battle_logger.change_speed(step)
+        with battle_logger.no_delay():
+            battle_logger.log_system_message(f"⏩ Скорость боя: {speed_name}")
+        return False  # Не выходить из игры
+    
+    def skip_battle(self):
+        """Досчитывает идущий бой без пауз"""
+        if self.battle_worker.is_running():
+            battle_logger.skip_to_result()
         return False  # Не выходить из игры
     
     def clear_log(self):
@@ -107,15 +196,72 @@ class CommandHandler:
         battle_logger.log_system_message("🗑️  Лог очищен")
         return False  # Не выходить из игры
     
+    def search_log(self):
+        """Запрашивает имя персонажа или умения и переходит к последнему упоминанию в логе"""
+        if not self.stdscr:
+            return False
+        query = self._prompt("🔍 Поиск в логе: ")
+        if query:
+            log_pad = get_log_pad()
+            if not log_pad.search(query):
+                battle_logger.log_system_message(f"🔍 В логе нет упоминаний: {query}")
+        return False  # Не выходить из игры
+
+    def next_log_match(self):
+        """Переходит к предыдущему совпадению поиска"""
+        get_log_pad().next_match()
+        return False  # Не выходить из игры
+
+    def _prompt(self, label):
+        """
+        Читает строку в нижней строке экрана (Enter - готово, ESC - отмена).
+        :param label: Текст приглашения
+        :return: Введенная строка (пустая при отмене или ошибке)
+        """
+        height, width = self.stdscr.getmaxyx()
+        input_x = 2 + len(label) + 1  # Иконка в приглашении занимает две колонки
+        max_length = max(1, width - input_x - 2)
+        text = ""
+        try:
+            self.stdscr.timeout(-1)  # Основной цикл вернет свой таймаут на следующем кадре
+            curses.curs_set(1)
+            while True:
+                self.stdscr.move(height - 1, 0)
+                self.stdscr.clrtoeol()
+                self.stdscr.addstr(height - 1, 2, label, curses.A_BOLD)
+                self.stdscr.addstr(height - 1, input_x, text)
+                self.stdscr.refresh()
+                key = self.stdscr.get_wch()
+                if key in ('\n', '\r', curses.KEY_ENTER):
+                    return text.strip()
+                if key == '\x1b':
+                    return ""
+                if key in ('\b', '\x7f', curses.KEY_BACKSPACE):
+                    text = text[:-1]
+                elif isinstance(key, str) and key.isprintable() and len(text) < max_length:
+                    text += key
+        except curses.error:
+            return ""
+        finally:
+            try:
+                curses.curs_set(0)
+            except curses.error:
+                pass
+
     def exit_game(self):
         """Выходит из игры"""
+        self.finish_battle()
+        self.autosave()
         battle_logger.log_system_message("👋 До новых встреч!")
         return True  # Выход из игры
     
     def open_inventory(self):
         """Открывает инвентарь"""
-        if self.stdscr:  # Проверяем, что экран доступен
+        if self.is_battle_running():
+            battle_logger.log_system_message("⏳ Инвентарь доступен после окончания боя")
+        elif self.stdscr:  # Проверяем, что экран доступен
             try:
+                self.stdscr.timeout(-1)  # Окно ждет клавишу, а не перерисовывается с частотой кадров
                 display_inventory_screen(self.stdscr, self.players)
                 #inventory = get_inventory()
                 #window = InventoryWindow(self.stdscr, self.players, inventory)
@@ -128,8 +274,13 @@ class CommandHandler:
     
     def open_skills(self):
         """Открывает дерево умений"""
-        if self.stdscr:  # Проверяем, что экран доступен
+        if self.is_battle_running():
+            battle_logger.log_system_message("⏳ Умения доступны после окончания боя")
+        elif self.stdscr:  # Проверяем, что экран доступен
             try:
+                from Utils.UI.Skills.skills_window import display_abilities_screen
+
+                self.stdscr.timeout(-1)  # Окно ждет клавишу, а не перерисовывается с частотой кадров
                 display_abilities_screen(self.stdscr, self.players)
             except Exception as e:
                 battle_logger.log_system_message(f"❌ Ошибка открытия умений: {str(e)}")
@@ -139,8 +290,14 @@ class CommandHandler:
     
     def open_statistics(self):
         """Открывает тестовое окно"""
-        if self.stdscr:  # Проверяем, что экран доступен
+        if self.is_battle_running():
+            # Поток боя дописывает статистику, а окно может запустить загрузку истории
+            battle_logger.log_system_message("⏳ Статистика доступна после окончания боя")
+        elif self.stdscr:  # Проверяем, что экран доступен
             try:
+                from Utils.UI.Statistics.statistics_window import GlobalStatsWindow
+
+                self.stdscr.timeout(-1)  # Окно ждет клавишу, а не перерисовывается с частотой кадров
                 window = GlobalStatsWindow(self.stdscr)
                 window.run()
             except Exception as e:
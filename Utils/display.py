@@ -14,29 +14,36 @@ from Config.curses_config import (
 from Inventory.inventory import get_inventory
 from Utils.UI.draw_character import DrawCharacter
 from Utils.UI.key_hints import INVENTORY_HINTS, MAIN_HINTS
+from Utils.UI.log_pad import get_log_pad
+from Utils.UI.window import VirtualListView
+from Items.base_item import BaseItem
 
-
-def create_screen_observer(stdscr, command_handler):
-    """Создает наблюдателя для автоматического обновления экрана"""
-    def screen_observer(message):
-        update_display(stdscr, command_handler)
-        stdscr.refresh()
-    return screen_observer
+# Фильтры экрана инвентаря по типу предмета (None - все предметы)
+INVENTORY_FILTERS = [None, BaseItem.WEAPON, BaseItem.ARMOR, BaseItem.ACCESSORY, BaseItem.CONSUMABLE]
+INVENTORY_FILTER_NAMES = {
+    BaseItem.WEAPON: "Оружие",
+    BaseItem.ARMOR: "Броня",
+    BaseItem.ACCESSORY: "Аксессуары",
+    BaseItem.CONSUMABLE: "Расходуемые",
+}
 
 
 def update_display(stdscr, command_handler):
-    """Обновляет отображение экрана"""
+    """Обновляет отображение экрана (вывод на терминал - curses.doupdate())"""
     try:
         height, width = stdscr.getmaxyx()
 
-        # Очищаем экран
-        stdscr.clear()
+        # Очищаем буфер окна: erase() не заставляет терминал перерисовываться целиком,
+        # curses отправит только изменившиеся символы
+        stdscr.erase()
         stdscr.bkgd(' ', get_color_pair(COLOR_WHITE))
 
         # === ВЕРХНЯЯ ОБЛАСТЬ ===
         stdscr.addstr(0, width // 2 - 10, "YET ANOTHER AUTOBATTLER", get_color_pair(COLOR_CYAN) | curses.A_BOLD)
         inventory = get_inventory()
         stdscr.addstr(1, 2, f"Золото: {inventory.get_gold()}", get_color_pair(COLOR_GRAY))
+        speed_text = f"Скорость: {battle_logger.get_speed_name()}"
+        stdscr.addstr(1, max(0, width - len(speed_text) - 2), speed_text, get_color_pair(COLOR_GRAY))
         stdscr.addstr(2, 0, "─" * (width - 1), get_color_pair(COLOR_GRAY) | curses.A_DIM)
 
         # === ОБЛАСТЬ ПЕРСОНАЖЕЙ ===
@@ -54,6 +61,10 @@ def update_display(stdscr, command_handler):
     except curses.error:
         pass  # Игнорируем ошибки отрисовки (например, при ресайзе)
 
+    # Pad лога выводится поверх основного окна; на терминал все уходит одним curses.doupdate()
+    stdscr.noutrefresh()
+    get_log_pad().noutrefresh()
+
 
 def display_characters(stdscr, players, enemies, width):
     """Отображает персонажей на экране с помощью DrawCharacter"""
@@ -89,31 +100,14 @@ def display_characters(stdscr, players, enemies, width):
 
 
 def display_log(stdscr, width, height, log_start_y):
-    """Отображает лог боя"""
-    log_height = height - log_start_y - 10  # Увеличиваем отступ для подсказок
-    log_lines = battle_logger.get_lines()
-
-    if log_lines:
-        visible_log_lines = log_lines[-log_height:] if len(log_lines) > log_height else log_lines
-        for i, line in enumerate(visible_log_lines):
-            if log_start_y + 2 + i >= height - 7:  # Учитываем подсказки
-                break
-
-            display_line = line[:width - 4]
-
-            try:
-                if isinstance(display_line, list):
-                    current_x = 2
-                    for text, color_pair in display_line:
-                        if color_pair == 0:
-                            stdscr.addstr(log_start_y + 2 + i, current_x, text)
-                        else:
-                            stdscr.addstr(log_start_y + 2 + i, current_x, text, get_color_pair(color_pair))
-                        current_x += len(text)
-                else:
-                    stdscr.addstr(log_start_y + 2 + i, 2, display_line, get_color_pair(COLOR_WHITE))
-            except curses.error:
-                pass  # Игнорируем выход за границы экрана
+    """Отображает лог боя: видимое окно pad с историей (вывод - в update_display)"""
+    log_top = log_start_y + 2
+    log_height = height - 7 - log_top  # Учитываем подсказки
+    log_pad = get_log_pad()
+    log_pad.render(stdscr, log_top, 2, log_height, width - 4)
+    if not log_pad.is_following():
+        stdscr.addstr(log_start_y + 1, 16, f"(история: -{log_pad.scroll_offset}, End - к концу)",
+                      get_color_pair(COLOR_GRAY))
 
 
 def display_inventory_screen(stdscr, players):
@@ -124,6 +118,12 @@ def display_inventory_screen(stdscr, players):
         return
 
     current_tab = 0
+    sort_order = inventory.SORT_BY_RARITY
+    type_filter = None
+    item_list = VirtualListView(lambda: inventory.get_stack_count(type_filter),
+                                lambda start, count: inventory.get_sorted_items(sort_order, start, count, type_filter),
+                                format_inventory_row,
+                                selectable=False)
 
     while True:
         try:
@@ -166,54 +166,20 @@ def display_inventory_screen(stdscr, players):
             stdscr.addstr(inventory_start_y + 1, 0, "─" * (width - 1),
                          get_color_pair(COLOR_GRAY) | curses.A_DIM)
 
-            # Отображение предметов
-            item_objects = inventory.get_all_items() if hasattr(inventory, 'get_all_items') else {}
-            item_y = inventory_start_y + 3
-            item_index = 0
-
-            for item_object, quantity in item_objects.items():
-                if item_y + item_index >= height - 3:
-                    break
+            # Режим отображения: сортировка и фильтр по типу
+            filter_name = "Все" if type_filter is None else INVENTORY_FILTER_NAMES[type_filter]
+            order_name = "редкость" if sort_order == inventory.SORT_BY_RARITY else "уровень"
+            stack_count = inventory.get_stack_count(type_filter)
+            stdscr.addstr(inventory_start_y, 20,
+                         f"Сортировка: {order_name}  Фильтр: {filter_name}  ({stack_count})",
+                         get_color_pair(COLOR_GRAY))
 
-                try:
-                    template, elements = item_object.get_detailed_display_template()
-                    quantity_text = f" х{quantity}" if quantity > 1 else ""
-
-                    current_x = 4
-                    stdscr.addstr(item_y + item_index, current_x, "◦ ", get_color_pair(COLOR_WHITE))
-                    current_x += 2
-
-                    for text, color in elements:
-                        if current_x < width - 4:
-                            stdscr.addstr(item_y + item_index, current_x, text, get_color_pair(color))
-                            current_x += len(text)
-
-                    if quantity_text and current_x < width - 4:
-                        stdscr.addstr(item_y + item_index, current_x, quantity_text, get_color_pair(COLOR_GRAY))
-                        current_x += len(quantity_text)
-
-                    properties = item_object.get_all_properties()
-                    if properties:
-                        prop_parts = []
-                        for prop_name, prop_value in properties.items():
-                            if prop_value > 0:
-                                readable_name = prop_name.replace('_bonus', '').replace('_', ' ').title()
-                                prop_parts.append(f"{readable_name}: {prop_value}")
-
-                        if prop_parts:
-                            prop_text = " [" + ", ".join(prop_parts) + "]"
-                            if current_x < width - 4 and len(prop_text) <= width - current_x - 4:
-                                stdscr.addstr(item_y + item_index, current_x, prop_text, get_color_pair(COLOR_GRAY))
-
-                    item_index += 1
-                except Exception:
-                    item_name = getattr(item_object, 'name', str(item_object))
-                    stdscr.addstr(item_y + item_index, 4, f"◦ {item_name}: {quantity}",
-                                 get_color_pair(COLOR_WHITE))
-                    item_index += 1
-
-            if item_index == 0:
-                stdscr.addstr(inventory_start_y + 3, 4, "Инвентарь пуст", get_color_pair(COLOR_GRAY))
+            # Отображение предметов: список запрашивает у инвентаря только видимый срез
+            item_y = inventory_start_y + 3
+            if stack_count == 0:
+                stdscr.addstr(item_y, 4, "Инвентарь пуст", get_color_pair(COLOR_GRAY))
+            else:
+                item_list.display(stdscr, item_y, 4, max(1, height - 3 - item_y), width - 8)
 
             # Подсказка по клавишам внизу
             INVENTORY_HINTS.display_hints(stdscr)
@@ -228,6 +194,16 @@ def display_inventory_screen(stdscr, players):
                 current_tab = (current_tab - 1) % len(players)
             elif key == curses.KEY_RIGHT:
                 current_tab = (current_tab + 1) % len(players)
+            elif item_list.handle_key(key):
+                pass  # Прокрутка списка предметов
+            elif key in (ord('s'), ord('S')):
+                sort_order = inventory.SORT_ORDERS[
+                    (inventory.SORT_ORDERS.index(sort_order) + 1) % len(inventory.SORT_ORDERS)]
+                item_list.invalidate(reset_position=True)
+            elif key in (ord('f'), ord('F')):
+                filters = INVENTORY_FILTERS
+                type_filter = filters[(filters.index(type_filter) + 1) % len(filters)]
+                item_list.invalidate(reset_position=True)
             elif key == curses.KEY_RESIZE:
                 continue
             elif key != -1:
@@ -244,6 +220,28 @@ def display_inventory_screen(stdscr, players):
             pass  # Защита от ошибок curses при ресайзе или переполнении
 
 
+def format_inventory_row(item_row):
+    """
+    Строка списка инвентаря: иконка, название, количество и свойства предмета.
+    :param item_row: Пара (предмет, количество)
+    :return: Сегменты (текст, атрибуты curses)
+    """
+    item_object, quantity = item_row
+    try:
+        template, elements = item_object.get_detailed_display_template()
+        segments = [("◦ ", get_color_pair(COLOR_WHITE))]
+        segments.extend((text, get_color_pair(color)) for text, color in elements)
+        if quantity > 1:
+            segments.append((f" х{quantity}", get_color_pair(COLOR_GRAY)))
+        prop_text = item_object.get_properties_text()
+        if prop_text:
+            segments.append((prop_text, get_color_pair(COLOR_GRAY)))
+        return segments
+    except Exception:
+        item_name = getattr(item_object, 'name', str(item_object))
+        return [(f"◦ {item_name}: {quantity}", get_color_pair(COLOR_WHITE))]
+
+
 def display_hero_stats_in_inventory(stdscr, player, y, x, max_width):
     """Отображает характеристики героя в инвентаре (без баров, только текст)"""
     try:
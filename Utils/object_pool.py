@@ -0,0 +1,67 @@
+# Utils/object_pool.py
+"""
+Пулы переиспользуемых объектов.
+
+Результаты действий (AbilityResult, EffectResult, ApplyEffectResult)
+создаются на каждое действие в бою и живут, пока их не обработает
+log_result. Вместо создания нового объекта берется освобожденный
+из пула и сбрасывается в исходное состояние.
+"""
+
+from typing import Any, ClassVar, List, Type, TypeVar
+
+T = TypeVar('T', bound='PooledObject')
+
+# Максимум свободных объектов в пуле одного класса
+POOL_LIMIT = 256
+
+
+class PooledObject:
+    """
+    Базовый класс объекта с пулом экземпляров.
+
+    У каждого подкласса свой пул. Подкласс должен создаваться без
+    аргументов и реализовать reset().
+    """
+
+    _pool: ClassVar[List['PooledObject']] = []
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._pool = []
+
+    @classmethod
+    def acquire(cls: Type[T]) -> T:
+        """Возвращает объект из пула или новый, если пул пуст."""
+        if cls._pool:
+            return cls._pool.pop()
+        return cls()
+
+    def release(self) -> None:
+        """
+        Возвращает объект в пул. После вызова объект нельзя использовать:
+        он будет выдан следующему acquire().
+        """
+        pool = type(self)._pool
+        if len(pool) < POOL_LIMIT:
+            self.reset()
+            pool.append(self)
+
+    def reset(self) -> None:
+        """Сбрасывает объект в исходное состояние."""
+        raise NotImplementedError("Метод reset должен быть реализован в подклассе")
+
+    @classmethod
+    def get_pool_size(cls) -> int:
+        """Количество свободных объектов в пуле класса"""
+        return len(cls._pool)
+
+
+def release_object(obj: Any) -> None:
+    """
+    Возвращает объект в пул, если он поддерживает пул (иначе ничего не делает).
+
+    :param obj: Объект результата
+    """
+    if isinstance(obj, PooledObject):
+        obj.release()
@@ -0,0 +1,334 @@
+# Utils/spectator_server.py
+"""
+Трансляция событий боя для внешних наблюдателей.
+
+Сервер принимает подключения по TCP или Unix-сокету и отправляет каждому
+клиенту события в виде JSON-строк (по одному объекту на строку).
+Регистрируется как наблюдатель логгера: battle_logger.add_observer(server).
+
+У каждого клиента ограниченный буфер: если клиент не успевает читать,
+самые старые события отбрасываются, а клиент получает событие "dropped"
+с их количеством. Вызов логгера никогда не ждет сеть - запись в сокеты
+идет в отдельном потоке через selectors.
+"""
+
+import json
+import os
+import selectors
+import socket
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple, Union
+
+from Config.game_config import SPECTATOR_BUFFER_LINES, SPECTATOR_DEFAULT_ADDRESS
+
+UNIX_ADDRESS_PREFIX = "unix:"
+SELECT_TIMEOUT = 0.5  # Как часто поток проверяет флаг остановки (секунды)
+RECEIVE_SIZE = 4096
+
+
+# ==================== Адрес ====================
+def parse_address(address: str) -> Tuple[int, Union[str, Tuple[str, int]]]:
+    """
+    Разбирает адрес трансляции.
+
+    :param address: "unix:/путь/к/сокету", "хост:порт" или только "порт" (локальный хост)
+    :return: (семейство сокета, адрес для bind)
+    """
+    if address.startswith(UNIX_ADDRESS_PREFIX):
+        if not hasattr(socket, 'AF_UNIX'):
+            raise ValueError("Unix-сокеты не поддерживаются в этой системе")
+        return socket.AF_UNIX, address[len(UNIX_ADDRESS_PREFIX):]
+    host, _, port = address.rpartition(':')
+    try:
+        return socket.AF_INET, (host or "127.0.0.1", int(port))
+    except ValueError:
+        raise ValueError(f"Некорректный адрес трансляции: {address}") from None
+
+
+def encode_log_message(message: Any) -> Dict[str, Any]:
+    """
+    Превращает строку лога в событие.
+
+    :param message: Строка лога (str или список (текст, цвет))
+    :return: Событие {"event": "log", "text": ..., "segments": [[текст, цвет], ...]}
+    """
+    if isinstance(message, list):
+        segments = [[str(text), color] for text, color in message]
+        return {"event": "log", "text": "".join(text for text, _ in segments), "segments": segments}
+    return {"event": "log", "text": str(message), "segments": [[str(message), 0]]}
+
+
+# ==================== Клиент ====================
+class SpectatorClient:
+    """Подключенный наблюдатель: ограниченная очередь строк и недописанный хвост"""
+
+    def __init__(self, sock: Optional[socket.socket], buffer_lines: int = SPECTATOR_BUFFER_LINES) -> None:
+        self.sock = sock
+        self.buffer: Deque[bytes] = deque(maxlen=buffer_lines)
+        self.dropped = 0  # Отброшено событий с последней отправки
+        self.pending = b""  # Часть строки, не принятая сокетом
+
+    def enqueue(self, line: bytes) -> None:
+        """Добавляет строку; при переполнении отбрасывается самая старая"""
+        if len(self.buffer) == self.buffer.maxlen:
+            self.dropped += 1
+        self.buffer.append(line)
+
+    def has_data(self) -> bool:
+        """Есть ли что отправлять"""
+        return bool(self.pending or self.buffer)
+
+    def next_chunk(self) -> bytes:
+        """
+        Возвращает данные для отправки (недописанный хвост или накопленные строки).
+
+        Перед строками после переполнения идет событие "dropped".
+        """
+        if self.pending:
+            return self.pending
+        lines = []
+        if self.dropped:
+            lines.append(_encode_event({"event": "dropped", "count": self.dropped}))
+            self.dropped = 0
+        while self.buffer:
+            lines.append(self.buffer.popleft())
+        self.pending = b"".join(lines)
+        return self.pending
+
+    def consume(self, sent: int) -> None:
+        """Отмечает отправленные байты"""
+        self.pending = self.pending[sent:]
+
+
+def _encode_event(event: Dict[str, Any]) -> bytes:
+    return (json.dumps(event, ensure_ascii=False) + "\n").encode('utf-8')
+
+
+# ==================== Сервер ====================
+class SpectatorServer:
+    """
+    Сервер трансляции событий боя в JSON-строках.
+
+    Пример:
+        server = SpectatorServer("127.0.0.1:8765")
+        server.start()
+        battle_logger.add_observer(server)
+    """
+
+    def __init__(self, address: str = SPECTATOR_DEFAULT_ADDRESS,
+                 buffer_lines: int = SPECTATOR_BUFFER_LINES) -> None:
+        """
+        :param address: Адрес для подключения наблюдателей (см. parse_address)
+        :param buffer_lines: Размер очереди каждого клиента (в событиях)
+        """
+        self.family, self._bind_address = parse_address(address)
+        self.buffer_lines = buffer_lines
+        self.address: Optional[str] = None  # Фактический адрес после start()
+        self._clients: Dict[int, SpectatorClient] = {}
+        self._lock = threading.Lock()
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._listener: Optional[socket.socket] = None
+        self._wake_reader: Optional[socket.socket] = None
+        self._wake_writer: Optional[socket.socket] = None
+        self._wake_pending = False
+        self._sequence = 0
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    # ==================== Запуск и остановка ====================
+    def start(self) -> str:
+        """
+        Открывает сокет и запускает поток отправки.
+
+        :return: Фактический адрес (с портом, выбранным системой, если был указан 0)
+        """
+        if self._running:
+            return self.address
+        listener = socket.socket(self.family, socket.SOCK_STREAM)
+        try:
+            if self.family == socket.AF_UNIX:
+                if os.path.exists(self._bind_address):
+                    os.unlink(self._bind_address)  # Сокет от прошлого запуска
+            else:
+                listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            listener.bind(self._bind_address)
+            listener.listen()
+            listener.setblocking(False)
+        except OSError:
+            listener.close()
+            raise
+
+        if self.family == socket.AF_UNIX:
+            self.address = UNIX_ADDRESS_PREFIX + self._bind_address
+        else:
+            host, port = listener.getsockname()[:2]
+            self.address = f"{host}:{port}"
+
+        self._listener = listener
+        self._wake_reader, self._wake_writer = socket.socketpair()
+        self._wake_reader.setblocking(False)
+        self._wake_writer.setblocking(False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(listener, selectors.EVENT_READ, None)
+        self._selector.register(self._wake_reader, selectors.EVENT_READ, None)
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="spectator-server", daemon=True)
+        self._thread.start()
+        return self.address
+
+    def stop(self) -> None:
+        """Отправляет накопленное, закрывает соединения и сокет"""
+        if not self._running:
+            return
+        self._running = False
+        self._wake()
+        if self._thread is not None:
+            self._thread.join()
+        self._thread = None
+
+    def is_running(self) -> bool:
+        """Работает ли сервер"""
+        return self._running
+
+    def get_client_count(self) -> int:
+        """Количество подключенных наблюдателей"""
+        with self._lock:
+            return len(self._clients)
+
+    # ==================== Публикация ====================
+    def __call__(self, message: Any) -> None:
+        """Наблюдатель логгера: публикует строку лога"""
+        self.publish(encode_log_message(message))
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        """
+        Ставит событие в очереди всех клиентов. Не блокируется.
+
+        :param event: Словарь, сериализуемый в JSON (добавляются поля seq и time)
+        """
+        with self._lock:
+            if not self._clients:
+                return  # Некому отправлять - не тратим время на сериализацию
+            self._sequence += 1
+            line = _encode_event({"seq": self._sequence, "time": round(time.time(), 3), **event})
+            for client in self._clients.values():
+                client.enqueue(line)
+            wake = not self._wake_pending
+            self._wake_pending = True
+        if wake:
+            self._wake()
+
+    def _wake(self) -> None:
+        try:
+            self._wake_writer.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass  # Поток и так проснется: в сокете пробуждения уже есть данные
+
+    # ==================== Поток отправки ====================
+    def _run(self) -> None:
+        try:
+            while self._running:
+                for key, mask in self._selector.select(SELECT_TIMEOUT):
+                    sock = key.fileobj
+                    if sock is self._listener:
+                        self._accept()
+                    elif sock is self._wake_reader:
+                        self._drain_wake()
+                    else:
+                        self._service(sock, mask)
+                self._update_interest()
+            self._flush_all()
+        finally:
+            self._close()
+
+    def _accept(self) -> None:
+        try:
+            sock, _ = self._listener.accept()
+        except (BlockingIOError, OSError):
+            return
+        sock.setblocking(False)
+        with self._lock:
+            self._clients[sock.fileno()] = SpectatorClient(sock, self.buffer_lines)
+        self._selector.register(sock, selectors.EVENT_READ, None)
+
+    def _drain_wake(self) -> None:
+        with self._lock:
+            self._wake_pending = False
+        try:
+            while self._wake_reader.recv(RECEIVE_SIZE):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _service(self, sock: socket.socket, mask: int) -> None:
+        if mask & selectors.EVENT_READ:
+            try:
+                if not sock.recv(RECEIVE_SIZE):
+                    self._drop_client(sock)  # Клиент закрыл соединение
+                    return
+            except BlockingIOError:
+                pass
+            except OSError:
+                self._drop_client(sock)
+                return
+        if mask & selectors.EVENT_WRITE:
+            self._send(sock)
+
+    def _send(self, sock: socket.socket) -> None:
+        with self._lock:
+            client = self._clients.get(sock.fileno())
+            if client is None:
+                return
+            chunk = client.next_chunk()
+        try:
+            sent = sock.send(chunk)
+        except BlockingIOError:
+            return
+        except OSError:
+            self._drop_client(sock)
+            return
+        with self._lock:
+            client.consume(sent)
+
+    def _update_interest(self) -> None:
+        """Подписывается на запись только для клиентов, которым есть что отправить"""
+        with self._lock:
+            clients = list(self._clients.values())
+        for client in clients:
+            events = selectors.EVENT_READ | (selectors.EVENT_WRITE if client.has_data() else 0)
+            try:
+                if self._selector.get_key(client.sock).events != events:
+                    self._selector.modify(client.sock, events)
+            except (KeyError, ValueError):
+                pass
+
+    def _flush_all(self) -> None:
+        """Пытается отправить остатки при остановке (без ожидания медленных клиентов)"""
+        with self._lock:
+            sockets = [client.sock for client in self._clients.values()]
+        for sock in sockets:
+            self._send(sock)
+
+    def _drop_client(self, sock: socket.socket) -> None:
+        with self._lock:
+            self._clients.pop(sock.fileno(), None)
+        try:
+            self._selector.unregister(sock)
+        except (KeyError, ValueError):
+            pass
+        sock.close()
+
+    def _close(self) -> None:
+        with self._lock:
+            sockets = [client.sock for client in self._clients.values()]
+            self._clients.clear()
+        for sock in sockets + [self._listener, self._wake_reader, self._wake_writer]:
+            try:
+                sock.close()
+            except OSError:
+                pass
+        self._selector.close()
+        if self.family == socket.AF_UNIX and os.path.exists(self._bind_address):
+            os.unlink(self._bind_address)
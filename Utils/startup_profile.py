@@ -0,0 +1,124 @@
+# Utils/startup_profile.py
+"""
+Профиль запуска игры (флаг --startup-profile).
+
+Замеряет, сколько занял импорт каждого модуля (собственное время и вместе
+с вложенными импортами), и отмечает этапы запуска: импорт модулей игры,
+загрузку команды (из сохранения или новой) и первый кадр. Отчет выводится
+после выхода из curses, когда терминал уже восстановлен.
+
+Перехватывается только builtins.__import__ по имени модуля. Подмодули,
+загружаемые через "from pkg import submodule", отдельно не замеряются:
+их время засчитывается пакету, а если пакет уже был загружен - не попадает
+в отчет вовсе.
+"""
+
+import builtins
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+REPORT_TOP_MODULES = 15
+
+
+class StartupProfiler:
+    """
+    Замер импортов и этапов запуска.
+
+    Пример:
+        profiler = StartupProfiler(start_time)
+        profiler.install()
+        ...  # импорты и инициализация
+        profiler.mark("первый кадр")
+        profiler.uninstall()
+        print(profiler.format_report())
+    """
+
+    def __init__(self, start_time: Optional[float] = None) -> None:
+        """
+        :param start_time: Момент отсчета (time.perf_counter()); по умолчанию - создание профайлера
+        """
+        self.start_time = time.perf_counter() if start_time is None else start_time
+        self.imports: Dict[str, Tuple[float, float]] = {}  # Модуль -> (собственное, с вложенными), сек
+        self.marks: List[Tuple[str, float]] = []  # (этап, сек от старта)
+        self._stack: List[float] = []  # Время вложенных импортов для каждого уровня
+        self._original_import: Optional[Callable[..., Any]] = None
+
+    # ==================== Импорты ====================
+    def install(self) -> None:
+        """Начинает замер импортов"""
+        if self._original_import is None:
+            self._original_import = builtins.__import__
+            builtins.__import__ = self._timed_import
+
+    def uninstall(self) -> None:
+        """Прекращает замер импортов"""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name: str, globals: Any = None, locals: Any = None,
+                      fromlist: Any = (), level: int = 0) -> Any:
+        original_import = self._original_import
+        module_name = _resolve_name(name, globals, level)
+        if module_name in sys.modules:
+            return original_import(name, globals, locals, fromlist, level)  # Уже загружен - замерять нечего
+
+        self._stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            return original_import(name, globals, locals, fromlist, level)
+        finally:
+            total = time.perf_counter() - started
+            nested = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += total
+            self.imports[module_name] = (total - nested, total)
+
+    # ==================== Этапы ====================
+    def mark(self, label: str) -> None:
+        """Отмечает завершение этапа запуска"""
+        self.marks.append((label, time.perf_counter() - self.start_time))
+
+    # ==================== Отчет ====================
+    def get_package_totals(self) -> Dict[str, float]:
+        """Собственное время импорта, сложенное по пакетам верхнего уровня (сек)"""
+        totals: Dict[str, float] = defaultdict(float)
+        for module_name, (self_time, _) in self.imports.items():
+            totals[module_name.partition('.')[0]] += self_time
+        return dict(totals)
+
+    def format_report(self, top: int = REPORT_TOP_MODULES) -> str:
+        """
+        Текстовый отчет.
+
+        :param top: Сколько самых долгих модулей показать
+        """
+        lines = ["Профиль запуска (мс от старта main.py)"]
+        for label, seconds in self.marks:
+            lines.append(f"  {label:<28}{seconds * 1000:>9.1f}")
+
+        total_imports = sum(self_time for self_time, _ in self.imports.values())
+        lines.append(f"Импорт: {len(self.imports)} модулей, {total_imports * 1000:.1f} мс")
+        lines.append("  По пакетам:")
+        packages = sorted(self.get_package_totals().items(), key=lambda entry: entry[1], reverse=True)
+        for package, seconds in packages[:top]:
+            lines.append(f"    {package:<40}{seconds * 1000:>9.1f}")
+
+        lines.append("  Самые долгие модули (собственное / с вложенными):")
+        modules = sorted(self.imports.items(), key=lambda entry: entry[1][0], reverse=True)
+        for module_name, (self_time, total) in modules[:top]:
+            lines.append(f"    {module_name:<40}{self_time * 1000:>9.1f}{total * 1000:>9.1f}")
+        lines.append("  Подмодули из 'from пакет import модуль' не замеряются отдельно: их время"
+                     " входит в импорт пакета или теряется, если пакет уже загружен")
+        return "\n".join(lines)
+
+
+def _resolve_name(name: str, globals: Any, level: int) -> str:
+    """Полное имя модуля для относительного импорта"""
+    if level == 0 or not globals:
+        return name
+    package = globals.get('__package__') or ''
+    base = package.rsplit('.', level - 1)[0] if level > 1 else package
+    return f"{base}.{name}" if name else base
@@ -1,49 +1,123 @@
 # main.py
+import time
+_START_TIME = time.perf_counter()  # Отсчет для --startup-profile
+
+import argparse
 import curses
-from Battle.battle_logger import battle_logger
-from Utils.commands import CommandHandler
-from Utils.display import update_display, create_screen_observer
-from Config.curses_config import setup_screen
-from Characters.char_utils import create_player_team
-from Inventory.inventory import get_inventory
-
-def main(stdscr):
+from Config.curses_config import UI_FRAME_RATE, setup_screen
+from Config.game_config import SPECTATOR_DEFAULT_ADDRESS
+
+def main(stdscr, spectator_address=None, profiler=None):
+    # Игровые модули импортируются здесь, а не при загрузке main.py:
+    # так их импорт попадает в профиль запуска (--startup-profile)
+    from Battle.battle_logger import battle_logger
+    from Utils.commands import CommandHandler
+    from Utils.battle_worker import LogEventQueue
+    from Utils.display import update_display
+    from Characters.char_utils import create_player_team
+    from Inventory.inventory import get_inventory
+    from Persistence.save_format import SaveFormatError
+    from Persistence.save_manager import load_game, quarantine_save
+    if profiler:
+        profiler.mark("импорт модулей")
+
     # Базовая настройка экрана
     setup_screen(stdscr)
     
-    # Данные для отображения
-    players = create_player_team()
-    enemies = []
+    # Загружаем сохранение, если оно есть
+    players = None
+    load_error = None
+    bad_save_path = None
+    autosave_enabled = True
+    try:
+        players = load_game()
+    except OSError as e:
+        load_error = str(e)
+    except SaveFormatError as e:
+        load_error = str(e)
+        # Поврежденный файл откладывается, иначе автосохранение новой игры его перезапишет
+        try:
+            bad_save_path = quarantine_save()
+        except OSError:
+            autosave_enabled = False
 
-    # Добавление золота
-    inventory = get_inventory()
-    inventory.add_gold(100)
+    if players is None:
+        # Новая игра: стандартная команда и стартовое золото
+        players = create_player_team()
+        inventory = get_inventory()
+        inventory.clear()  # Неудачная загрузка могла успеть заполнить инвентарь
+        inventory.add_gold(100)
+    enemies = []
+    if profiler:
+        profiler.mark("загрузка команды")
 
     # Создаем обработчик команд
     command_handler = CommandHandler(players, enemies, stdscr)
+    command_handler.autosave_enabled = autosave_enabled
+    
+    # Сообщения лога (в том числе из потока боя) копятся в очереди,
+    # экран перерисовывается основным циклом не чаще UI_FRAME_RATE раз в секунду
+    log_events = LogEventQueue()
+    battle_logger.add_observer(log_events)
+    frame_ms = max(1, 1000 // UI_FRAME_RATE)
     
-    # Создаем и регистрируем наблюдателя
-    screen_observer = create_screen_observer(stdscr, command_handler)
-    battle_logger.add_observer(screen_observer)
+    # Трансляция событий боя внешним наблюдателям (--spectator)
+    spectator = None
+    spectator_error = None
+    if spectator_address:
+        from Utils.spectator_server import SpectatorServer
+        try:
+            spectator = SpectatorServer(spectator_address)
+            spectator.start()
+            battle_logger.add_observer(spectator)
+        except (OSError, ValueError) as e:
+            spectator_error = str(e)
+            spectator = None
     
     # Включаем режим получения одиночных нажатий клавиш
-    stdscr.nodelay(False)  # Блокирующий режим
     stdscr.keypad(True)    # Включаем поддержку специальных клавиш
 
-    # Инициализационные сообщения
-    battle_logger.log_system_message("🎮 Добро пожаловать в автобаттлер!")
-    battle_logger.log_system_message("Нажмите 'H' для помощи или 'Enter' для начала боя")
+    # Инициализационные сообщения (без пауз между строками: первый кадр не ждет)
+    with battle_logger.no_delay():
+        battle_logger.log_system_message("🎮 Добро пожаловать в автобаттлер!")
+        battle_logger.log_system_message("Нажмите 'H' для помощи или 'Enter' для начала боя")
+        if load_error:
+            battle_logger.log_system_message(f"❌ Не удалось загрузить сохранение: {load_error}")
+        if bad_save_path:
+            battle_logger.log_system_message(f"📁 Поврежденный файл сохранен как {bad_save_path}")
+        elif not autosave_enabled:
+            battle_logger.log_system_message("⚠️ Автосохранение отключено, чтобы не затереть файл сохранения")
+        if spectator is not None:
+            battle_logger.log_system_message(f"📡 Трансляция боя: {spectator.address}")
+        elif spectator_error:
+            battle_logger.log_system_message(f"❌ Трансляция боя недоступна: {spectator_error}")
     
     try:
         # Основной цикл
+        dirty = True
+        first_frame_pending = True
         while True:
-            # Обновляем экран для отображения
-            update_display(stdscr, command_handler)
-            stdscr.refresh()
+            # Все события, пришедшие с прошлого кадра, - одна перерисовка
+            if log_events.drain():
+                dirty = True
+            if command_handler.poll_battle():
+                dirty = True
+            if dirty:
+                update_display(stdscr, command_handler)
+                curses.doupdate()
+                dirty = False
+                if profiler and first_frame_pending:
+                    first_frame_pending = False
+                    profiler.mark("первый кадр")
+                    profiler.uninstall()  # Дальше импорты относятся к игре, а не к запуску
             
-            # Обработка ввода
+            # Обработка ввода: ждем клавишу не дольше одного кадра
             try:
+                stdscr.timeout(frame_ms)  # Окна могут менять режим ввода - задаем каждый кадр
                 key = stdscr.getch()  # Используем getch() вместо get_wch() для лучшей совместимости
+                if key == -1:
+                    continue
+                dirty = True
                 result = command_handler.process_input(key)
                 if result is True:  # Нужно выйти
                     break
@@ -51,8 +125,40 @@ def main(stdscr):
                 continue
                 
     finally:
-        # Удаляем наблюдателя при выходе
-        battle_logger.remove_observer(screen_observer)
+        # Дожидаемся идущего боя и удаляем наблюдателя при выходе
+        command_handler.finish_battle()
+        battle_logger.remove_observer(log_events)
+        if spectator is not None:
+            battle_logger.remove_observer(spectator)
+            spectator.stop()
 
 if __name__ == "__main__":
-    curses.wrapper(main)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="YET ANOTHER AUTOBATTLER")
+    parser.add_argument('--spectator', nargs='?', const=SPECTATOR_DEFAULT_ADDRESS, default=None,
+                        metavar='ADDRESS',
+                        help=f"Транслировать события боя в JSON-строках (хост:порт или unix:/путь, "
+                             f"по умолчанию {SPECTATOR_DEFAULT_ADDRESS})")
+    parser.add_argument('--startup-profile', action='store_true',
+                        help="После выхода показать время импорта модулей и время до первого кадра")
+    parser.add_argument('--battle-metrics', action='store_true',
+                        help="Замерять время фаз боя и показать сводку после выхода")
+    args = parser.parse_args()
+
+    profiler = None
+    if args.startup_profile:
+        from Utils.startup_profile import StartupProfiler
+        profiler = StartupProfiler(_START_TIME)
+        profiler.install()
+    metrics = None
+    if args.battle_metrics:
+        from Battle.battle_metrics import get_battle_metrics
+        metrics = get_battle_metrics()
+        metrics.enable()
+    try:
+        curses.wrapper(main, args.spectator, profiler)
+    finally:
+        if profiler:
+            profiler.uninstall()
+            print(profiler.format_report())
+        if metrics:
+            print(metrics.format_report())
\ No newline at end of file
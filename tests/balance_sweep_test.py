@@ -0,0 +1,67 @@
+# tests/balance_sweep_test.py
+
+import sys
+import os
+import tempfile
+import unittest
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Characters.base_stats import Stats
+from Characters.player_classes import Warrior
+from Simulation.balance_overrides import BalanceOverrides
+from Simulation.balance_sweep import BalanceSweep, build_grid, parse_param_spec
+from Simulation.result_cache import ResultCache
+
+
+class TestBalanceSweep(unittest.TestCase):
+    """Тесты для перебора констант баланса"""
+
+    def test_parse_range_and_list(self):
+        """Разбор диапазона и списка значений"""
+        self.assertEqual(parse_param_spec("Warrior.BASE_STATS.strength=10:16:3"),
+                         ("Warrior.BASE_STATS.strength", [10, 13, 16]))
+        self.assertEqual(parse_param_spec("Fireball.damage_scale=0.5,1.5"),
+                         ("Fireball.damage_scale", [0.5, 1.5]))
+
+    def test_build_grid(self):
+        """Сетка - декартово произведение значений"""
+        grid = build_grid({'A': [1, 2], 'B': [3]})
+        self.assertEqual(grid, [{'A': 1, 'B': 3}, {'A': 2, 'B': 3}])
+
+    def test_overrides_do_not_touch_class_tables(self):
+        """Переопределения применяются к экземпляру, а не к классу"""
+        overrides = BalanceOverrides({
+            'Warrior.BASE_STATS.strength': 40,
+            'Stats.DEFENSE_MULTIPLIERS.warrior': 2.0,
+        })
+        warrior = Warrior("Тест", level=1)
+        overrides.apply_to_character(warrior)
+
+        self.assertEqual(warrior.stats.strength, 40)
+        self.assertEqual(Warrior.BASE_STATS['strength'], 16)
+        self.assertEqual(Stats.DEFENSE_MULTIPLIERS['warrior'], 0.66)
+
+    def test_unknown_parameter_rejected(self):
+        """Неизвестный параметр вызывает ошибку"""
+        with self.assertRaises(KeyError):
+            BalanceOverrides({'Warrior.UNKNOWN.strength': 1})
+
+    def test_cached_points_are_not_recomputed(self):
+        """Повторный запуск берет готовые точки из кэша"""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = ResultCache(cache_dir, "test")
+            sweep = BalanceSweep([("Warrior", 2)], battles=2, seed=1, workers=1, cache=cache)
+            grid = build_grid({'MAX_ROUNDS': [1]})
+
+            first = sweep.run(grid)
+            second = sweep.run(grid)
+
+            self.assertFalse(first[0].cached)
+            self.assertTrue(second[0].cached)
+            self.assertEqual(first[0].summary, second[0].summary)
+
+
+if __name__ == '__main__':
+    unittest.main()
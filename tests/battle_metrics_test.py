@@ -0,0 +1,97 @@
+# tests/battle_metrics_test.py
+
+import sys
+import os
+import random
+import unittest
+from unittest.mock import patch
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Battle import battle_metrics
+from Battle.battle_logger import battle_logger
+from Battle.battle_logic import simulate_battle
+from Battle.battle_metrics import (
+    ABILITY_EXECUTION, ENEMY_CREATION, LOG_RESULT, PLAYER_DECISIONS, STATISTICS,
+    BattleMetrics, BattleTimingRecord, current_timing, get_battle_metrics
+)
+from Characters.char_utils import create_enemies, create_player_team
+from Simulation.headless import HEADLESS_CONTEXT, suppress_output
+
+
+class FakeClock:
+    """Часы, которые идут только по команде"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestBattleTimingRecord(unittest.TestCase):
+    """Тесты для записи времени фаз"""
+
+    def test_nested_phase_time_is_exclusive(self):
+        """Время вложенной фазы не входит во внешнюю"""
+        clock = FakeClock()
+        record = BattleTimingRecord()
+        with patch.object(battle_metrics.time, 'perf_counter', clock):
+            record.enter(LOG_RESULT)
+            clock.now = 1.0
+            record.enter(STATISTICS)
+            clock.now = 3.0
+            record.leave()
+            clock.now = 3.5
+            record.leave()
+
+        self.assertEqual(record.phases, {LOG_RESULT: 1.5, STATISTICS: 2.0})
+        self.assertEqual(record.calls, {LOG_RESULT: 1, STATISTICS: 1})
+
+
+class TestBattleMetrics(unittest.TestCase):
+    """Тесты для замера фаз боя"""
+
+    def setUp(self):
+        BattleMetrics.reset_instance()
+        self.addCleanup(BattleMetrics.reset_instance)
+        previous_delay = battle_logger.message_delay
+        battle_logger.set_message_delay(0)
+        self.addCleanup(battle_logger.set_message_delay, previous_delay)
+
+    def _run_battle(self):
+        random.seed(3)
+        players = create_player_team()
+        metrics = get_battle_metrics()
+        with metrics.measure_pending(ENEMY_CREATION):
+            enemies = create_enemies(players)
+        with suppress_output():
+            simulate_battle(players, enemies, HEADLESS_CONTEXT)
+
+    def test_disabled_metrics_record_nothing(self):
+        """Выключенный замер не создает записей"""
+        self._run_battle()
+        self.assertIsNone(get_battle_metrics().get_last_record())
+        self.assertIsNone(current_timing())
+
+    def test_battle_phases_are_recorded(self):
+        """Включенный замер дает запись боя с фазами, не превышающими общее время"""
+        metrics = get_battle_metrics()
+        metrics.enable()
+        self._run_battle()
+
+        record = metrics.get_last_record()
+        self.assertIsNotNone(record)
+        self.assertIsNone(current_timing())  # После боя запись отвязана от потока
+        self.assertGreater(record.rounds, 0)
+        for phase in (ENEMY_CREATION, PLAYER_DECISIONS, ABILITY_EXECUTION, LOG_RESULT):
+            self.assertIn(phase, record.phases)
+        self.assertGreaterEqual(record.calls[PLAYER_DECISIONS], record.rounds)
+        inside = sum(seconds for phase, seconds in record.phases.items() if phase != ENEMY_CREATION)
+        self.assertLessEqual(inside, record.total + 1e-9)
+        self.assertIn(PLAYER_DECISIONS, metrics.format_report())
+
+
+if __name__ == '__main__':
+    unittest.main()
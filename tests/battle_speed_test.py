@@ -0,0 +1,88 @@
+# tests/battle_speed_test.py
+
+import sys
+import os
+import threading
+import unittest
+from unittest.mock import patch
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Battle.battle_logger import BattleLogger
+from Config.curses_config import BATTLE_SPEED_LEVELS
+
+
+@patch('Battle.battle_logger.time.sleep')
+class TestBattleSpeed(unittest.TestCase):
+    """Тесты для скорости боя и пропуска пауз"""
+
+    def setUp(self):
+        self.logger = BattleLogger()
+        self.logger.set_message_delay(0.4)
+
+    def _log_round(self, messages=3):
+        with self.logger.battle_pacing():
+            for index in range(messages):
+                self.logger.log(f"сообщение {index}")
+            self.logger.end_round()
+
+    def test_normal_speeds_pause_per_message(self, sleep):
+        """На 1× и 2× пауза после каждого сообщения"""
+        self._log_round()
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [0.4] * 3)
+
+        sleep.reset_mock()
+        self.assertEqual(self.logger.change_speed(1), "2×")
+        self._log_round()
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [0.2] * 3)
+
+    def test_high_speed_pauses_once_per_round(self, sleep):
+        """На 8× раунд выводится целиком, пауза одна"""
+        self.logger.set_speed_level(2)
+        self._log_round(4)
+        sleep.assert_called_once()
+        self.assertAlmostEqual(sleep.call_args.args[0], 0.4 * 4 / 8)
+
+    def test_instant_speed_never_sleeps(self, sleep):
+        """Мгновенная скорость - без пауз"""
+        self.logger.change_speed(len(BATTLE_SPEED_LEVELS))  # Выше максимума - остается последний уровень
+        self.assertIsNone(self.logger.get_speed_multiplier())
+        self._log_round()
+        sleep.assert_not_called()
+
+    def test_skip_and_no_delay(self, sleep):
+        """Пропуск боя и no_delay() отключают паузы"""
+        with self.logger.no_delay():
+            self.logger.log("без паузы")
+        sleep.assert_not_called()
+
+        self.logger.set_speed_level(2)
+        with self.logger.battle_pacing():
+            self.logger.log("накоплено")
+        self.logger.skip_to_result()
+        self._log_round()
+        sleep.assert_not_called()
+
+        self.logger.reset_skip()
+        with self.logger.battle_pacing():
+            self.assertEqual(self.logger.get_message_delay(), 0.05)
+
+    def test_messages_outside_battle_do_not_wait(self, sleep):
+        """Сообщения интерфейса не ждут и не удлиняют паузу раунда"""
+        self.logger.log("вне боя")
+        sleep.assert_not_called()
+
+        self.logger.set_speed_level(2)
+        with self.logger.battle_pacing():
+            self.logger.log("бой")
+            ui_thread = threading.Thread(target=self.logger.log, args=("сообщение интерфейса",))
+            ui_thread.start()
+            ui_thread.join()
+            self.logger.end_round()
+        sleep.assert_called_once()
+        self.assertAlmostEqual(sleep.call_args.args[0], 0.4 / 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
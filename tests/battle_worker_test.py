@@ -0,0 +1,78 @@
+# tests/battle_worker_test.py
+
+import sys
+import os
+import threading
+import unittest
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Battle.battle_logger import battle_logger
+from Utils.battle_worker import BattleWorker, LogEventQueue
+from Utils.commands import CommandHandler
+
+
+class TestBattleWorker(unittest.TestCase):
+    """Тесты для фонового боя и очереди событий лога"""
+
+    def test_events_are_coalesced(self):
+        """Все события с прошлого кадра забираются одним вызовом"""
+        events = LogEventQueue()
+        for index in range(5):
+            events(f"сообщение {index}")
+        self.assertEqual(len(events.drain()), 5)
+        self.assertEqual(events.drain(), [])
+
+    def test_battle_runs_in_background(self):
+        """Бой идет в другом потоке, итог забирается один раз"""
+        release = threading.Event()
+        events = LogEventQueue()
+
+        def runner(players, enemies):
+            events("раунд 1")
+            release.wait(5)
+            return "win"
+
+        worker = BattleWorker(runner)
+        self.assertTrue(worker.start([], []))
+        self.assertTrue(worker.is_running())
+        self.assertFalse(worker.start([], []))  # Второй бой не запускается
+        self.assertFalse(worker.collect())
+
+        release.set()
+        self.assertTrue(worker.wait(5))
+        self.assertTrue(worker.collect())
+        self.assertFalse(worker.collect())
+        self.assertEqual(worker.result, "win")
+        self.assertEqual(events.drain(), ["раунд 1"])
+
+    def test_error_is_kept_for_main_thread(self):
+        """Исключение боя сохраняется для основного потока"""
+        def runner(players, enemies):
+            raise RuntimeError("сбой")
+
+        worker = BattleWorker(runner)
+        worker.start([], [])
+        worker.wait(5)
+        self.assertTrue(worker.collect())
+        self.assertIsInstance(worker.error, RuntimeError)
+
+
+    def test_windows_wait_for_battle_end(self):
+        """Инвентарь, умения и статистика не открываются, пока идет бой"""
+        release = threading.Event()
+        handler = CommandHandler([], [], stdscr=object())
+        handler.battle_worker = BattleWorker(lambda players, enemies: release.wait(5))
+        handler.battle_worker.start([], [])
+        try:
+            for open_window in (handler.open_inventory, handler.open_skills, handler.open_statistics):
+                self.assertFalse(open_window())
+                self.assertIn("после окончания боя", battle_logger.get_lines()[-1])
+        finally:
+            release.set()
+            handler.battle_worker.wait(5)
+
+
+if __name__ == '__main__':
+    unittest.main()
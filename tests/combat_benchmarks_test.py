@@ -0,0 +1,39 @@
+# tests/combat_benchmarks_test.py
+
+import sys
+import os
+import json
+import unittest
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Benchmarks.combat_benchmarks import BENCHMARKS, calibrate, measure, run_benchmarks
+
+
+class TestCombatBenchmarks(unittest.TestCase):
+    """Тесты для микробенчмарков боя"""
+
+    def test_measure_counts_warmup_separately(self):
+        """Прогрев не попадает в статистику, вызовов ровно warmup + repeats повторов"""
+        calls = []
+        result = measure(lambda: calls.append(1), number=3, repeats=4, warmup=2)
+        self.assertEqual(len(calls), 3 * (4 + 2))
+        self.assertEqual(len(result['samples']), 4)
+        self.assertLessEqual(result['min'], result['median'])
+        self.assertLessEqual(result['median'], result['max'])
+
+    def test_calibrate_reaches_min_time(self):
+        """Подбор числа вызовов останавливается на первом достаточно долгом повторе"""
+        self.assertEqual(calibrate(lambda: None, min_time=0.0), 1)
+
+    def test_report_is_json(self):
+        """Отчет сериализуется в JSON и содержит все выбранные замеры"""
+        selected = [benchmark for benchmark in BENCHMARKS if 'armor' in benchmark.name or 'decide' in benchmark.name]
+        report = json.loads(json.dumps(run_benchmarks(selected, repeats=2, warmup=1, number=20)))
+        self.assertEqual(set(report['benchmarks']), {benchmark.name for benchmark in selected})
+        self.assertEqual(report['benchmarks']['behavior.decide_action']['number'], 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
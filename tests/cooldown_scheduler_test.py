@@ -0,0 +1,64 @@
+# tests/cooldown_scheduler_test.py
+
+import sys
+import os
+import unittest
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Characters.Abilities.Attack_abilities.fireball import Fireball
+from Characters.Abilities.cooldown_scheduler import CooldownScheduler
+
+
+class TestCooldownScheduler(unittest.TestCase):
+    """Тесты для планировщика кулдаунов"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.scheduler = CooldownScheduler()
+        self.ability = Fireball()
+        self.ability.cooldown = 3
+        self.ability.attach_cooldown_scheduler(self.scheduler)
+
+    def test_cooldown_counts_down_by_rounds(self):
+        """Кулдаун уменьшается с каждым раундом и извлекается из корзины"""
+        self.ability.current_cooldown = self.ability.cooldown
+        self.assertEqual(self.ability.current_cooldown, 3)
+
+        self.assertEqual(self.scheduler.advance(), [])
+        self.assertEqual(self.ability.current_cooldown, 2)
+        self.assertEqual(self.scheduler.advance(), [])
+        self.assertEqual(self.scheduler.advance(), [self.ability])
+        self.assertEqual(self.ability.current_cooldown, 0)
+        self.assertFalse(self.scheduler.has_pending())
+
+    def test_rescheduled_ability_is_not_popped_early(self):
+        """Устаревшая запись в корзине не делает способность готовой"""
+        self.ability.current_cooldown = 1
+        self.ability.current_cooldown = 0
+        self.ability.current_cooldown = 2
+
+        self.assertEqual(self.scheduler.advance(), [])
+        self.assertEqual(self.ability.current_cooldown, 1)
+        self.assertEqual(self.scheduler.advance(), [self.ability])
+
+    def test_clear_resets_all_cooldowns(self):
+        """Сброс кулдаунов - одна операция очистки"""
+        self.ability.current_cooldown = 5
+        self.scheduler.clear()
+
+        self.assertEqual(self.ability.current_cooldown, 0)
+        self.assertEqual(self.scheduler.advance(), [])
+
+    def test_detached_ability_uses_own_counter(self):
+        """Способность без планировщика ведет собственный счетчик"""
+        ability = Fireball()
+        ability.current_cooldown = 2
+        ability.update_cooldown()
+
+        self.assertEqual(ability.current_cooldown, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
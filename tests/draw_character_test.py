@@ -0,0 +1,77 @@
+# tests/draw_character_test.py
+
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Characters.player_classes import Warrior
+from Characters.Status_effects.poison_effect import PoisonEffect
+from Utils.UI.draw_character import DrawCharacter, clear_row_cache
+
+
+class FakeScreen:
+    """Экран, запоминающий вызовы addstr"""
+
+    def __init__(self):
+        self.calls = []
+
+    def addstr(self, y, x, text, attributes=0):
+        self.calls.append((y, x, text, attributes))
+
+
+@patch('Utils.UI.draw_character.get_color_pair', lambda color: color)
+class TestDrawCharacterCache(unittest.TestCase):
+    """Тесты для кэша строк персонажей"""
+
+    def setUp(self):
+        clear_row_cache()
+        self.warrior = Warrior("Роланд", level=2)
+
+    def _draw(self, x=4):
+        screen = FakeScreen()
+        DrawCharacter.draw_character_row(screen, self.warrior, 5, x)
+        return screen.calls
+
+    def test_state_version_changes(self):
+        """Версия растет при изменении HP, энергии, жизни и эффектов"""
+        version = self.warrior.state_version
+        self.warrior.hp -= 1
+        self.warrior.energy -= 1
+        self.warrior.alive = False
+        self.assertEqual(self.warrior.state_version, version + 3)
+
+        self.warrior.hp = self.warrior.hp  # То же значение - версия не меняется
+        self.assertEqual(self.warrior.state_version, version + 3)
+
+        self.warrior.status_manager.add_effect(PoisonEffect(), self.warrior)
+        self.assertEqual(self.warrior.state_version, version + 4)
+
+    def test_row_is_cached_until_state_changes(self):
+        """Строка собирается заново только после изменения состояния"""
+        with patch.object(DrawCharacter, 'render_character_row',
+                          wraps=DrawCharacter.render_character_row) as render:
+            first = self._draw()
+            second = self._draw()
+            self.assertEqual(render.call_count, 1)
+            self.assertEqual(first, second)
+
+            self.warrior.take_damage(10)
+            self._draw()
+            self.assertEqual(render.call_count, 2)
+
+    def test_cached_row_matches_direct_render(self):
+        """Кэшированная строка совпадает с прямой отрисовкой в любой позиции"""
+        self._draw(x=0)
+        cached = self._draw(x=7)
+        direct = FakeScreen()
+        DrawCharacter.render_character_row(direct, self.warrior, 5, 7)
+        self.assertEqual(cached, [(y, x, text, attributes or 0)
+                                  for y, x, text, attributes in direct.calls])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+# tests/encounter_pool_test.py
+
+import sys
+import os
+import random
+import unittest
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Characters.char_utils import create_player_team
+from Characters.encounter_pool import EncounterPool
+
+
+class TestEncounterPool(unittest.TestCase):
+    """Тесты для пула групп врагов"""
+
+    def setUp(self):
+        random.seed(11)
+        self.players = create_player_team()
+        self.pool = EncounterPool(pool_size=2)
+
+    def test_builds_new_groups_until_pool_is_full(self):
+        """Пока пул не заполнен, выдаются новые группы"""
+        first = self.pool.acquire(self.players)
+        self.pool.release(first)
+        second = self.pool.acquire(self.players)
+        self.assertIsNot(first, second)
+
+        self.pool.release(second)
+        self.assertEqual(self.pool.get_free_count(2), 2)
+        third = self.pool.acquire(self.players)
+        self.assertTrue(third is first or third is second)
+
+    def test_reused_group_is_reset(self):
+        """Группа из пула возвращается в исходное состояние"""
+        self.pool.prefill([2])
+        enemies = self.pool.acquire_group(2)
+        enemy = enemies[0]
+        attack = enemy.ability_manager.get_ability('attack')
+        enemy.ability_manager.cooldown_scheduler.schedule(attack, 3)
+        enemy.take_damage(enemy.hp)
+        enemy.energy = 0
+        self.pool.release(enemies)
+
+        while True:
+            group = self.pool.acquire_group(2)
+            if group is enemies:
+                break
+            self.pool.release(group)
+
+        self.assertTrue(enemy.is_alive())
+        self.assertEqual(enemy.hp, enemy.derived_stats.max_hp)
+        self.assertEqual(enemy.energy, enemy.derived_stats.max_energy)
+        self.assertEqual(attack.current_cooldown, 0)
+
+    def test_worn_out_groups_are_replaced(self):
+        """Отслужившие группы заменяются новыми: набор врагов не ограничен pool_size"""
+        pool = EncounterPool(pool_size=2, max_uses=3)
+        seen = []
+        for _ in range(30):
+            enemies = pool.acquire_group(2)
+            if not any(group is enemies for group in seen):
+                seen.append(enemies)
+            pool.release(enemies)
+
+        self.assertGreater(len(seen), pool.pool_size)
+        self.assertLessEqual(pool.get_free_count(2), pool.pool_size)
+
+    def test_build_hook_runs_once_per_enemy(self):
+        """Обработчик создания вызывается для новых врагов и не повторяется при повторной выдаче"""
+        built = []
+        pool = EncounterPool(pool_size=1, max_uses=2, on_build=built.append)
+        enemies = pool.acquire_group(2)
+        self.assertEqual(built, enemies)
+
+        pool.release(enemies)
+        self.assertIs(pool.acquire_group(2), enemies)
+        self.assertEqual(len(built), len(enemies))
+
+    def test_release_ignores_foreign_groups(self):
+        """Группы, созданные не пулом, не попадают в пул"""
+        self.pool.release([])
+        self.assertEqual(self.pool.get_free_count(2), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
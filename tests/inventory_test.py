@@ -0,0 +1,106 @@
+# tests/inventory_test.py
+
+import gc
+import sys
+import os
+import unittest
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Inventory.inventory import Inventory
+from Items import base_item
+from Items.base_item import BaseItem
+from Items.item_generator import ArmorItem, ConsumableItem, WeaponItem
+
+
+class TestInventory(unittest.TestCase):
+    """Тесты для инвентаря с ключами стеков"""
+
+    def setUp(self):
+        Inventory.reset_instance()
+        self.inventory = Inventory.get_instance()
+
+    def tearDown(self):
+        Inventory.reset_instance()
+
+    def test_identical_items_share_stack(self):
+        """Одинаковые расходники складываются в один стек"""
+        first = ConsumableItem("Зелье", 1, 0, {'heal_amount': 20})
+        second = ConsumableItem("Зелье", 1, 0, {'heal_amount': 20})
+
+        self.assertNotEqual(first.item_id, second.item_id)
+        self.assertEqual(first.stack_key, second.stack_key)
+
+        self.inventory.add_item(first)
+        self.inventory.add_item(second, 2)
+        self.assertEqual(self.inventory.get_item_count(first), 3)
+        self.assertEqual(len(self.inventory.get_all_items()), 1)
+        self.assertEqual(self.inventory.get_total_items_count(), 3)
+
+    def test_different_properties_use_different_stacks(self):
+        """Предметы с разными свойствами не смешиваются"""
+        weak = WeaponItem("Меч", 2, 1, {'strength_bonus': 1})
+        strong = WeaponItem("Меч", 2, 1, {'strength_bonus': 2})
+        self.inventory.add_item(weak)
+        self.inventory.add_item(strong)
+
+        self.assertEqual(self.inventory.get_item_count(weak), 1)
+        self.assertEqual(self.inventory.get_item_count(strong), 1)
+
+    def test_set_property_refreshes_stack_key(self):
+        """Изменение свойства меняет ключ стека"""
+        item = ConsumableItem("Эликсир", 1, 0, {'heal_amount': 20})
+        other = ConsumableItem("Эликсир", 1, 0, {'heal_amount': 20})
+        item.set_property('heal_amount', 30)
+        self.assertNotEqual(item.stack_key, other.stack_key)
+
+    def test_stack_keys_released_with_items(self):
+        """Реестр ключей стека не растет: ключ уходит вместе с последним предметом"""
+        registry = base_item._stack_keys
+        gc.collect()
+        before = len(registry)
+        items = [WeaponItem("Меч", 2, 1, {'strength_bonus': bonus}) for bonus in range(1, 101)]
+        self.assertEqual(len(registry), before + 100)
+
+        del items
+        gc.collect()
+        self.assertEqual(len(registry), before)
+
+    def test_remove_item(self):
+        """Удаление уменьшает стек и убирает пустой"""
+        item = ConsumableItem("Свиток", 1, 0, {'temp_strength': 1})
+        self.inventory.add_item(item, 2)
+
+        self.assertFalse(self.inventory.remove_item(item, 3))
+        self.assertTrue(self.inventory.remove_item(item, 2))
+        self.assertFalse(self.inventory.has_item(item))
+        self.assertEqual(self.inventory.get_total_items_count(), 0)
+        self.assertTrue(self.inventory.is_empty())
+
+    def test_sorted_views_and_indexes(self):
+        """Сортированные срезы и индексы поддерживаются при изменениях"""
+        common = WeaponItem("Кинжал", 5, 0, {'dexterity_bonus': 1})
+        rare = ArmorItem("Шлем", 2, 2, {'constitution_bonus': 1})
+        epic = WeaponItem("Меч", 3, 3, {'strength_bonus': 2})
+        for item in (common, rare, epic):
+            self.inventory.add_item(item)
+
+        by_rarity = [item for item, _ in self.inventory.get_sorted_items(Inventory.SORT_BY_RARITY)]
+        by_level = [item for item, _ in self.inventory.get_sorted_items(Inventory.SORT_BY_LEVEL)]
+        self.assertEqual(by_rarity, [epic, rare, common])
+        self.assertEqual(by_level, [common, epic, rare])
+
+        weapons = self.inventory.get_sorted_items(Inventory.SORT_BY_RARITY, 1, 1, BaseItem.WEAPON)
+        self.assertEqual(weapons, [(common, 1)])
+        self.assertEqual(self.inventory.get_stack_count(BaseItem.WEAPON), 2)
+        self.assertEqual(self.inventory.get_items_by_rarity(2), [(rare, 1)])
+
+        self.inventory.remove_item(epic)
+        self.assertEqual([item for item, _ in self.inventory.get_sorted_items()], [rare, common])
+        self.assertEqual(self.inventory.get_items_by_level(3), [])
+        self.assertEqual(self.inventory.get_items_by_type(BaseItem.WEAPON), [(common, 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
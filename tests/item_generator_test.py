@@ -0,0 +1,65 @@
+# tests/item_generator_test.py
+
+import sys
+import os
+import random
+import unittest
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Items.base_item import BaseItem
+from Items.item_generator import ArmorItem, ItemGenerator, WeaponItem
+
+
+class TestItemGenerator(unittest.TestCase):
+    """Тесты для пакетной генерации предметов"""
+
+    def setUp(self):
+        random.seed(7)
+
+    def test_generate_items_respects_arguments(self):
+        """Партия соблюдает тип, диапазон уровней и веса редкости"""
+        items = ItemGenerator.generate_items(200, (3, 5), item_type=BaseItem.WEAPON,
+                                             rarity_weights=[0, 0, 1, 0, 0])
+
+        self.assertEqual(len(items), 200)
+        self.assertTrue(all(isinstance(item, WeaponItem) for item in items))
+        self.assertTrue(all(3 <= item.level <= 5 for item in items))
+        self.assertTrue(all(item.rarity == BaseItem.RARE for item in items))
+
+    def test_generate_items_with_explicit_levels(self):
+        """Готовые уровни используются как есть"""
+        items = ItemGenerator.generate_items(3, levels=[1, 4, 9])
+        self.assertEqual([item.level for item in items], [1, 4, 9])
+
+        with self.assertRaises(ValueError):
+            ItemGenerator.generate_items(2, levels=[1])
+
+    def test_empty_batch(self):
+        """Пустая партия"""
+        self.assertEqual(ItemGenerator.generate_items(0), [])
+
+    def test_items_share_template(self):
+        """Одинаковые по имени предметы ссылаются на один шаблон"""
+        first = ArmorItem("Шлем", 2, 1, {'constitution_bonus': 2})
+        second = ArmorItem("Шлем", 7, 1, {'dexterity_bonus': 1})
+
+        self.assertIs(first.template, second.template)
+        self.assertFalse(hasattr(first, '__dict__'))
+
+    def test_properties_view(self):
+        """Свойства доступны через прежний API"""
+        item = WeaponItem("Меч", 3, 2, {'strength_bonus': 4, 'crit_chance_bonus': 1})
+
+        self.assertEqual(item.get_property('strength_bonus'), 4)
+        self.assertEqual(item.get_property('missing', 0), 0)
+        self.assertEqual(item.get_all_properties(), {'strength_bonus': 4, 'crit_chance_bonus': 1})
+
+        item.set_property('strength_bonus', 6)
+        self.assertEqual(item.properties['strength_bonus'], 6)
+        self.assertEqual(item.get_rarity_name(), "Редкий")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+# tests/log_pad_test.py
+
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Battle.battle_logger import BattleLogger, battle_logger
+from Utils.UI.log_pad import LogPad, LogSearchIndex
+
+
+class FakePad:
+    """Pad, запоминающий текст строк"""
+
+    def __init__(self, height, width):
+        self.height = height
+        self.width = width
+        self.rows = {}
+        self.row = 0
+
+    def move(self, y, x):
+        self.row = y
+
+    def clrtoeol(self):
+        self.rows[self.row] = ""
+
+    def erase(self):
+        self.rows.clear()
+
+    def addstr(self, y, x, text, attributes=0):
+        self.rows[y] = self.rows.get(y, "") + text
+
+
+def attack_line(attacker, target):
+    return battle_logger.create_log_message("%1 атакует %2 (%3)", [(attacker, 2), (target, 4), ("12", 1)])
+
+
+class TestBattleLoggerScrollback(unittest.TestCase):
+    """Тесты для истории логгера"""
+
+    def test_history_is_bounded_and_numbered(self):
+        """Лог хранит ограниченную историю и отдает только новые строки"""
+        logger = BattleLogger(max_lines=3)
+        logger.set_message_delay(0)
+        for index in range(5):
+            logger.log(f"строка {index}")
+
+        self.assertEqual(logger.get_lines(), ["строка 2", "строка 3", "строка 4"])
+        lines, first_line, _ = logger.get_lines_since(3)
+        self.assertEqual((lines, first_line), (["строка 3", "строка 4"], 3))
+        # Вытесненные строки пропускаются
+        lines, first_line, _ = logger.get_lines_since(0)
+        self.assertEqual(first_line, 2)
+
+        generation = logger.generation
+        logger.clear()
+        self.assertEqual(logger.generation, generation + 1)
+        self.assertEqual(logger.get_lines_since(0), ([], 5, generation + 1))
+
+
+class TestLogSearchIndex(unittest.TestCase):
+    """Тесты для индекса имен в логе"""
+
+    def test_colored_names_are_indexed(self):
+        """Индексируются цветные имена, но не числа и не простые строки"""
+        index = LogSearchIndex()
+        index.add_line(0, attack_line("Роланд", "Гоблин"))
+        index.add_line(1, "ℹ️  Роланд отдыхает")
+        index.add_line(2, attack_line("Гоблин", "Роланд"))
+
+        self.assertEqual(index.find("роланд"), [0, 2])
+        self.assertEqual(index.find("гоб"), [0, 2])  # Подстрока имени
+        self.assertEqual(index.find("12"), [])
+        self.assertEqual(index.find("роланд", first_line=1), [2])
+
+
+@patch('Utils.UI.log_pad.get_color_pair', lambda color: color)
+class TestLogPad(unittest.TestCase):
+    """Тесты для pad лога"""
+
+    def setUp(self):
+        self.previous_delay = battle_logger.message_delay
+        battle_logger.set_message_delay(0)
+        battle_logger.clear()
+        self.pads = []
+        self.log_pad = LogPad(capacity=5, pad_factory=self._make_pad)
+
+    def tearDown(self):
+        battle_logger.set_message_delay(self.previous_delay)
+        battle_logger.clear()
+
+    def _make_pad(self, height, width):
+        pad = FakePad(height, width)
+        self.pads.append(pad)
+        return pad
+
+    def test_only_new_lines_are_appended(self):
+        """В pad дописываются только новые строки"""
+        battle_logger.log("первая")
+        self.assertEqual(self.log_pad.sync(40), 1)
+        battle_logger.log("вторая")
+        self.assertEqual(self.log_pad.sync(40), 1)
+        self.assertEqual(self.log_pad.sync(40), 0)
+        self.assertEqual(len(self.pads), 1)
+        self.assertEqual(self.pads[0].rows, {0: "первая", 1: "вторая"})
+
+    def test_pad_is_rebuilt_with_bounded_history(self):
+        """При переполнении pad собирается заново из последних строк"""
+        for index in range(12):
+            battle_logger.log(f"строка {index}")
+            self.log_pad.sync(40)
+        rows = self.pads[-1].rows
+        self.assertLessEqual(len(rows), 10)
+        self.assertEqual(rows[max(rows)], "строка 11")
+
+    def test_clear_resets_pad(self):
+        """Очистка лога очищает pad"""
+        battle_logger.log("старая")
+        self.log_pad.sync(40)
+        battle_logger.clear()
+        battle_logger.log("новая")
+        self.log_pad.sync(40)
+        self.assertEqual(self.pads[-1].rows, {0: "новая"})
+
+    def test_search_scrolls_to_match(self):
+        """Поиск переходит к последнему упоминанию, N - к предыдущему"""
+        battle_logger.log(attack_line("Роланд", "Гоблин"))
+        battle_logger.log(attack_line("Орк", "Гоблин"))
+        battle_logger.log(attack_line("Роланд", "Орк"))
+        battle_logger.log("конец")
+        self.log_pad.render(None, 0, 0, 1, 40)
+
+        self.assertTrue(self.log_pad.search("Роланд"))
+        self.assertEqual(self.log_pad.highlighted_line - self.log_pad._first_line, 2)
+        self.assertEqual(self.log_pad.scroll_offset, 1)
+        self.assertTrue(self.log_pad.next_match())
+        self.assertEqual(self.log_pad.scroll_offset, 3)
+        self.assertFalse(self.log_pad.search("дракон"))
+
+        self.log_pad.follow()
+        self.assertTrue(self.log_pad.is_following())
+
+
+if __name__ == '__main__':
+    unittest.main()
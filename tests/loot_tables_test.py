@@ -0,0 +1,60 @@
+# tests/loot_tables_test.py
+
+import sys
+import os
+import random
+import unittest
+from collections import Counter
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Items.item_generator import ItemGenerator
+from Items.loot_tables import AliasTable, clear_loot_tables, get_loot_table
+
+
+class TestLootTables(unittest.TestCase):
+    """Тесты для таблиц лута на методе Уолкера"""
+
+    def setUp(self):
+        random.seed(11)
+        clear_loot_tables()
+
+    def tearDown(self):
+        clear_loot_tables()
+
+    def test_alias_table_matches_weights(self):
+        """Частоты выборки соответствуют весам"""
+        table = AliasTable(['a', 'b', 'c'], [0.6, 0.3, 0.1])
+        counts = Counter(table.sample_many(20000))
+
+        self.assertAlmostEqual(counts['a'] / 20000, 0.6, delta=0.02)
+        self.assertAlmostEqual(counts['b'] / 20000, 0.3, delta=0.02)
+        self.assertAlmostEqual(counts['c'] / 20000, 0.1, delta=0.02)
+
+    def test_zero_weight_never_sampled(self):
+        """Исход с нулевым весом не выпадает"""
+        table = AliasTable([1, 2], [0, 1])
+        self.assertEqual(set(table.sample_many(1000)), {2})
+
+    def test_loot_levels_in_range(self):
+        """Уровни предметов из таблицы лежат в диапазоне уровня врагов"""
+        items = get_loot_table(5, (0.6, 0.25, 0.1, 0.04, 0.01)).generate_items(500)
+        self.assertEqual({item.level for item in items}, {3, 4, 5, 6, 7})
+
+    def test_table_rebuilt_on_config_change(self):
+        """Изменение настроек генератора пересобирает таблицы"""
+        weights = (1, 0, 0, 0, 0)
+        table = get_loot_table(3, weights)
+        self.assertIs(get_loot_table(3, weights), table)
+
+        original = ItemGenerator.BASE_STAT_VALUES['strength_bonus']
+        try:
+            ItemGenerator.BASE_STAT_VALUES['strength_bonus'] = 50
+            self.assertIsNot(get_loot_table(3, weights), table)
+        finally:
+            ItemGenerator.BASE_STAT_VALUES['strength_bonus'] = original
+
+
+if __name__ == '__main__':
+    unittest.main()
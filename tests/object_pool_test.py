@@ -0,0 +1,57 @@
+# tests/object_pool_test.py
+
+import sys
+import os
+import unittest
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Characters.Abilities.ability import AbilityResult
+from Characters.Status_effects.effect_result import ApplyEffectResult, EffectResult
+from Utils.object_pool import release_object
+
+
+class TestObjectPool(unittest.TestCase):
+    """Тесты для пулов результатов действий"""
+
+    def test_released_result_is_reused_and_reset(self):
+        """Освобожденный результат выдается снова в исходном состоянии"""
+        result = AbilityResult.acquire()
+        targets = ['цель']
+        result.success = False
+        result.targets = targets
+        result.total_damage = 42
+        result.messages.append('сообщение')
+        result.details['target_info'] = {'dodge': True}
+        result.release()
+
+        reused = AbilityResult.acquire()
+        self.assertIs(reused, result)
+        self.assertTrue(reused.success)
+        self.assertEqual(reused.total_damage, 0)
+        self.assertEqual(reused.messages, [])
+        self.assertEqual(reused.details, {})
+        self.assertEqual(reused.targets, [])
+        # Список целей вызывающего кода не очищается
+        self.assertEqual(targets, ['цель'])
+
+    def test_pools_are_separate_per_class(self):
+        """У каждого класса результатов свой пул"""
+        effect_result = EffectResult.acquire()
+        effect_result.total_damage = 5
+        effect_result.release()
+        self.assertIsInstance(ApplyEffectResult.acquire(), ApplyEffectResult)
+
+        reused = EffectResult.acquire()
+        self.assertIs(reused, effect_result)
+        self.assertFalse(hasattr(reused, 'total_damage'))
+
+    def test_release_object_ignores_plain_objects(self):
+        """release_object пропускает объекты без пула"""
+        release_object({'message': 'словарь'})
+        release_object(None)
+
+
+if __name__ == '__main__':
+    unittest.main()
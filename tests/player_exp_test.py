@@ -0,0 +1,52 @@
+# tests/player_exp_test.py
+
+import sys
+import os
+import unittest
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Characters.player_classes import Player, Rogue, Warrior
+
+
+class TestPlayerExperience(unittest.TestCase):
+    """Тесты для начисления опыта и повышения уровня"""
+
+    def test_bulk_exp_matches_level_up_loop(self):
+        """Итог add_exp совпадает с последовательными level_up"""
+        for amount in (5, 60, 400, 5000):
+            fast = Warrior("Быстрый", level=2)
+            slow = Warrior("Медленный", level=2)
+
+            fast.add_exp(amount, build_messages=False)
+
+            slow.exp += amount
+            while slow.exp >= slow.exp_to_next_level:
+                slow.level_up()
+
+            self.assertEqual((fast.level, fast.exp, fast.exp_to_next_level),
+                             (slow.level, slow.exp, slow.exp_to_next_level))
+            self.assertEqual(fast.stats.strength, slow.stats.strength)
+            self.assertEqual(fast.derived_stats.max_hp, slow.derived_stats.max_hp)
+            self.assertEqual(fast.hp, slow.hp)
+
+    def test_single_summary_message(self):
+        """Несколько уровней за раз дают одно сообщение"""
+        rogue = Rogue("Стайлс", level=1)
+        messages = rogue.add_exp(Player.exp_to_reach_level(4) + 1)
+
+        self.assertEqual(rogue.level, 4)
+        self.assertEqual(rogue.exp, 1)
+        self.assertEqual(len(messages), 1)
+        self.assertIn("4", [text for text, _ in messages[0]])
+
+    def test_no_level_up(self):
+        """Опыта не хватает на уровень"""
+        rogue = Rogue("Стайлс", level=1)
+        self.assertEqual(rogue.add_exp(1), [])
+        self.assertEqual(rogue.level, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+# tests/quiet_mode_test.py
+
+import sys
+import os
+import random
+import unittest
+from dataclasses import replace
+from unittest.mock import patch
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Battle.base_mechanics import GameMechanics
+from Battle.battle_context import BattleContext, messages_enabled, use_battle_context
+from Battle.battle_logger import battle_logger
+from Characters.Abilities.Attack_abilities.fireball import Fireball
+from Characters.monster_classes import Goblin
+from Characters.player_classes import Mage
+from Simulation.headless import HEADLESS_CONTEXT, run_battles
+
+QUIET_CONTEXT = BattleContext(quiet=True)
+
+
+class TestQuietMode(unittest.TestCase):
+    """Тесты тихого режима боя"""
+
+    def _cast_fireball(self, seed):
+        random.seed(seed)
+        mage = Mage("Маг", level=3)
+        goblin = Goblin("Гоблин", level=3)
+        return Fireball().execute(mage, [goblin]), goblin
+
+    def test_messages_enabled_follows_context(self):
+        """Флаг сообщений зависит от текущего контекста"""
+        self.assertTrue(messages_enabled())
+        with use_battle_context(QUIET_CONTEXT):
+            self.assertFalse(messages_enabled())
+        self.assertTrue(messages_enabled())
+
+    def test_quiet_ability_returns_same_numbers_without_messages(self):
+        """В тихом режиме способность дает те же числа, но без сообщений"""
+        loud, loud_target = self._cast_fireball(7)
+        with use_battle_context(QUIET_CONTEXT):
+            quiet, quiet_target = self._cast_fireball(7)
+
+        self.assertTrue(loud.messages)
+        self.assertEqual(quiet.messages, [])
+        self.assertEqual(quiet.total_damage, loud.total_damage)
+        self.assertEqual(quiet_target.hp, loud_target.hp)
+
+    def test_dodge_without_message(self):
+        """Проверка уклонения не формирует сообщение в тихом режиме"""
+        mage = Mage("Маг", level=1)
+        goblin = Goblin("Гоблин", level=1)
+        goblin.stats.dexterity = 1000  # Шанс уклонения упирается в максимум
+        random.seed(0)
+        with use_battle_context(QUIET_CONTEXT):
+            dodges = [GameMechanics.check_dodge_with_message(mage, goblin) for _ in range(50)]
+        self.assertTrue(any(success for success, _ in dodges))
+        self.assertTrue(all(message is None for _, message in dodges))
+
+    def test_headless_results_do_not_depend_on_messages(self):
+        """Симуляции в тихом и обычном режиме дают одинаковый результат"""
+        team = [("Warrior", 3), ("Mage", 3), ("Healer", 3)]
+        quiet = run_battles(team, 10, seed=3)
+        loud = run_battles(team, 10, seed=3, context=replace(HEADLESS_CONTEXT, quiet=False))
+        self.assertTrue(HEADLESS_CONTEXT.quiet)
+        self.assertEqual(quiet, loud)
+
+
+    def test_quiet_battle_logs_nothing(self):
+        """Тихий бой не пишет в лог ни одной строки"""
+        lines_before = battle_logger.total_lines
+        run_battles([("Warrior", 3), ("Mage", 3), ("Healer", 3)], 5, seed=3)
+        self.assertEqual(battle_logger.total_lines, lines_before)
+
+    @patch('Battle.battle_logger.time.sleep')
+    def test_run_battles_never_waits(self, sleep):
+        """Серия боев не ждет пауз логгера, даже если задержка игры не отключена"""
+        self.addCleanup(battle_logger.set_message_delay, battle_logger.message_delay)
+        battle_logger.set_message_delay(0.4)
+        run_battles([("Warrior", 3), ("Mage", 3)], 3, seed=1,
+                    context=replace(HEADLESS_CONTEXT, quiet=False))
+        sleep.assert_not_called()
+        self.assertEqual(battle_logger.message_delay, 0.4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+# tests/render_benchmark_test.py
+
+import sys
+import os
+import unittest
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Battle.battle_logger import battle_logger
+from Benchmarks.fake_screen import FakeScreen
+from Benchmarks.render_benchmark import bench_inventory, bench_main_display, run_scenario
+from Inventory.inventory import Inventory
+
+
+class TestRenderBenchmark(unittest.TestCase):
+    """Тесты для замера отрисовки на заменителе экрана"""
+
+    def setUp(self):
+        self.addCleanup(Inventory.reset_instance)
+        self.addCleanup(battle_logger.clear)
+
+    def test_scripted_keys_then_exit(self):
+        """Клавиши отдаются по сценарию, после него - клавиша выхода"""
+        screen = FakeScreen(keys=['s', 258])
+        self.assertEqual([screen.getch(), screen.getch(), screen.getch()], [ord('s'), 258, ord('q')])
+
+    def test_main_display_frames_are_counted(self):
+        """Каждый кадр основного экрана заканчивается doupdate и считается"""
+        result = run_scenario("main_display", lambda screen: bench_main_display(screen, 5))
+        self.assertEqual(result['frames'], 5)
+        self.assertGreater(result['addstr_per_frame'], 0)
+
+    def test_inventory_runs_until_exit(self):
+        """Окно инвентаря проходит сценарий и закрывается клавишей выхода"""
+        result = run_scenario("inventory", lambda screen: bench_inventory(screen, 4, 50))
+        self.assertGreaterEqual(result['frames'], 4)
+        self.assertGreater(result['addstr_per_frame'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+# tests/save_manager_test.py
+
+import sys
+import os
+import tempfile
+import unittest
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Battle.battle_statistics import BattleStatistics, CombatActionRecord
+from Characters.player_classes import Mage, Warrior
+from Inventory.inventory import Inventory
+from Items.item_generator import ConsumableItem, WeaponItem
+from Persistence.save_format import SaveFormatError
+from Persistence.save_manager import SaveManager
+
+
+def play_fake_battle(statistics, battle_id, players):
+    """Записывает в статистику битву из одного действия"""
+    statistics.start_battle_tracking(battle_id, players, [])
+    statistics.add_combat_action(CombatActionRecord(
+        round_number=1, attacker_name=players[0].name, target_name="Гоблин",
+        ability_name="Attack", damage_dealt=7, damage_blocked=0, is_critical=False,
+        is_dodge=False, heal_amount=0, attacker_hp_before=10, attacker_hp_after=10,
+        target_hp_before=20, target_hp_after=13, energy_cost=0,
+        additional_effects=[], battle_id=battle_id))
+    statistics.end_battle(battle_id, True, 1.0)
+
+
+class TestSaveManager(unittest.TestCase):
+    """Тесты для сохранения и загрузки игры"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "save.sav")
+        Inventory.reset_instance()
+        BattleStatistics._instance = None
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        Inventory.reset_instance()
+        BattleStatistics._instance = None
+
+    def test_round_trip(self):
+        """Команда, инвентарь и статистика восстанавливаются"""
+        warrior = Warrior("Роланд", level=3)
+        warrior.exp = 11
+        warrior.hp -= 5
+        warrior.equipment_slots['weapon'].equip(WeaponItem("Меч", 3, 2, {'strength_bonus': 4}))
+        players = [warrior, Mage("Морган", level=2)]
+
+        inventory = Inventory.get_instance()
+        inventory.add_gold(250)
+        inventory.add_item(ConsumableItem("Зелье", 1, 0, {'heal_amount': 20}), 3)
+
+        statistics = BattleStatistics.get_instance()
+        for index in range(5):
+            play_fake_battle(statistics, f"battle_{index}", players)
+
+        SaveManager(self.path, chunk_battles=2).save(players)
+
+        Inventory.reset_instance()
+        BattleStatistics._instance = None
+        loaded = SaveManager(self.path, chunk_battles=2).load()
+
+        self.assertEqual([type(p) for p in loaded], [Warrior, Mage])
+        self.assertEqual(loaded[0].level, 3)
+        self.assertEqual(loaded[0].exp, 11)
+        self.assertEqual(loaded[0].hp, warrior.hp)
+        self.assertEqual(loaded[0].stats.strength, warrior.stats.strength)
+        self.assertEqual(loaded[0].equipment_slots['weapon'].item.get_property('strength_bonus'), 4)
+
+        inventory = Inventory.get_instance()
+        self.assertEqual(inventory.get_gold(), 250)
+        self.assertEqual(inventory.get_total_items_count(), 3)
+
+        statistics = BattleStatistics.get_instance()
+        self.assertEqual(statistics.game_totals.total_battles, 5)
+        self.assertEqual(statistics.get_history_count(), 5)
+        self.assertEqual([s.battle_id for s in statistics.battle_summaries],
+                         [f"battle_{index}" for index in range(5)])
+        self.assertEqual(len(statistics.get_detailed_records("battle_3")), 1)
+
+    def test_history_loaded_lazily_and_appended(self):
+        """История не распаковывается при загрузке, новые битвы дописываются"""
+        players = [Warrior("Роланд", level=2)]
+        statistics = BattleStatistics.get_instance()
+        for index in range(3):
+            play_fake_battle(statistics, f"old_{index}", players)
+        SaveManager(self.path, chunk_battles=2).save(players)
+
+        BattleStatistics._instance = None
+        manager = SaveManager(self.path, chunk_battles=2)
+        players = manager.load()
+        statistics = BattleStatistics.get_instance()
+        self.assertIsNotNone(statistics._history_loader)
+
+        play_fake_battle(statistics, "new_0", players)
+        manager.save(players)
+        self.assertIsNotNone(statistics._history_loader)
+
+        BattleStatistics._instance = None
+        SaveManager(self.path).load()
+        summaries = BattleStatistics.get_instance().battle_summaries
+        self.assertEqual([s.battle_id for s in summaries], ["old_0", "old_1", "old_2", "new_0"])
+
+    def test_missing_and_corrupted_files(self):
+        """Нет файла - None, поврежденный файл - SaveFormatError"""
+        self.assertIsNone(SaveManager(self.path).load())
+
+        with open(self.path, 'wb') as f:
+            f.write(b"not a save file")
+        with self.assertRaises(SaveFormatError):
+            SaveManager(self.path).load()
+
+    def test_corrupted_file_is_quarantined(self):
+        """Поврежденный файл откладывается и не перезаписывается следующим сохранением"""
+        with open(self.path, 'wb') as f:
+            f.write(b"not a save file")
+        manager = SaveManager(self.path)
+        with self.assertRaises(SaveFormatError):
+            manager.load()
+
+        bad_path = manager.quarantine()
+        self.assertTrue(os.path.basename(bad_path).startswith("save.sav.bad-"))
+        self.assertFalse(os.path.exists(self.path))
+
+        manager.save([Warrior("Роланд")], Inventory.get_instance(), BattleStatistics.get_instance())
+        with open(bad_path, 'rb') as f:
+            self.assertEqual(f.read(), b"not a save file")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+# tests/spectator_server_test.py
+
+import sys
+import os
+import json
+import socket
+import time
+import unittest
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Utils.spectator_server import SpectatorClient, SpectatorServer, encode_log_message, parse_address
+
+
+def wait_until(condition, timeout=5.0):
+    """Ждет выполнения условия (поток сервера работает асинхронно)"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestSpectatorClient(unittest.TestCase):
+    """Тесты для буфера наблюдателя"""
+
+    def test_slow_client_drops_oldest(self):
+        """При переполнении отбрасываются старые события, клиент узнает их количество"""
+        client = SpectatorClient(None, buffer_lines=2)
+        for index in range(5):
+            client.enqueue(f'{{"n": {index}}}\n'.encode())
+
+        lines = client.next_chunk().decode().splitlines()
+        self.assertEqual(json.loads(lines[0]), {"event": "dropped", "count": 3})
+        self.assertEqual(lines[1:], ['{"n": 3}', '{"n": 4}'])
+
+        # Частичная отправка: хвост уходит следующим
+        client.consume(5)
+        self.assertTrue(client.has_data())
+        self.assertEqual(client.next_chunk(), client.pending)
+        client.consume(len(client.pending))
+        self.assertFalse(client.has_data())
+
+
+class TestSpectatorServer(unittest.TestCase):
+    """Тесты для сервера трансляции"""
+
+    def test_parse_address(self):
+        """Поддерживаются TCP и Unix-адреса"""
+        self.assertEqual(parse_address("8765"), (socket.AF_INET, ("127.0.0.1", 8765)))
+        self.assertEqual(parse_address("0.0.0.0:9000"), (socket.AF_INET, ("0.0.0.0", 9000)))
+        if hasattr(socket, 'AF_UNIX'):
+            self.assertEqual(parse_address("unix:/tmp/battle.sock"), (socket.AF_UNIX, "/tmp/battle.sock"))
+        with self.assertRaises(ValueError):
+            parse_address("localhost:порт")
+
+    def test_log_lines_are_streamed_as_json(self):
+        """Строки лога приходят наблюдателю JSON-строками"""
+        server = SpectatorServer("127.0.0.1:0")
+        host, port = server.start().rsplit(':', 1)
+        self.addCleanup(server.stop)
+
+        server("без клиентов")  # Некому отправлять - событие пропускается
+        with socket.create_connection((host, int(port)), timeout=5) as client:
+            self.assertTrue(wait_until(lambda: server.get_client_count() == 1))
+            server("🏁 БОЙ НАЧИНАЕТСЯ!")
+            server([("Роланд", 2), (" атакует ", 0), ("Гоблин", 4)])
+
+            received = b""
+            while received.count(b"\n") < 2:
+                received += client.recv(4096)
+            events = [json.loads(line) for line in received.decode().splitlines()]
+
+        self.assertEqual([event["seq"] for event in events], [1, 2])
+        self.assertEqual(events[0]["text"], "🏁 БОЙ НАЧИНАЕТСЯ!")
+        self.assertEqual(events[1]["text"], "Роланд атакует Гоблин")
+        self.assertEqual(events[1]["segments"][0], ["Роланд", 2])
+        self.assertTrue(wait_until(lambda: server.get_client_count() == 0))
+
+    def test_encode_log_message(self):
+        """Простые строки превращаются в один сегмент"""
+        self.assertEqual(encode_log_message("текст")["segments"], [["текст", 0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
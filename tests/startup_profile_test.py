@@ -0,0 +1,65 @@
+# tests/startup_profile_test.py
+
+import sys
+import os
+import tempfile
+import unittest
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Characters.Abilities.ability_manager import get_ability_loader
+from Utils.startup_profile import StartupProfiler
+
+
+class TestStartupProfiler(unittest.TestCase):
+    """Тесты для профиля запуска"""
+
+    def setUp(self):
+        # Два свежих модуля: внешний импортирует вложенный
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        with open(os.path.join(self.directory.name, 'profile_outer.py'), 'w') as f:
+            f.write("import profile_inner\n")
+        with open(os.path.join(self.directory.name, 'profile_inner.py'), 'w') as f:
+            f.write("VALUE = 1\n")
+        sys.path.insert(0, self.directory.name)
+        self.addCleanup(sys.path.remove, self.directory.name)
+        self.addCleanup(sys.modules.pop, 'profile_outer', None)
+        self.addCleanup(sys.modules.pop, 'profile_inner', None)
+
+    def test_nested_imports_are_split(self):
+        """Собственное время внешнего модуля не включает вложенный импорт"""
+        profiler = StartupProfiler()
+        profiler.install()
+        try:
+            import profile_outer  # noqa: F401
+            import profile_outer  # noqa: F401,F811 - повторный импорт не замеряется
+        finally:
+            profiler.uninstall()
+
+        self.assertEqual(set(profiler.imports), {'profile_outer', 'profile_inner'})
+        outer_self, outer_total = profiler.imports['profile_outer']
+        inner_self, inner_total = profiler.imports['profile_inner']
+        self.assertAlmostEqual(outer_total, outer_self + inner_total, places=6)
+
+        profiler.mark("первый кадр")
+        report = profiler.format_report()
+        self.assertIn("первый кадр", report)
+        self.assertIn("profile_outer", report)
+        self.assertIn("from пакет import модуль", report)  # Оговорка об ограничении замера
+
+class TestLazyAbilityLoader(unittest.TestCase):
+    """Тесты для загрузки способностей по запросу"""
+
+    def test_ability_files_load_on_demand(self):
+        """Список способностей известен без загрузки файлов, класс загружается по запросу"""
+        loader = get_ability_loader()
+        self.assertIn('Fireball', loader.get_available_abilities())
+        self.assertEqual(loader.get_class('Fireball').__name__, 'Fireball')
+        with self.assertRaises(FileNotFoundError):
+            loader.get_class('NoSuchAbility')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# tests/status_manager_test.py
+
+import sys
+import os
+import unittest
+from unittest.mock import Mock
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Characters.Status_effects.burn_effect import BurnEffect
+from Characters.Status_effects.poison_effect import PoisonEffect
+from Characters.Status_effects.status_manager import StatusEffectManager
+from Characters.character import Character
+
+
+class TestStatusEffectManager(unittest.TestCase):
+    """Тесты для менеджера статус-эффектов"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.character = Mock(spec=Character)
+        self.character.name = "Тестовая Цель"
+        self.character.is_player = False
+        self.character.take_damage = Mock()
+        self.manager = StatusEffectManager(self.character)
+
+    def test_same_effect_stacks_under_one_key(self):
+        """Повторное наложение эффекта добавляет стак, а не новый эффект"""
+        self.manager.add_effect(BurnEffect(), self.character)
+        self.manager.add_effect(BurnEffect(), self.character)
+
+        effects = self.manager.get_all_effects()
+        self.assertEqual(len(effects), 1)
+        self.assertEqual(effects[0].stacks, 2)
+        self.assertTrue(self.manager.has_effect("Ожог"))
+
+    def test_effects_expire_by_duration(self):
+        """Эффекты удаляются в раунд истечения длительности"""
+        self.manager.add_effect(BurnEffect(duration=2), self.character)
+        self.manager.add_effect(PoisonEffect(duration=3), self.character)
+
+        self.manager.update_effects()
+        self.assertEqual(len(self.manager.get_all_effects()), 2)
+
+        self.manager.update_effects()
+        self.assertFalse(self.manager.has_effect("Ожог"))
+        self.assertTrue(self.manager.has_effect("Отравление"))
+
+        self.manager.update_effects()
+        self.assertEqual(self.manager.get_all_effects(), [])
+
+    def test_extended_effect_is_rescheduled(self):
+        """Продленный эффект не удаляется по старому сроку"""
+        self.manager.add_effect(BurnEffect(duration=2), self.character)
+        self.manager.update_effects()
+        self.manager.add_effect(BurnEffect(duration=2), self.character)
+
+        self.manager.update_effects()
+        self.assertTrue(self.manager.has_effect("Ожог"))
+
+        self.manager.update_effects()
+        self.assertFalse(self.manager.has_effect("Ожог"))
+
+    def test_remove_effect_by_name(self):
+        """Удаление эффекта по имени"""
+        self.manager.add_effect(PoisonEffect(), self.character)
+
+        self.assertTrue(self.manager.remove_effect("Отравление"))
+        self.assertFalse(self.manager.remove_effect("Отравление"))
+        self.assertEqual(self.manager.get_all_effects(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+# tests/team_optimizer_test.py
+
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Simulation import team_optimizer
+from Simulation.headless import PLAYER_CLASSES
+from Simulation.team_optimizer import TeamOptimizer
+
+
+class TestTeamOptimizer(unittest.TestCase):
+    """Тесты для эволюционного подбора состава команды"""
+
+    def setUp(self):
+        self.optimizer = TeamOptimizer(team_size=3, level_budget=7, max_level=4, max_passive_level=2,
+                                       population_size=4, generations=2, battles=2, seed=5, workers=1)
+
+    def assert_valid(self, genome):
+        """Геном допустим: размер, уровни, бюджет, пассивки и канонический порядок"""
+        optimizer = self.optimizer
+        self.assertEqual(len(genome), optimizer.team_size)
+        self.assertEqual(genome, tuple(sorted(genome)))
+        self.assertLessEqual(sum(level for _, level, _ in genome), optimizer.level_budget)
+        for class_name, level, passive in genome:
+            self.assertIn(class_name, PLAYER_CLASSES)
+            self.assertTrue(optimizer.min_level <= level <= optimizer.max_level)
+            self.assertTrue(0 <= passive <= optimizer.max_passive_level)
+            if class_name not in optimizer._classes_with_passives:
+                self.assertEqual(passive, 0)
+
+    def test_normalize_respects_limits(self):
+        """Уровни и пассивки обрезаются, бюджет соблюдается"""
+        genome = self.optimizer.normalize([("Warrior", 9, 7), ("Mage", 0, -3), ("Tank", 4, 1)])
+        self.assert_valid(genome)
+        self.assertEqual(self.optimizer.normalize(list(genome)), genome)
+
+    def test_crossover_and_mutate_return_normalized_genomes(self):
+        """Скрещивание и мутация всегда дают допустимый геном"""
+        optimizer = self.optimizer
+        optimizer.mutation_rate = 1.0
+        for _ in range(200):
+            child = optimizer.crossover(optimizer.random_genome(), optimizer.random_genome())
+            self.assert_valid(child)
+            mutant = optimizer.mutate(child)
+            self.assert_valid(mutant)
+            self.assertEqual(optimizer.normalize(list(mutant)), mutant)
+
+    def test_evaluate_memoizes_genomes(self):
+        """Повторный геном берется из памяти и не симулируется заново"""
+        genome = self.optimizer.random_genome()
+        with patch.object(team_optimizer, '_evaluate_genome',
+                          wraps=team_optimizer._evaluate_genome) as evaluate_genome:
+            self.assertEqual(self.optimizer.evaluate([genome, genome]), 1)
+            self.assertEqual(self.optimizer.evaluate([genome]), 0)
+        self.assertEqual(evaluate_genome.call_count, 1)
+
+    def test_seeded_run_is_deterministic(self):
+        """Одинаковое зерно дает одинаковый результат"""
+        first = self.optimizer.run()
+        second = TeamOptimizer(team_size=3, level_budget=7, max_level=4, max_passive_level=2,
+                               population_size=4, generations=2, battles=2, seed=5, workers=1).run()
+        self.assertEqual(first.ranking, second.ranking)
+        self.assertEqual([report.best_genome for report in first.history],
+                         [report.best_genome for report in second.history])
+
+
+if __name__ == '__main__':
+    unittest.main()
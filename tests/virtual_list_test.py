@@ -0,0 +1,95 @@
+# tests/virtual_list_test.py
+
+import sys
+import os
+import curses
+import unittest
+
+# Добавляем корневую директорию проекта в путь для корректных импортов
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Utils.UI.window import VirtualListView
+
+
+class CountingSource:
+    """Источник данных, считающий запросы"""
+
+    def __init__(self, size):
+        self.size = size
+        self.requested = []
+        self.formatted = 0
+
+    def count(self):
+        return self.size
+
+    def slice(self, start, count):
+        self.requested.append((start, count))
+        return list(range(start, min(self.size, start + count)))
+
+    def format(self, item):
+        self.formatted += 1
+        return f"строка {item}"
+
+
+class TestVirtualListView(unittest.TestCase):
+    """Тесты для виртуализированного списка"""
+
+    def _make_view(self, size, selectable=True):
+        source = CountingSource(size)
+        view = VirtualListView(source.count, source.slice, source.format, selectable=selectable)
+        return source, view
+
+    def test_only_visible_slice_is_requested(self):
+        """Источник отдает только видимые строки, независимо от размера"""
+        source, view = self._make_view(100_000)
+        rows = view.get_visible_rows(5)
+        self.assertEqual([index for index, _ in rows], [0, 1, 2, 3, 4])
+        self.assertEqual(source.requested, [(0, 5)])
+
+        view.handle_key(curses.KEY_END)
+        rows = view.get_visible_rows(5)
+        self.assertEqual(rows[-1], (99_999, "строка 99999"))
+        self.assertEqual(source.requested[-1], (99_995, 5))
+
+    def test_formatted_rows_are_cached(self):
+        """Повторная отрисовка и прокрутка на строку не форматируют видимое заново"""
+        source, view = self._make_view(50)
+        view.get_visible_rows(5)
+        view.get_visible_rows(5)
+        self.assertEqual(source.formatted, 5)
+
+        for _ in range(5):
+            view.handle_key(curses.KEY_DOWN)  # Выделение доходит до края и сдвигает окно
+        view.get_visible_rows(5)
+        self.assertEqual(source.formatted, 6)
+        self.assertEqual(source.requested[-1], (5, 1))
+
+        view.invalidate()
+        view.get_visible_rows(5)
+        self.assertEqual(source.formatted, 11)
+
+    def test_selection_follows_scroll(self):
+        """Прокрутка следует за выделением и не выходит за границы"""
+        source, view = self._make_view(20)
+        view.get_visible_rows(5)
+        view.handle_key(curses.KEY_NPAGE)
+        view.handle_key(curses.KEY_NPAGE)
+        self.assertEqual(view.selected_index, 10)
+        self.assertEqual(view.scroll_offset, 6)
+        self.assertEqual(view.get_selected_item(), 10)
+
+        view.handle_key(curses.KEY_HOME)
+        self.assertEqual((view.selected_index, view.scroll_offset), (0, 0))
+        self.assertFalse(view.handle_key(ord('x')))
+
+    def test_scroll_only_list(self):
+        """Список без выделения просто прокручивается"""
+        source, view = self._make_view(8, selectable=False)
+        view.get_visible_rows(5)
+        view.handle_key(curses.KEY_NPAGE)
+        self.assertEqual(view.scroll_offset, 3)
+        self.assertIsNone(view.get_selected_item())
+
+
+if __name__ == '__main__':
+    unittest.main()